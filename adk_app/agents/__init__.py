@@ -3,5 +3,6 @@
 from .weather.agent import weather_agent
 from .yield_agent.agent import yield_agent
 from .multi.coordinator import coordinator_agent
+from .multi.router import router_agent
 
-__all__ = ["weather_agent", "yield_agent", "coordinator_agent"]
+__all__ = ["weather_agent", "yield_agent", "coordinator_agent", "router_agent"]
@@ -1,100 +1,18 @@
 """
-Coordinator Agent - Main routing agent for AgriPulse AI.
-Routes queries to specialized agents based on intent.
+Multi-agent entry point for the ADK CLI.
+Exports the pre-routing root agent, which falls back to the coordinator
+defined in coordinator.py.
 """
 
 import sys
 from pathlib import Path
-from google.adk.agents import Agent
-from google.adk.tools.agent_tool import AgentTool
 
 # Add parent directories to path
 base_dir = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(base_dir))
 
-from adk_app.core.settings import get_settings
-from adk_app.agents.weather.agent import weather_agent
-from adk_app.agents.yield_agent.agent import yield_agent
+from adk_app.agents.multi.coordinator import coordinator_agent
+from adk_app.agents.multi.router import router_agent
 
-# Load settings
-settings = get_settings()
-model_config = settings.get_model_config("coordinator")
-
-INSTRUCTION = """
-You are the **Coordinator Agent** for AgriPulse AI, an intelligent agricultural assistant system.
-
-## Your Role
-
-You are the main entry point for all user interactions. Your job is to understand user queries and route them to the appropriate specialized agent.
-
-## Available Specialized Agents
-
-1. **Weather Agent** (`weather_agent`)
-   - Handles: Weather conditions, forecasts, climate information
-   - Use for: Any query about weather, temperature, rain, wind, humidity
-   - Examples: "What's the weather?", "Will it rain?", "Temperature forecast"
-
-2. **Yield Agent** (`yield_agent`)
-   - Handles: Crop yield predictions, agricultural planning, soil analysis
-   - Use for: Yield estimates, crop selection, planting advice, soil questions
-   - Examples: "Expected wheat yield?", "Should I plant corn?", "Soil analysis"
-
-## How to Operate
-
-1. **Analyze the Query**: Understand what the user is asking
-2. **Route to Specialist**: Use the appropriate agent tool
-3. **Present Response**: Deliver the specialist's response professionally
-4. **General Queries**: For greetings or general questions, respond directly
-
-## Response Guidelines
-
-- Be warm and welcoming
-- Clearly indicate when you're consulting a specialist
-- Present specialist responses without modification
-- If unsure which agent to use, ask for clarification
-- For multi-topic queries, handle them sequentially
-
-## Example Interactions
-
-**User**: "Hello!"
-
-**You**: "Hello! Welcome to AgriPulse AI, your intelligent agricultural assistant. 
-
-I can help you with:
-🌤️ **Weather Information** - Current conditions and forecasts
-🌾 **Yield Predictions** - Crop estimates and planning advice
-
-How can I assist you today?"
-
----
-
-**User**: "What's the weather in London and what yield can I expect for wheat?"
-
-**You**: "I'll help you with both questions. Let me start by checking the weather in London, then we'll look at wheat yield predictions.
-
-[Routes to weather_agent first, then yield_agent]"
-
----
-
-**User**: "Will it rain tomorrow?"
-
-**You**: "Let me check the weather forecast for you.
-
-[Routes to weather_agent]"
-"""
-
-# Wrap specialized agents as tools
-weather_tool = AgentTool(agent=weather_agent)
-yield_tool = AgentTool(agent=yield_agent)
-
-# Create coordinator agent
-coordinator_agent = Agent(
-    model=model_config.get("model_id", "gemini-2.0-flash-exp"),
-    name="coordinator_agent",
-    description="Main coordinator for AgriPulse AI - routes queries to specialized agents",
-    instruction=INSTRUCTION,
-    tools=[weather_tool, yield_tool]
-)
-
-# Export as root_agent for ADK CLI compatibility
-root_agent = coordinator_agent
+# Export the pre-routing root (falls back to the coordinator) for ADK CLI compatibility
+root_agent = router_agent
@@ -0,0 +1,142 @@
+"""
+Router Agent - Root agent that pre-routes queries before the coordinator.
+Unambiguous weather or yield queries go straight to the specialist, saving
+the coordinator's model round trips, and fully specified yield forecast
+questions are answered from the database without the model at all. Queries
+about both topics run the specialists concurrently and merge their answers;
+all other queries go to the coordinator.
+"""
+
+import sys
+from pathlib import Path
+from typing import AsyncGenerator, Dict, List
+from google.adk.agents import BaseAgent, ParallelAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.genai import types
+
+# Add parent directories to path
+base_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(base_dir))
+
+from adk_app.core.intent_router import PARALLEL, YIELD, get_intent_router
+from adk_app.core.yield_fast_path import get_yield_fast_path
+from adk_app.core.settings import get_settings
+from adk_app.agents.multi.coordinator import coordinator_agent
+from adk_app.agents.weather.agent import INSTRUCTION as WEATHER_INSTRUCTION, weather_agent
+from adk_app.agents.yield_agent.agent import build_instruction as build_yield_instruction, yield_agent
+
+settings = get_settings()
+
+
+PARALLEL_AGENT_NAME = "multi_topic"
+
+# Separates the merged specialist answers of a multi-topic query
+ANSWER_SEPARATOR = "\n\n---\n\n"
+
+# Appended to the instructions of the specialists that answer in parallel
+BRANCH_INSTRUCTION = """
+
+## Multi-Topic Questions
+
+The user's message may also ask about topics outside your specialty; another
+specialist answers those at the same time. Answer only the part within your
+specialty and don't mention the other parts.
+"""
+
+
+class IntentRoutingAgent(BaseAgent):
+    """
+    Runs the sub-agent picked by the intent router for each turn: a
+    specialist, the parallel multi-topic agent, or the coordinator (always
+    the first sub-agent).
+    """
+
+    routing_enabled: bool = True
+    yield_fast_path_enabled: bool = True
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        target = self.sub_agents[0]
+        if self.routing_enabled and ctx.user_content and ctx.user_content.parts:
+            text = " ".join(part.text for part in ctx.user_content.parts if part.text)
+            decision = get_intent_router().route(text)
+            if decision.route == YIELD and self.yield_fast_path_enabled:
+                answer = await get_yield_fast_path().answer(text)
+                if answer:
+                    yield self._reply(ctx, answer)
+                    return
+            # Specialists are named after the intents they handle
+            if decision.route == PARALLEL:
+                target = self.find_sub_agent(PARALLEL_AGENT_NAME) or target
+            elif decision.route:
+                target = self.find_sub_agent(f"{decision.route}_agent") or target
+
+        if isinstance(target, ParallelAgent):
+            async for event in self._run_parallel(target, ctx):
+                yield event
+        else:
+            async for event in target.run_async(ctx):
+                yield event
+
+    async def _run_parallel(self, agent: ParallelAgent, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        """
+        Run the specialists concurrently and reply with their answers merged
+        in sub-agent order, once the slowest one has finished.
+        """
+        answers: Dict[str, List[str]] = {sub_agent.name: [] for sub_agent in agent.sub_agents}
+        async for event in agent.run_async(ctx):
+            parts = event.content.parts if event.content and event.content.parts else []
+            texts = [part.text for part in parts if part.text]
+            if event.is_final_response() and texts and event.author in answers:
+                answers[event.author].extend(texts)
+                continue
+            yield event
+
+        merged = ANSWER_SEPARATOR.join("".join(texts) for texts in answers.values() if texts)
+        if merged:
+            yield self._reply(ctx, merged)
+
+    def _reply(self, ctx: InvocationContext, text: str) -> Event:
+        """Final text response authored by the router itself."""
+        return Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=text)])
+        )
+
+
+# Routed specialists are copies that can't transfer control themselves, so
+# every turn starts at the router again (the originals stay the coordinator's tools)
+_no_transfer = {"disallow_transfer_to_parent": True, "disallow_transfer_to_peers": True}
+
+router_agent = IntentRoutingAgent(
+    name="agripulse_router",
+    description="Routes AgriPulse AI queries to the weather or yield specialist, or to the coordinator",
+    sub_agents=[
+        coordinator_agent.clone(update=_no_transfer),
+        weather_agent.clone(update=_no_transfer),
+        yield_agent.clone(update=_no_transfer),
+        ParallelAgent(
+            name=PARALLEL_AGENT_NAME,
+            description="Answers multi-topic queries with the weather and yield specialists concurrently",
+            sub_agents=[
+                specialist.clone(update={
+                    **_no_transfer,
+                    "name": f"{specialist.name}_parallel",
+                    "instruction": instruction,
+                })
+                for specialist, instruction in (
+                    (weather_agent, WEATHER_INSTRUCTION + BRANCH_INSTRUCTION),
+                    # After the catalog section when the catalog is listed
+                    (yield_agent, build_yield_instruction(BRANCH_INSTRUCTION)),
+                )
+            ],
+        ),
+    ],
+    routing_enabled=settings.get_runtime_config("routing.intent_router.enabled", True),
+    yield_fast_path_enabled=settings.get_runtime_config("routing.yield_fast_path.enabled", True),
+)
+
+# Export as root_agent for ADK CLI compatibility
+root_agent = router_agent
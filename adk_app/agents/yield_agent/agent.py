@@ -2,12 +2,14 @@
 
 import sys
 from pathlib import Path
+from typing import Union
 from google.adk.agents import Agent
 
 # Add parent directories to path
 base_dir = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(base_dir))
 
+from adk_app.core.catalog_context import CatalogInstruction, catalog_context_enabled, get_catalog_context
 from adk_app.core.settings import get_settings
 from adk_app.tools.toolsets.yield_toolset import YieldToolset
 
@@ -20,13 +22,27 @@ persona_path = Path(__file__).parent / "persona.md"
 with open(persona_path, 'r', encoding='utf-8') as f:
     INSTRUCTION = f.read()
 
+# List the valid varieties, districts and years in the instruction, so
+# forecast parameters don't need discovery tool calls first
+catalog_context = get_catalog_context() if catalog_context_enabled() else None
+
+
+def build_instruction(suffix: str = "") -> Union[str, CatalogInstruction]:
+    """The yield agent's instruction with text appended, listing the catalog when enabled."""
+    if catalog_context is None:
+        return INSTRUCTION + suffix
+    return catalog_context.instruction(INSTRUCTION, suffix)
+
+
 # Create yield prediction agent
 yield_agent = Agent(
     model=model_config.get("model_id", "gemini-2.0-flash-exp"),
     name="yield_agent",
     description="Specialized agent for crop yield prediction and agricultural planning",
-    instruction=INSTRUCTION,
-    tools=YieldToolset.get_tools()
+    instruction=build_instruction(),
+    tools=YieldToolset.get_tools(),
+    # Discovery calls are only counted while the catalog is listed
+    before_tool_callback=catalog_context.before_tool_callback if catalog_context is not None else None
 )
 
 # Export as root_agent for ADK CLI compatibility
@@ -0,0 +1,186 @@
+"""
+Agro-meteorological indices computed from Open-Meteo forecast arrays.
+Every index is vectorized with NumPy over locations and days (or hours), so
+one call covers all requested locations.
+
+Array shapes: daily arrays are (locations, days), hourly arrays are
+(locations, hours) with 24 hours per day in local time.
+"""
+from typing import Any, Dict, List, Sequence, Tuple
+import numpy as np
+
+# FAO-56 solar constant, MJ m-2 min-1
+SOLAR_CONSTANT = 0.0820
+# Converts MJ m-2 day-1 of energy to mm of evaporated water
+MJ_TO_MM = 0.408
+
+HOURLY_VARIABLES = ("temperature_2m", "relative_humidity_2m", "precipitation", "wind_speed_10m", "is_day")
+DAILY_VARIABLES = ("temperature_2m_max", "temperature_2m_min", "precipitation_sum")
+
+
+def growing_degree_days(
+    tmax: np.ndarray,
+    tmin: np.ndarray,
+    base: float = 10.0,
+    cap: float = 30.0
+) -> np.ndarray:
+    """
+    Daily growing degree days: mean of the daily extremes, each clipped to
+    [base, cap], minus base.
+    """
+    tmax = np.clip(tmax, base, cap)
+    tmin = np.clip(tmin, base, cap)
+    return (tmax + tmin) / 2.0 - base
+
+
+def extraterrestrial_radiation(latitude: np.ndarray, day_of_year: np.ndarray) -> np.ndarray:
+    """
+    Daily extraterrestrial radiation Ra in MJ m-2 day-1 (FAO-56 eq. 21).
+
+    Args:
+        latitude: Degrees, shape (locations, 1)
+        day_of_year: Day numbers 1-366, shape (locations, days)
+    """
+    phi = np.radians(latitude)
+    angle = 2.0 * np.pi * day_of_year / 365.0
+    inverse_distance = 1.0 + 0.033 * np.cos(angle)
+    declination = 0.409 * np.sin(angle - 1.39)
+    # Clipped so polar day/night don't produce NaN
+    sunset_angle = np.arccos(np.clip(-np.tan(phi) * np.tan(declination), -1.0, 1.0))
+    return (24.0 * 60.0 / np.pi) * SOLAR_CONSTANT * inverse_distance * (
+        sunset_angle * np.sin(phi) * np.sin(declination)
+        + np.cos(phi) * np.cos(declination) * np.sin(sunset_angle)
+    )
+
+
+def reference_et0(
+    tmax: np.ndarray,
+    tmin: np.ndarray,
+    latitude: np.ndarray,
+    day_of_year: np.ndarray
+) -> np.ndarray:
+    """
+    Daily reference evapotranspiration ET0 in mm (Hargreaves-Samani).
+    Needs only temperature extremes, which every forecast location has.
+    """
+    radiation = extraterrestrial_radiation(latitude, day_of_year)
+    tmean = (tmax + tmin) / 2.0
+    spread = np.sqrt(np.clip(tmax - tmin, 0.0, None))
+    return 0.0023 * MJ_TO_MM * radiation * (tmean + 17.8) * spread
+
+
+def heat_stress_hours(hourly_temperature: np.ndarray, threshold: float = 35.0) -> np.ndarray:
+    """Hours per day at or above threshold, shape (locations, days)."""
+    locations, hours = hourly_temperature.shape
+    days = hours // 24
+    by_day = hourly_temperature[:, :days * 24].reshape(locations, days, 24)
+    return np.count_nonzero(by_day >= threshold, axis=2)
+
+
+def spray_suitable_hours(
+    temperature: np.ndarray,
+    humidity: np.ndarray,
+    wind_speed: np.ndarray,
+    precipitation: np.ndarray,
+    is_day: np.ndarray,
+    min_wind: float = 3.0,
+    max_wind: float = 15.0,
+    max_temperature: float = 30.0,
+    min_humidity: float = 40.0,
+    rain_free_hours: int = 4
+) -> np.ndarray:
+    """
+    Boolean mask of daylight hours suitable for spraying.
+
+    Wind must be strong enough to avoid inversions but below drift speed,
+    it must not be too hot or dry (evaporation), and no rain may fall in the
+    hour itself or the rain_free_hours after it (wash-off).
+    """
+    rain = np.nan_to_num(precipitation) > 0.0
+    # Rain in [hour, hour + rain_free_hours] from a cumulative sum per location
+    cumulative = np.concatenate([np.zeros((rain.shape[0], 1)), np.cumsum(rain, axis=1)], axis=1)
+    hours = rain.shape[1]
+    window_end = np.minimum(np.arange(hours) + rain_free_hours + 1, hours)
+    rain_ahead = cumulative[:, window_end] - cumulative[:, :hours] > 0
+    return (
+        (is_day > 0)
+        & (wind_speed >= min_wind) & (wind_speed <= max_wind)
+        & (temperature <= max_temperature)
+        & (humidity >= min_humidity)
+        & ~rain_ahead
+    )
+
+
+def find_windows(mask: np.ndarray, min_hours: int = 2) -> List[List[Tuple[int, int]]]:
+    """
+    Runs of consecutive True hours per location.
+
+    Returns:
+        For each location, (start, end) hour indices (end exclusive) of runs
+        at least min_hours long
+    """
+    padded = np.pad(mask.astype(np.int8), ((0, 0), (1, 1)))
+    edges = np.diff(padded, axis=1)
+    # argwhere is row-major, so the n-th start and n-th end belong to the same run
+    starts = np.argwhere(edges == 1)
+    ends = np.argwhere(edges == -1)[:, 1]
+    windows: List[List[Tuple[int, int]]] = [[] for _ in range(mask.shape[0])]
+    for (location, start), end in zip(starts, ends):
+        if end - start >= min_hours:
+            windows[location].append((int(start), int(end)))
+    return windows
+
+
+def _stack(forecasts: Sequence[Dict[str, Any]], section: str, variable: str, length: int) -> np.ndarray:
+    """One (locations, length) float array for a variable; missing values are NaN."""
+    return np.array([forecast[section][variable][:length] for forecast in forecasts], dtype=float)
+
+
+def compute_indices(
+    forecasts: Sequence[Dict[str, Any]],
+    base_temperature: float = 10.0,
+    cap_temperature: float = 30.0,
+    heat_stress_threshold: float = 35.0,
+    min_spray_hours: int = 2
+) -> Dict[str, Any]:
+    """
+    Compute all indices for many Open-Meteo forecasts at once.
+
+    Args:
+        forecasts: Payloads requested with the HOURLY_VARIABLES and
+            DAILY_VARIABLES and the same number of forecast days
+
+    Returns:
+        Dictionary of (locations, days) arrays (dates, gdd, et0, rain,
+        cumulative_rain, heat_stress_hours), hourly times and spray windows
+        as hour index ranges per location
+    """
+    days = min(len(forecast["daily"]["time"]) for forecast in forecasts)
+    hours = days * 24
+
+    tmax = _stack(forecasts, "daily", "temperature_2m_max", days)
+    tmin = _stack(forecasts, "daily", "temperature_2m_min", days)
+    rain = np.nan_to_num(_stack(forecasts, "daily", "precipitation_sum", days))
+    latitude = np.array([[forecast["latitude"]] for forecast in forecasts], dtype=float)
+    dates = np.array([forecast["daily"]["time"][:days] for forecast in forecasts], dtype="datetime64[D]")
+    day_of_year = (dates - dates.astype("datetime64[Y]")).astype(int) + 1
+
+    temperature = _stack(forecasts, "hourly", "temperature_2m", hours)
+    spray = spray_suitable_hours(
+        temperature,
+        _stack(forecasts, "hourly", "relative_humidity_2m", hours),
+        _stack(forecasts, "hourly", "wind_speed_10m", hours),
+        _stack(forecasts, "hourly", "precipitation", hours),
+        _stack(forecasts, "hourly", "is_day", hours),
+    )
+
+    return {
+        "dates": [forecast["daily"]["time"][:days] for forecast in forecasts],
+        "hourly_times": [forecast["hourly"]["time"][:hours] for forecast in forecasts],
+        "gdd": growing_degree_days(tmax, tmin, base_temperature, cap_temperature),
+        "et0": reference_et0(tmax, tmin, latitude, day_of_year),
+        "rain": rain,
+        "cumulative_rain": np.cumsum(rain, axis=1),
+        "heat_stress_hours": heat_stress_hours(temperature, heat_stress_threshold),
+        "spray_windows": find_windows(spray, min_spray_hours),
+    }
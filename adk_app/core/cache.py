@@ -0,0 +1,260 @@
+"""
+In-process result caching.
+Size-bounded LRU cache with per-entry TTLs and single-flight loading.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    Approximate the memory footprint of a value in bytes.
+
+    Walks containers and plain objects recursively; shared objects are only
+    counted once. Good enough to bound a cache, not an exact measurement.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        size += estimate_size(vars(value), _seen)
+    return size
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache bounded by total size in bytes, with per-entry TTLs.
+
+    Concurrent loads of the same missing key are coalesced: the first caller
+    runs the loader and every other caller waits for its result
+    (single-flight). This works across threads and across event loops, since
+    the shared in-flight handle is a concurrent.futures.Future. Async callers
+    also wait on loads led by threads, but threads never wait on loads led by
+    an event loop: a sync caller running on that loop would block it, so the
+    load could never finish.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        default_ttl: float = 300.0,
+        sizeof: Callable[[Any], int] = estimate_size,
+        name: str = "cache"
+    ):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.name = name
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        # In-flight loads led by threads (sync path) and by event loop tasks (async path)
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_async: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+
+        Returns:
+            Tuple of (found, value); expired entries count as not found
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            if entry.expires_at <= time.monotonic():
+                self._remove_locked(key)
+                self._expirations += 1
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value, evicting least recently used entries to stay within max_bytes."""
+        ttl = self.default_ttl if ttl is None else ttl
+        size = self._sizeof(value)
+        if size > self.max_bytes or ttl <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+            self._entries[key] = _Entry(value, time.monotonic() + ttl, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+                self._evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one key, or every entry when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._bytes = 0
+            elif key in self._entries:
+                self._remove_locked(key)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for key, or load, cache and return it.
+        Concurrent callers for the same key share a single loader call.
+        """
+        while True:
+            found, value = self.get(key)
+            if found:
+                return value
+
+            future, leader = self._join_flight(key)
+            if not leader:
+                try:
+                    return future.result()
+                except CancelledError:
+                    # The loading caller was cancelled; load it ourselves
+                    continue
+
+            try:
+                value = loader()
+            except BaseException as e:
+                self._finish_flight(key, future, error=e)
+                raise
+            self.set(key, value, ttl)
+            self._finish_flight(key, future, value=value)
+            return value
+
+    async def get_or_load_async(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Async counterpart of get_or_load().
+
+        If the caller that is loading a key is cancelled, waiting callers
+        retry the load themselves instead of failing.
+        """
+        while True:
+            found, value = self.get(key)
+            if found:
+                return value
+
+            future, leader = self._join_flight(key, asynchronous=True)
+            if not leader:
+                try:
+                    # Shielded so a cancelled waiter doesn't cancel the shared load
+                    return await asyncio.shield(asyncio.wrap_future(future))
+                except asyncio.CancelledError:
+                    if future.cancelled() and not asyncio.current_task().cancelling():
+                        continue
+                    raise
+
+            try:
+                value = await loader()
+            except asyncio.CancelledError:
+                self._finish_flight(key, future, cancelled=True, asynchronous=True)
+                raise
+            except BaseException as e:
+                self._finish_flight(key, future, error=e, asynchronous=True)
+                raise
+            self.set(key, value, ttl)
+            self._finish_flight(key, future, value=value, asynchronous=True)
+            return value
+
+    def _join_flight(self, key: Hashable, asynchronous: bool = False) -> Tuple[Future, bool]:
+        """
+        Get the in-flight load for key, registering a new one if none exists.
+        Sync callers only join loads led by other threads.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None and asynchronous:
+                future = self._inflight_async.get(key)
+            if future is not None:
+                self._coalesced += 1
+                return future, False
+            future = Future()
+            (self._inflight_async if asynchronous else self._inflight)[key] = future
+            return future, True
+
+    def _finish_flight(
+        self,
+        key: Hashable,
+        future: Future,
+        value: Any = None,
+        error: Optional[BaseException] = None,
+        cancelled: bool = False,
+        asynchronous: bool = False
+    ):
+        with self._lock:
+            (self._inflight_async if asynchronous else self._inflight).pop(key, None)
+        if cancelled:
+            future.cancel()
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def _remove_locked(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters, evictions and current size
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "coalesced": self._coalesced,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "in_flight": len(self._inflight) + len(self._inflight_async),
+            }
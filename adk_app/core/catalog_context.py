@@ -0,0 +1,181 @@
+"""
+Forecast catalog context for the yield agent's instruction.
+Appends a compact, versioned list of valid varieties, districts and years to
+the persona, so the model fills forecast parameters without discovery tool
+calls, and counts the discovery calls it still makes.
+"""
+import logging
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Optional
+from adk_app.core.forecast_catalog import ForecastCatalog
+from adk_app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Tools the catalog context makes unnecessary for filling parameters
+DISCOVERY_TOOLS = {
+    "get_forecast_catalog",
+    "get_available_crop_types",
+    "get_available_districts",
+    "get_available_forecast_years",
+}
+
+# Session state key holding the discovery calls made in a session
+SESSION_STATE_KEY = "yield_discovery_calls"
+
+CATALOG_SECTION = """
+
+## Forecast Catalog (version {version})
+
+Valid values in the forecast database. Use these exact names for
+`get_yield_forecast_from_db` and `get_yield_forecasts_batch` without calling the
+discovery tools first; call them only when the user asks to see the lists.
+
+- Varieties (yield_variety): {crop_types}
+- Districts (district): {districts}
+- Forecast years (forecast_year): {years}
+"""
+
+
+def render_catalog_section(catalog: ForecastCatalog) -> str:
+    """Instruction section listing the catalog's valid lookup values."""
+    return CATALOG_SECTION.format(
+        version=catalog.version,
+        crop_types=", ".join(f'"{name}"' for name in catalog.crop_type_names),
+        districts=", ".join(catalog.district_names),
+        years=", ".join(str(year) for year in sorted(catalog.forecast_years)),
+    )
+
+
+class CatalogContext:
+    """
+    Catalog section of the yield agent's instruction, with discovery call counts.
+
+    The section is rendered once per catalog version and re-rendered when the
+    catalog is refreshed. Without a catalog (e.g. the database is down) it is
+    empty, and the persona's discovery-tool guidance applies.
+    """
+
+    def __init__(self, history_size: int = 1024):
+        self.version: Optional[str] = None
+        self.section = ""
+        self._lock = threading.Lock()
+        self._builds = 0
+        # Recent invocations that built the instruction, to count agent turns
+        self._invocations: "OrderedDict[str, None]" = OrderedDict()
+        self._history_size = history_size
+        self._turns = 0
+        self._discovery_calls: Counter = Counter()
+
+    def update(self, catalog: ForecastCatalog):
+        """Re-render the catalog section if the catalog version changed."""
+        if catalog.version == self.version:
+            return
+        section = render_catalog_section(catalog)
+        with self._lock:
+            self.section = section
+            self.version = catalog.version
+            self._builds += 1
+        logger.info(f"Yield agent catalog context built for forecast catalog {catalog.version}")
+
+    def warm(self):
+        """Build the section at startup, loading the catalog with a blocking query if needed."""
+        # Imported here to keep core modules independent of the tool layer at import time
+        from adk_app.tools.snowflake_yield_tools import load_forecast_catalog
+
+        try:
+            self.update(load_forecast_catalog())
+        except Exception as e:
+            logger.warning(f"Forecast catalog unavailable at startup: {str(e)}")
+
+    async def refresh(self, invocation_id: str) -> str:
+        """Current section, re-rendered first if the catalog was refreshed."""
+        from adk_app.tools.snowflake_yield_tools import load_forecast_catalog_async
+
+        try:
+            # Served from the catalog store; only queries when it's stale
+            self.update(await load_forecast_catalog_async())
+        except Exception as e:
+            logger.warning(f"Forecast catalog unavailable, instruction built without it: {str(e)}")
+        with self._lock:
+            if invocation_id not in self._invocations:
+                self._invocations[invocation_id] = None
+                if len(self._invocations) > self._history_size:
+                    self._invocations.popitem(last=False)
+                self._turns += 1
+        return self.section
+
+    def instruction(self, persona: str, suffix: str = "") -> "CatalogInstruction":
+        """Instruction provider for an agent with the given persona, followed by suffix after the catalog."""
+        return CatalogInstruction(self, persona, suffix)
+
+    def before_tool_callback(self, tool: Any, args: Dict[str, Any], tool_context: Any) -> Optional[Dict[str, Any]]:
+        """ADK before-tool callback counting discovery calls, overall and per session."""
+        if tool.name in DISCOVERY_TOOLS:
+            with self._lock:
+                self._discovery_calls[tool.name] += 1
+            tool_context.state[SESSION_STATE_KEY] = tool_context.state.get(SESSION_STATE_KEY, 0) + 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get catalog context statistics.
+
+        Returns:
+            Dictionary with the catalog version in use, section builds, agent
+            turns and the discovery calls made per turn
+        """
+        with self._lock:
+            calls = sum(self._discovery_calls.values())
+            return {
+                "catalog_version": self.version,
+                "builds": self._builds,
+                "turns": self._turns,
+                "discovery_calls": calls,
+                "discovery_calls_by_tool": dict(self._discovery_calls),
+                "discovery_calls_per_turn": round(calls / self._turns, 4) if self._turns else 0.0,
+            }
+
+
+class CatalogInstruction:
+    """ADK instruction provider: the persona, the catalog section and an optional suffix."""
+
+    def __init__(self, context: CatalogContext, persona: str, suffix: str = ""):
+        self.context = context
+        self.persona = persona
+        self.suffix = suffix
+
+    async def __call__(self, ctx: Any) -> str:
+        return self.persona + await self.context.refresh(ctx.invocation_id) + self.suffix
+
+
+# Global catalog context instance
+_catalog_context: Optional[CatalogContext] = None
+
+
+def get_catalog_context() -> CatalogContext:
+    """
+    Get or create the global yield agent catalog context.
+
+    Returns:
+        CatalogContext instance
+    """
+    global _catalog_context
+    if _catalog_context is None:
+        _catalog_context = CatalogContext()
+    return _catalog_context
+
+
+def catalog_context_enabled() -> bool:
+    """Whether the yield agent's instruction lists the catalog (catalog_context.enabled in runtime.yaml)."""
+    return bool(get_settings().get_runtime_config("catalog_context.enabled", True))
+
+
+def start_catalog_context() -> CatalogContext:
+    """Build the catalog section in a background thread so startup isn't blocked (when enabled)."""
+    context = get_catalog_context()
+    if not catalog_context_enabled():
+        return context
+    threading.Thread(target=context.warm, name="catalog-context-warm", daemon=True).start()
+    return context
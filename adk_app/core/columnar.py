@@ -0,0 +1,106 @@
+"""
+Columnar query results backed by Apache Arrow.
+Converts each result column to JSON-friendly Python values in one vectorized pass.
+"""
+from typing import Dict, Any, List, Iterable, Optional, Sequence
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def _convert_column(column: pa.ChunkedArray) -> List[Any]:
+    """
+    Convert an Arrow column to a list of JSON-serializable values.
+
+    The conversion is chosen once from the column type and applied to the
+    whole column with Arrow compute kernels:
+    - DECIMAL/NUMBER with scale 0 -> int
+    - DECIMAL/NUMBER with scale > 0 -> float
+    - DATE -> "YYYY-MM-DD"
+    - TIMESTAMP -> ISO 8601 string, with microseconds only when the column has
+      sub-second values
+    - everything else -> native Python value
+    """
+    arrow_type = column.type
+
+    if pa.types.is_decimal(arrow_type):
+        target = pa.int64() if arrow_type.scale == 0 else pa.float64()
+        return pc.cast(column, target, safe=False).to_pylist()
+
+    if pa.types.is_date(arrow_type):
+        return pc.cast(column, pa.string()).to_pylist()
+
+    if pa.types.is_timestamp(arrow_type):
+        has_fraction = pc.any(pc.not_equal(pc.subsecond(column), 0)).as_py()
+        unit = "us" if has_fraction else "s"
+        column = pc.cast(column, pa.timestamp(unit, tz=arrow_type.tz), safe=False)
+        if arrow_type.tz is None:
+            return pc.strftime(column, format="%Y-%m-%dT%H:%M:%S").to_pylist()
+        formatted = pc.strftime(column, format="%Y-%m-%dT%H:%M:%S%z")
+        # isoformat() writes the UTC offset as +HH:MM rather than +HHMM
+        return pc.replace_substring_regex(
+            formatted, pattern=r"([+-]\d\d)(\d\d)$", replacement=r"\1:\2"
+        ).to_pylist()
+
+    return column.to_pylist()
+
+
+class ColumnarResult:
+    """
+    Query result stored column by column.
+
+    Column names are lowercased to match the keys the tools expose.
+    Values are already converted to JSON-friendly types.
+    """
+
+    def __init__(self, columns: Optional[Dict[str, List[Any]]] = None):
+        self.columns: Dict[str, List[Any]] = columns or {}
+
+    @classmethod
+    def from_arrow(cls, table: pa.Table) -> "ColumnarResult":
+        """Build a result from an Arrow table, converting each column once."""
+        return cls({
+            name.lower(): _convert_column(table.column(name))
+            for name in table.column_names
+        })
+
+    @classmethod
+    def from_arrow_batches(cls, batches: Iterable[pa.Table]) -> "ColumnarResult":
+        """Build a result from a stream of Arrow tables (e.g. fetch_arrow_batches())."""
+        result = cls()
+        for batch in batches:
+            converted = cls.from_arrow(batch)
+            if not result.columns:
+                result.columns = converted.columns
+            else:
+                for name, values in converted.columns.items():
+                    result.columns[name].extend(values)
+        return result
+
+    @property
+    def column_names(self) -> List[str]:
+        """Lowercased column names in result order."""
+        return list(self.columns)
+
+    def column(self, name: str) -> List[Any]:
+        """Get the values of a column by (case-insensitive) name."""
+        return self.columns[name.lower()]
+
+    def take(self, indices: Sequence[int]) -> "ColumnarResult":
+        """Build a new result holding only the given row positions, in order."""
+        return ColumnarResult({
+            name: [values[i] for i in indices]
+            for name, values in self.columns.items()
+        })
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize the result as a list of row dictionaries."""
+        names = self.column_names
+        return [dict(zip(names, row)) for row in zip(*self.columns.values())]
+
+    def __len__(self) -> int:
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
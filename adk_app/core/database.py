@@ -2,16 +2,338 @@
 Snowflake Database Connection Manager.
 Handles connection lifecycle, pooling, and error handling.
 """
+import asyncio
+import functools
 import logging
 import os
+import re
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Deque, Mapping, Sequence, Union, Tuple
 from contextlib import contextmanager
 import snowflake.connector
-from snowflake.connector import SnowflakeConnection, DictCursor
+from snowflake.connector import SnowflakeConnection
+from snowflake.connector.cursor import SnowflakeCursor
+from snowflake.connector.errors import OperationalError, InterfaceError, NotSupportedError, ProgrammingError
+from adk_app.core.cache import TTLCache
+from adk_app.core.columnar import ColumnarResult
+from adk_app.core.row_formatter import RowFormatter
+from adk_app.core.forecast_replica import (
+    ForecastReplica,
+    ForecastSnapshot,
+    FORECAST_COLUMNS,
+    FORECAST_TABLE,
+    get_forecast_replica,
+)
 
 logger = logging.getLogger(__name__)
 
+# Result cache TTLs per query class, in seconds; the first matching pattern wins.
+# Override with SNOWFLAKE_CACHE_TTL_<CLASS> (e.g. SNOWFLAKE_CACHE_TTL_DISCOVERY=600).
+QUERY_CACHE_CLASSES = [
+    ("discovery", re.compile(r"^\s*SELECT\s+DISTINCT\b", re.IGNORECASE), 3600),
+    ("crop_practice", re.compile(r"\bVW_STG_CROP_PRACTICE\b", re.IGNORECASE), 3600),
+    ("forecast", re.compile(r"\bSTG_ML_YIELD_FORECASTS\b", re.IGNORECASE), 600),
+    ("metadata", re.compile(r"\bINFORMATION_SCHEMA\b", re.IGNORECASE), 3600),
+    ("other", re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE), 60),
+]
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available within the checkout timeout."""
+
+
+class _PooledConnection:
+    """A pooled connection together with its bookkeeping timestamps."""
+    
+    __slots__ = ("connection", "created_at", "last_used_at")
+    
+    def __init__(self, connection: SnowflakeConnection):
+        now = time.monotonic()
+        self.connection = connection
+        self.created_at = now
+        self.last_used_at = now
+
+
+class SnowflakeConnectionPool:
+    """
+    Bounded, thread-safe pool of Snowflake connections.
+    
+    Connections are created lazily up to ``max_size``. Borrowers wait up to
+    ``checkout_timeout`` seconds for a free connection. Idle connections are
+    validated before being handed out, connections idle for longer than
+    ``max_idle_time`` are reaped (never below ``min_size``), and connections
+    older than ``max_lifetime`` are recycled.
+    """
+    
+    def __init__(
+        self,
+        connection_factory: Callable[[], SnowflakeConnection],
+        min_size: int = 1,
+        max_size: int = 5,
+        checkout_timeout: float = 30.0,
+        max_idle_time: float = 300.0,
+        max_lifetime: float = 3600.0,
+        validation_interval: float = 30.0
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+        
+        self._factory = connection_factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+        self.validation_interval = validation_interval
+        
+        self._idle: Deque[_PooledConnection] = deque()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        
+        # Statistics
+        self._in_use = 0
+        self._created = 0
+        self._destroyed = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._waits = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+    
+    def acquire(self, timeout: Optional[float] = None) -> _PooledConnection:
+        """
+        Borrow a connection from the pool.
+        
+        Args:
+            timeout: Seconds to wait for a free connection (defaults to checkout_timeout)
+            
+        Returns:
+            The pooled connection wrapper
+            
+        Raises:
+            PoolTimeoutError: If no connection becomes available in time
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+        
+        while True:
+            stale: List[_PooledConnection] = []
+            candidate: Optional[_PooledConnection] = None
+            create = False
+            
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                
+                while True:
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"Timed out after {timeout:.1f}s waiting for a Snowflake connection "
+                            f"(pool size {self.max_size})"
+                        )
+                    waited = True
+                    self._cond.wait(remaining)
+                
+                stale = self._collect_expired_locked()
+            
+            self._destroy_all(stale)
+            
+            if create:
+                try:
+                    candidate = _PooledConnection(self._factory())
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._created += 1
+            elif not self._validate(candidate):
+                self._discard(candidate)
+                continue
+            
+            wait_time = time.monotonic() - started
+            with self._cond:
+                self._in_use += 1
+                self._checkouts += 1
+                if waited:
+                    self._waits += 1
+                self._total_wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+            
+            candidate.last_used_at = time.monotonic()
+            return candidate
+    
+    def release(self, pooled: _PooledConnection, discard: bool = False):
+        """
+        Return a borrowed connection to the pool.
+        
+        Args:
+            pooled: Connection wrapper obtained from acquire()
+            discard: If True, close the connection instead of reusing it
+        """
+        now = time.monotonic()
+        expired = now - pooled.created_at > self.max_lifetime
+        
+        with self._cond:
+            self._in_use -= 1
+            if not (discard or expired or self._closed or pooled.connection.is_closed()):
+                pooled.last_used_at = now
+                self._idle.append(pooled)
+                self._cond.notify()
+                return
+        
+        self._discard(pooled)
+    
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """
+        Context manager that borrows a connection and always returns it.
+        Connections that failed with a connection-level error are discarded.
+        """
+        pooled = self.acquire(timeout)
+        discard = False
+        try:
+            yield pooled.connection
+        except (OperationalError, InterfaceError):
+            discard = True
+            raise
+        finally:
+            self.release(pooled, discard=discard)
+    
+    def fill(self):
+        """Pre-create connections until the pool holds at least min_size."""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                pooled = _PooledConnection(self._factory())
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                raise
+            with self._cond:
+                self._created += 1
+                self._idle.append(pooled)
+                self._cond.notify()
+    
+    def reap_idle(self) -> int:
+        """
+        Close idle connections past max_idle_time or max_lifetime.
+        
+        Returns:
+            Number of connections closed
+        """
+        with self._cond:
+            stale = self._collect_expired_locked()
+        self._destroy_all(stale)
+        return len(stale)
+    
+    def close(self):
+        """Close every idle connection and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        self._destroy_all(idle)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of pool statistics.
+        
+        Returns:
+            Dictionary with sizes, checkout/wait counters and creation counts
+        """
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "total_wait_time_s": round(self._total_wait_time, 6),
+                "avg_wait_time_s": round(self._total_wait_time / self._checkouts, 6) if self._checkouts else 0.0,
+                "max_wait_time_s": round(self._max_wait_time, 6),
+                "connections_created": self._created,
+                "connections_closed": self._destroyed,
+            }
+    
+    def _collect_expired_locked(self) -> List[_PooledConnection]:
+        """Remove expired idle connections (caller holds the lock)."""
+        now = time.monotonic()
+        keep: Deque[_PooledConnection] = deque()
+        stale: List[_PooledConnection] = []
+        # Oldest-used entries sit at the left of the deque
+        for pooled in self._idle:
+            too_old = now - pooled.created_at > self.max_lifetime
+            too_idle = (
+                now - pooled.last_used_at > self.max_idle_time
+                and self._size - len(stale) > self.min_size
+            )
+            if too_old or too_idle:
+                stale.append(pooled)
+            else:
+                keep.append(pooled)
+        self._idle = keep
+        self._size -= len(stale)
+        if stale:
+            self._cond.notify(len(stale))
+        return stale
+    
+    def _validate(self, pooled: _PooledConnection) -> bool:
+        """Check that a pooled connection is still usable before lending it out."""
+        conn = pooled.connection
+        try:
+            if conn.is_closed():
+                return False
+            if time.monotonic() - pooled.last_used_at > self.validation_interval:
+                return conn.is_valid()
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled connection failed validation: {str(e)}")
+            return False
+    
+    def _discard(self, pooled: _PooledConnection):
+        """Close a connection that is no longer part of the pool."""
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+        self._destroy_all([pooled])
+    
+    def _destroy_all(self, pooled_list: List[_PooledConnection]):
+        """Close connections that have already been removed from the pool."""
+        for pooled in pooled_list:
+            try:
+                pooled.connection.close()
+            except Exception as e:
+                logger.error(f"Error closing pooled Snowflake connection: {str(e)}")
+            with self._cond:
+                self._destroyed += 1
+
 
 class SnowflakeConnectionManager:
     """
@@ -20,8 +342,14 @@ class SnowflakeConnectionManager:
     """
     
     def __init__(self):
-        self._connection: Optional[SnowflakeConnection] = None
+        self._pool: Optional[SnowflakeConnectionPool] = None
+        self._pool_lock = threading.Lock()
         self._config = self._load_config()
+        cache_config = self._config["cache"]
+        self.query_cache: Optional[TTLCache] = (
+            TTLCache(max_bytes=cache_config["max_bytes"], name="snowflake_query")
+            if cache_config["enabled"] else None
+        )
     
     def _load_config(self) -> Dict[str, Any]:
         """Load Snowflake configuration from environment and settings."""
@@ -51,7 +379,22 @@ class SnowflakeConnectionManager:
             "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE", "DEV_DATA_ML_WH"),
             "database": os.getenv("SNOWFLAKE_DATABASE", "DEV_DATA_ML_DB"),
             "schema": os.getenv("SNOWFLAKE_SCHEMA", "DATA_ML_SCHEMA"),
-            "private_key_file": pem_file_path
+            "private_key_file": pem_file_path,
+            "pool": {
+                "min_size": int(os.getenv("SNOWFLAKE_POOL_MIN_SIZE", "1")),
+                "max_size": int(os.getenv("SNOWFLAKE_POOL_MAX_SIZE", "5")),
+                "checkout_timeout": float(os.getenv("SNOWFLAKE_POOL_CHECKOUT_TIMEOUT", "30")),
+                "max_idle_time": float(os.getenv("SNOWFLAKE_POOL_MAX_IDLE_SECONDS", "300")),
+                "max_lifetime": float(os.getenv("SNOWFLAKE_POOL_MAX_LIFETIME_SECONDS", "3600")),
+            },
+            "cache": {
+                "enabled": os.getenv("SNOWFLAKE_QUERY_CACHE_ENABLED", "true").lower() in ("1", "true", "yes"),
+                "max_bytes": int(os.getenv("SNOWFLAKE_QUERY_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+                "ttls": {
+                    name: float(os.getenv(f"SNOWFLAKE_CACHE_TTL_{name.upper()}", str(ttl)))
+                    for name, _, ttl in QUERY_CACHE_CLASSES
+                },
+            }
         }
         
         logger.info(f"Using PEM file: {pem_file_path}")
@@ -60,7 +403,9 @@ class SnowflakeConnectionManager:
     
     def connect(self) -> SnowflakeConnection:
         """
-        Establish connection to Snowflake.
+        Open a new Snowflake connection.
+        Used as the connection factory for the pool; callers should normally
+        borrow connections through get_connection() instead.
         
         Returns:
             Active Snowflake connection
@@ -68,9 +413,6 @@ class SnowflakeConnectionManager:
         Raises:
             snowflake.connector.Error: If connection fails
         """
-        if self._connection is not None and not self._connection.is_closed():
-            return self._connection
-        
         try:
             logger.info(f"Connecting to Snowflake account: {self._config['account']}")
             
@@ -82,7 +424,7 @@ class SnowflakeConnectionManager:
                     "Please ensure database_connection_config.pem is in the project root."
                 )
             
-            self._connection = snowflake.connector.connect(
+            connection = snowflake.connector.connect(
                 user=self._config["user"],
                 private_key_file=self._config["private_key_file"],
                 account=self._config["account"],
@@ -93,78 +435,110 @@ class SnowflakeConnectionManager:
             )
             
             logger.info("Successfully connected to Snowflake")
-            return self._connection
+            return connection
             
         except Exception as e:
             logger.error(f"Failed to connect to Snowflake: {str(e)}")
             raise
     
+    @property
+    def pool(self) -> SnowflakeConnectionPool:
+        """Connection pool, created on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = SnowflakeConnectionPool(self.connect, **self._config["pool"])
+        return self._pool
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+        
+        Returns:
+            Dictionary with in-use/idle counts, wait times and creation counts
+        """
+        return self.pool.stats()
+    
     def close(self):
-        """Close the Snowflake connection."""
-        if self._connection is not None and not self._connection.is_closed():
+        """Close all pooled Snowflake connections."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
             try:
-                self._connection.close()
-                logger.info("Snowflake connection closed")
+                pool.close()
+                logger.info("Snowflake connection pool closed")
             except Exception as e:
-                logger.error(f"Error closing Snowflake connection: {str(e)}")
-            finally:
-                self._connection = None
+                logger.error(f"Error closing Snowflake connection pool: {str(e)}")
     
     @contextmanager
     def get_connection(self):
         """
         Context manager for Snowflake connections.
-        Automatically handles connection lifecycle.
+        Borrows a connection from the pool and returns it when the block exits.
         
         Usage:
             with manager.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM table")
         """
-        conn = None
         try:
-            conn = self.connect()
-            yield conn
+            with self.pool.connection() as conn:
+                yield conn
         except Exception as e:
             logger.error(f"Error in connection context: {str(e)}")
             raise
-        finally:
-            if conn is not None:
-                # Don't close here, let the manager handle it
-                pass
     
     def execute_query(
         self, 
         query: str, 
         params: Optional[Dict[str, Any]] = None,
-        fetch_all: bool = True
-    ) -> List[Dict[str, Any]]:
+        fetch_all: bool = True,
+        result_format: str = "rows",
+        use_cache: bool = True
+    ) -> Union[List[Dict[str, Any]], ColumnarResult]:
         """
         Execute a query and return results as list of dictionaries.
+        Values are converted to JSON-friendly types (see RowFormatter).
+        
+        Read queries are served from the result cache when possible. Cached
+        results are shared between callers and must not be mutated.
         
         Args:
             query: SQL query to execute
             params: Optional query parameters
             fetch_all: If True, fetch all results; if False, fetch one
+            result_format: "rows" for a list of dictionaries, or "columns" for a
+                ColumnarResult fetched through Arrow with per-column type conversion
+            use_cache: If False, always run the query against Snowflake
             
         Returns:
-            List of dictionaries with query results
+            List of dictionaries with query results, or a ColumnarResult
         """
+        ttl = self._cache_ttl(query) if use_cache else None
+        if ttl:
+            key = self._cache_key(query, params, fetch_all, result_format)
+            return self.query_cache.get_or_load(
+                key, lambda: self._execute_query(query, params, fetch_all, result_format), ttl
+            )
+        return self._execute_query(query, params, fetch_all, result_format)
+    
+    def _execute_query(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]],
+        fetch_all: bool,
+        result_format: str
+    ) -> Union[List[Dict[str, Any]], ColumnarResult]:
+        """Run a query against Snowflake, bypassing the result cache."""
         with self.get_connection() as conn:
-            cursor = conn.cursor(DictCursor)
+            cursor = self._open_cursor(conn, result_format)
             try:
                 if params:
                     cursor.execute(query, params)
                 else:
                     cursor.execute(query)
                 
-                if fetch_all:
-                    results = cursor.fetchall()
-                else:
-                    result = cursor.fetchone()
-                    results = [result] if result else []
-                
-                return results
+                return self._fetch(cursor, fetch_all, result_format)
                 
             except Exception as e:
                 logger.error(f"Query execution failed: {str(e)}")
@@ -173,6 +547,241 @@ class SnowflakeConnectionManager:
             finally:
                 cursor.close()
     
+    @staticmethod
+    def _open_cursor(conn: SnowflakeConnection, result_format: str) -> SnowflakeCursor:
+        """Open a cursor, checking the requested result format."""
+        if result_format not in ("rows", "columns"):
+            raise ValueError(f"Unknown result_format: {result_format!r}")
+        return conn.cursor()
+    
+    @staticmethod
+    def _fetch(
+        cursor: SnowflakeCursor,
+        fetch_all: bool,
+        result_format: str
+    ) -> Union[List[Dict[str, Any]], ColumnarResult]:
+        """
+        Fetch the results of an executed cursor in the requested format.
+        
+        Rows are converted by a RowFormatter compiled from the cursor
+        description. Columnar results come from Arrow, falling back to the
+        row formatter when the result isn't available in Arrow format.
+        """
+        if result_format == "columns":
+            try:
+                batches = cursor.fetch_arrow_batches()
+            except (NotSupportedError, ProgrammingError):
+                return RowFormatter.from_description(cursor.description).to_columnar(cursor.fetchall())
+            return ColumnarResult.from_arrow_batches(batches)
+        
+        formatter = RowFormatter.from_description(cursor.description)
+        if fetch_all:
+            return formatter.format_rows(cursor.fetchall())
+        result = cursor.fetchone()
+        return formatter.format_rows([result]) if result else []
+    
+    async def execute_query_async(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        fetch_all: bool = True,
+        result_format: str = "rows",
+        use_cache: bool = True,
+        poll_interval: float = 0.05,
+        max_poll_interval: float = 1.0
+    ) -> Union[List[Dict[str, Any]], ColumnarResult]:
+        """
+        Execute a query without blocking the event loop.
+        
+        The query is submitted with Snowflake's asynchronous execution and its
+        status is polled by query id with exponential backoff, yielding to the
+        event loop between polls. The few short network calls involved (checkout,
+        submission, status checks, result download) run in the default executor.
+        If the awaiting task is cancelled, the running query is cancelled too.
+        Shares the result cache with execute_query().
+        
+        Args:
+            query: SQL query to execute
+            params: Optional query parameters
+            fetch_all: If True, fetch all results; if False, fetch one
+            result_format: "rows" or "columns", as for execute_query()
+            use_cache: If False, always run the query against Snowflake
+            poll_interval: Initial delay between status polls, in seconds
+            max_poll_interval: Upper bound for the poll delay, in seconds
+            
+        Returns:
+            List of dictionaries with query results, or a ColumnarResult
+        """
+        async def load():
+            return await self._execute_query_async(
+                query, params, fetch_all, result_format, poll_interval, max_poll_interval
+            )
+        
+        ttl = self._cache_ttl(query) if use_cache else None
+        if ttl:
+            key = self._cache_key(query, params, fetch_all, result_format)
+            return await self.query_cache.get_or_load_async(key, load, ttl)
+        return await load()
+    
+    async def _execute_query_async(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]],
+        fetch_all: bool,
+        result_format: str,
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> Union[List[Dict[str, Any]], ColumnarResult]:
+        """Run a query with asynchronous execution, bypassing the result cache."""
+        loop = asyncio.get_running_loop()
+        pool = self.pool
+        checkout = loop.run_in_executor(None, pool.acquire)
+        try:
+            # Shielded so the checkout's result is still seen if this task is cancelled
+            pooled = await asyncio.shield(checkout)
+        except asyncio.CancelledError:
+            checkout.add_done_callback(lambda done: self._release_checkout(pool, done))
+            raise
+        conn = pooled.connection
+        cursor = None
+        query_id = None
+        discard = False
+        released = False
+        # Executor step currently using the connection in a worker thread
+        step: Optional["asyncio.Future[Any]"] = None
+        
+        def run_step(function: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+            nonlocal step
+            step = loop.run_in_executor(None, function, *args)
+            # Shielded so cancelling this task leaves step tracking the worker
+            return asyncio.shield(step)
+        
+        try:
+            cursor = self._open_cursor(conn, result_format)
+            await run_step(cursor.execute_async, query, params)
+            query_id = cursor.sfqid
+            
+            delay = poll_interval
+            while True:
+                status = await run_step(conn.get_query_status_throw_if_error, query_id)
+                if not conn.is_still_running(status):
+                    break
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+            
+            def fetch() -> Union[List[Dict[str, Any]], ColumnarResult]:
+                cursor.get_results_from_sfqid(query_id)
+                return self._fetch(cursor, fetch_all, result_format)
+            
+            return await run_step(fetch)
+        
+        except asyncio.CancelledError:
+            # A worker may still be using the connection: cancel the query and
+            # release the connection only once its step has finished
+            released = True
+            abandon = functools.partial(self._abandon_query, pool, pooled, cursor)
+            
+            def abandon_after(done: "asyncio.Future[Any]"):
+                if not done.cancelled():
+                    done.exception()  # Retrieved so it isn't reported as unhandled
+                loop.run_in_executor(None, abandon)
+            
+            if step is not None and not step.done():
+                step.add_done_callback(abandon_after)
+            else:
+                loop.run_in_executor(None, abandon)
+            raise
+        except (OperationalError, InterfaceError) as e:
+            discard = True
+            logger.error(f"Async query execution failed: {str(e)}")
+            logger.error(f"Query: {query}")
+            raise
+        except Exception as e:
+            logger.error(f"Async query execution failed: {str(e)}")
+            logger.error(f"Query: {query}")
+            raise
+        finally:
+            if not released:
+                if cursor is not None:
+                    cursor.close()
+                pool.release(pooled, discard=discard)
+    
+    def _abandon_query(
+        self,
+        pool: SnowflakeConnectionPool,
+        pooled: _PooledConnection,
+        cursor: Optional[SnowflakeCursor]
+    ):
+        """Cancel a cancelled task's query, if it was submitted, and return its connection."""
+        try:
+            # sfqid is set as soon as the query is submitted
+            query_id = cursor.sfqid if cursor is not None else None
+            if query_id is not None:
+                self._cancel_query(pooled.connection, query_id)
+            if cursor is not None:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"Cleanup after a cancelled query failed: {str(e)}")
+        finally:
+            pool.release(pooled)
+    
+    @staticmethod
+    def _release_checkout(pool: SnowflakeConnectionPool, checkout: "asyncio.Future[_PooledConnection]"):
+        """Return a connection whose checkout finished after the waiting task was cancelled."""
+        if not checkout.cancelled() and checkout.exception() is None:
+            pool.release(checkout.result())
+    
+    def _cache_ttl(self, query: str) -> Optional[float]:
+        """TTL for a query's class, or None if the query should not be cached."""
+        if self.query_cache is None:
+            return None
+        for name, pattern, _ in QUERY_CACHE_CLASSES:
+            if pattern.search(query):
+                return self._config["cache"]["ttls"][name]
+        return None
+    
+    @staticmethod
+    def _cache_key(
+        query: str,
+        params: Optional[Union[Mapping[str, Any], Sequence[Any]]],
+        fetch_all: bool,
+        result_format: str
+    ) -> Tuple[str, str, bool, str]:
+        """Cache key from whitespace-normalized SQL and parameters (named ones sorted)."""
+        normalized = " ".join(query.split())
+        if not params:
+            param_key = ""
+        elif isinstance(params, Mapping):
+            param_key = repr(sorted(params.items()))
+        else:
+            # Positional (qmark/numeric) parameters: order matters
+            param_key = repr(tuple(params))
+        return normalized, param_key, fetch_all, result_format
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get query result cache statistics.
+        
+        Returns:
+            Dictionary with hit/miss counters, evictions and size, or {"enabled": False}
+        """
+        if self.query_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.query_cache.stats()}
+    
+    @staticmethod
+    def _cancel_query(conn: SnowflakeConnection, query_id: str):
+        """Best-effort cancellation of a running query."""
+        try:
+            cancel_cursor = conn.cursor()
+            try:
+                cancel_cursor.execute("SELECT SYSTEM$CANCEL_QUERY(%s)", (query_id,))
+            finally:
+                cancel_cursor.close()
+            logger.info(f"Cancelled Snowflake query {query_id}")
+        except Exception as e:
+            logger.warning(f"Failed to cancel Snowflake query {query_id}: {str(e)}")
+    
     def test_connection(self) -> bool:
         """
         Test the Snowflake connection.
@@ -194,7 +803,7 @@ class SnowflakeConnectionManager:
     
     def __enter__(self):
         """Support for context manager protocol."""
-        self.connect()
+        self.pool.fill()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -206,8 +815,177 @@ class SnowflakeConnectionManager:
         self.close()
 
 
+class ForecastRefreshEngine:
+    """
+    Incrementally refreshes the in-memory forecast replica.
+    
+    Tracks the highest PREDICTION_DATE already seen and only pulls rows on or
+    after it (rows on the watermark date are re-read so same-day changes are
+    picked up). Pulled rows are upserted by ID into a copy of the current
+    snapshot, which is then swapped in atomically, so readers never observe a
+    partially merged table. The first cycle, or any cycle without a loaded
+    snapshot, performs a full load.
+    
+    The table has no change-tracking column, so the watermark can't see
+    corrections to rows dated before it or deleted rows. Every
+    full_refresh_seconds a cycle reloads the whole table instead; until then
+    such changes are missing from the replica. None or 0 disables the
+    periodic full refresh.
+    """
+    
+    def __init__(
+        self,
+        replica: ForecastReplica,
+        manager: Optional["SnowflakeConnectionManager"] = None,
+        interval_seconds: float = 300.0,
+        full_refresh_seconds: Optional[float] = 3600.0
+    ):
+        self.replica = replica
+        self._manager = manager
+        self.interval_seconds = interval_seconds
+        self.full_refresh_seconds = full_refresh_seconds
+        # The replica is loaded in full at startup
+        self._last_full_refresh = time.monotonic()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        # Statistics
+        self._cycles = 0
+        self._failures = 0
+        self._last_refresh_at: Optional[float] = None
+        self._last_cycle: Dict[str, Any] = {}
+        self._total_rows_merged = 0
+        self._full_refreshes = 0
+    
+    @property
+    def manager(self) -> "SnowflakeConnectionManager":
+        return self._manager or get_snowflake_manager()
+    
+    def refresh_once(self) -> Dict[str, Any]:
+        """
+        Run one refresh cycle.
+        
+        Returns:
+            Dictionary describing the cycle (mode, rows pulled/merged, duration)
+        """
+        with self._refresh_lock:
+            started = time.monotonic()
+            cycle: Dict[str, Any] = {}
+            
+            def update(snapshot: ForecastSnapshot) -> Optional[ForecastSnapshot]:
+                # Runs under the replica's load lock, so a full load can't be
+                # swapped in between reading the snapshot and replacing it
+                if self._full_refresh_due():
+                    # Picks up corrections and deletes the watermark can't see
+                    reloaded = ForecastSnapshot(self._pull_delta(None), version=snapshot.version + 1)
+                    self._last_full_refresh = time.monotonic()
+                    self._full_refreshes += 1
+                    cycle.update(
+                        mode="full",
+                        rows_pulled=len(reloaded),
+                        rows_inserted=len(reloaded),
+                        rows_updated=0,
+                        rows_dropped=max(len(snapshot) - len(reloaded), 0),
+                    )
+                    return reloaded
+                watermark_date, watermark_id = snapshot.watermark()
+                delta = self._pull_delta(watermark_date)
+                merged, inserted, updated = snapshot.merge(delta)
+                cycle.update(
+                    mode="incremental",
+                    rows_pulled=len(delta),
+                    rows_inserted=inserted,
+                    rows_updated=updated,
+                    watermark={"prediction_date": watermark_date, "id": watermark_id},
+                )
+                return merged if merged is not snapshot else None
+            
+            if self.replica.current() is None:
+                snapshot = self.replica.load()
+                self._last_full_refresh = time.monotonic()
+                cycle.update(mode="full", rows_pulled=len(snapshot), rows_inserted=len(snapshot), rows_updated=0)
+            else:
+                self.replica.apply(update)
+            
+            cycle["rows_merged"] = cycle["rows_inserted"] + cycle["rows_updated"]
+            cycle["duration_s"] = round(time.monotonic() - started, 4)
+            cycle["version"] = self.replica.current().version
+            
+            self._cycles += 1
+            self._total_rows_merged += cycle["rows_merged"]
+            self._last_refresh_at = time.time()
+            self._last_cycle = cycle
+            logger.info(
+                f"Forecast replica refresh ({cycle['mode']}): pulled {cycle['rows_pulled']}, "
+                f"merged {cycle['rows_merged']} rows in {cycle['duration_s']}s"
+            )
+            return cycle
+    
+    def _full_refresh_due(self) -> bool:
+        return bool(self.full_refresh_seconds) and (
+            time.monotonic() - self._last_full_refresh >= self.full_refresh_seconds
+        )
+    
+    def _pull_delta(self, watermark_date: Optional[str]) -> ColumnarResult:
+        """Fetch rows at or beyond the watermark date (the whole table without one)."""
+        query = f"SELECT {', '.join(FORECAST_COLUMNS)} FROM {FORECAST_TABLE}"
+        if watermark_date is None:
+            return self.manager.execute_query(query, result_format="columns", use_cache=False)
+        query += " WHERE PREDICTION_DATE >= %(watermark_date)s"
+        return self.manager.execute_query(
+            query, {"watermark_date": watermark_date}, result_format="columns", use_cache=False
+        )
+    
+    def start(self):
+        """Start periodic refreshes in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="forecast-replica-refresh", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.refresh_once()
+            except Exception as e:
+                self._failures += 1
+                logger.error(f"Forecast replica refresh failed: {str(e)}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get refresh statistics.
+        
+        Returns:
+            Dictionary with refresh lag, last-cycle details and totals
+        """
+        now = time.time()
+        snapshot = self.replica.current()
+        watermark_date = snapshot.watermark()[0] if snapshot else None
+        return {
+            "cycles": self._cycles,
+            "failures": self._failures,
+            "interval_s": self.interval_seconds,
+            "full_refresh_s": self.full_refresh_seconds,
+            "full_refreshes": self._full_refreshes,
+            "refresh_lag_s": round(now - self._last_refresh_at, 3) if self._last_refresh_at else None,
+            "watermark_prediction_date": watermark_date,
+            "last_cycle": dict(self._last_cycle),
+            "total_rows_merged": self._total_rows_merged,
+        }
+
+
 # Global connection manager instance
 _connection_manager: Optional[SnowflakeConnectionManager] = None
+_connection_manager_lock = threading.Lock()
 
 
 def get_snowflake_manager() -> SnowflakeConnectionManager:
@@ -219,10 +997,38 @@ def get_snowflake_manager() -> SnowflakeConnectionManager:
     """
     global _connection_manager
     if _connection_manager is None:
-        _connection_manager = SnowflakeConnectionManager()
+        with _connection_manager_lock:
+            if _connection_manager is None:
+                _connection_manager = SnowflakeConnectionManager()
     return _connection_manager
 
 
+_forecast_refresher: Optional[ForecastRefreshEngine] = None
+_forecast_refresher_lock = threading.Lock()
+
+
+def get_forecast_refresher() -> ForecastRefreshEngine:
+    """
+    Get or create the global forecast replica refresh engine.
+    The interval is set with FORECAST_REPLICA_REFRESH_SECONDS (default 300)
+    and the full reload interval with FORECAST_REPLICA_FULL_REFRESH_SECONDS
+    (default 3600, 0 disables it).
+    
+    Returns:
+        ForecastRefreshEngine instance
+    """
+    global _forecast_refresher
+    if _forecast_refresher is None:
+        with _forecast_refresher_lock:
+            if _forecast_refresher is None:
+                _forecast_refresher = ForecastRefreshEngine(
+                    get_forecast_replica(),
+                    interval_seconds=float(os.getenv("FORECAST_REPLICA_REFRESH_SECONDS", "300")),
+                    full_refresh_seconds=float(os.getenv("FORECAST_REPLICA_FULL_REFRESH_SECONDS", "3600"))
+                )
+    return _forecast_refresher
+
+
 def close_snowflake_connections():
     """Close all Snowflake connections."""
     global _connection_manager
@@ -0,0 +1,146 @@
+"""
+Spatial index of district areas for coordinate-based lookups.
+Resolves a latitude/longitude to the Bangladesh district containing it without
+calling a geocoding API, so coordinates from GPS or weather results can be used
+with the district-keyed yield tools.
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import shapely
+from shapely import STRtree
+from adk_app.core.gazetteer import DistrictGazetteer, get_gazetteer
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Simplified national border as (latitude, longitude) vertices, clockwise from
+# the northern tip. Accurate to a few km, so points right at the border may
+# land on the wrong side of it; every district headquarters lies inside.
+BANGLADESH_OUTLINE: List[Tuple[float, float]] = [
+    # Northern border, west to east
+    (26.63, 88.45), (26.40, 88.70), (26.22, 88.88), (26.40, 89.05), (26.25, 89.30), (26.12, 89.55),
+    (26.20, 89.70), (25.98, 89.85),
+    # Meghalaya border
+    (25.60, 89.86), (25.28, 89.90), (25.18, 90.30), (25.16, 90.90), (25.19, 91.50), (25.17, 91.85),
+    (25.14, 92.10), (24.98, 92.47),
+    # Assam and Tripura borders
+    (24.85, 92.40), (24.60, 92.25), (24.45, 92.15), (24.28, 91.95), (24.18, 91.90), (24.12, 91.62),
+    (24.05, 91.40), (23.92, 91.27), (23.80, 91.25), (23.62, 91.20), (23.45, 91.24), (23.22, 91.40),
+    (22.96, 91.70), (23.20, 91.80), (23.55, 91.88), (23.70, 92.05), (23.68, 92.30),
+    # Mizoram and Myanmar borders
+    (23.25, 92.36), (22.85, 92.55), (22.45, 92.60), (22.05, 92.68), (21.45, 92.65), (21.30, 92.60),
+    (21.45, 92.30), (20.72, 92.34),
+    # Bay of Bengal coast, east to west
+    (21.20, 92.05), (21.43, 91.96), (21.80, 91.90), (22.18, 91.83), (22.77, 91.42), (22.55, 91.35),
+    (22.05, 90.95), (21.85, 90.35), (21.78, 90.00), (21.70, 89.50), (21.63, 89.08),
+    # West Bengal border, south to north
+    (22.15, 89.05), (22.72, 88.96), (23.05, 88.88), (23.30, 88.75), (23.60, 88.58), (23.80, 88.55),
+    (24.05, 88.72), (24.30, 88.55), (24.25, 88.40), (24.50, 88.05), (24.87, 88.12), (25.05, 88.45),
+    (25.24, 88.93), (25.30, 88.78), (25.55, 88.45), (25.77, 88.15), (26.10, 88.20), (26.45, 88.30),
+]
+
+
+def haversine_km(latitude1: float, longitude1: float, latitude2: float, longitude2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(latitude1), math.radians(latitude2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(longitude2 - longitude1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class DistrictIndex:
+    """
+    Point-in-district lookup with a shapely STRtree over district areas.
+
+    Without boundary polygons, each district's area is approximated by the
+    part of the national outline closer to its headquarters than to any other
+    (a Voronoi cell clipped to the outline). Points outside the outline, e.g.
+    Kolkata or Agartala, belong to no district even when a headquarters is
+    nearby. Real boundaries can be passed as (latitude, longitude) rings per
+    district name and are used as-is.
+
+    Points are projected equirectangularly around the districts' mean
+    latitude, which keeps planar distances faithful to great-circle distance
+    at country scale. Queries are O(log n).
+    """
+
+    def __init__(
+        self,
+        gazetteer: DistrictGazetteer,
+        outline: Sequence[Tuple[float, float]] = BANGLADESH_OUTLINE,
+        boundaries: Optional[Dict[str, Sequence[Tuple[float, float]]]] = None
+    ):
+        self._entries: List[Dict[str, Any]] = [gazetteer.lookup(name) for name in gazetteer.district_names]
+        coordinates = np.array([(entry["latitude"], entry["longitude"]) for entry in self._entries])
+        self._cos_latitude = math.cos(math.radians(float(coordinates[:, 0].mean())))
+        if boundaries is not None:
+            areas = [self._polygon(boundaries[entry["name"]]) for entry in self._entries]
+        else:
+            areas = self._headquarters_cells(coordinates, self._polygon(outline))
+        self._areas = areas
+        self._tree = STRtree(areas)
+
+    def _project(self, latitude: Any, longitude: Any) -> np.ndarray:
+        return np.column_stack([np.asarray(longitude) * self._cos_latitude, np.asarray(latitude)])
+
+    def _polygon(self, ring: Sequence[Tuple[float, float]]) -> shapely.Polygon:
+        vertices = np.asarray(ring, dtype=float)
+        return shapely.Polygon(self._project(vertices[:, 0], vertices[:, 1]))
+
+    def _headquarters_cells(self, coordinates: np.ndarray, outline: shapely.Polygon) -> List[shapely.Geometry]:
+        """Voronoi cells of the headquarters clipped to the outline, in entry order."""
+        headquarters = shapely.points(self._project(coordinates[:, 0], coordinates[:, 1]))
+        if not all(outline.contains(point) for point in headquarters):
+            raise ValueError("Every district headquarters must lie inside the outline")
+        cells = shapely.get_parts(shapely.voronoi_polygons(shapely.multipoints(headquarters), extend_to=outline))
+        # Cells come back in no particular order; match each to the headquarters inside it
+        cell_tree = STRtree(cells)
+        point_indices, cell_indices = cell_tree.query(headquarters, predicate="within")
+        by_point = dict(zip(point_indices.tolist(), cell_indices.tolist()))
+        return [shapely.intersection(cells[by_point[index]], outline) for index in range(len(headquarters))]
+
+    def locate(self, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        """
+        District containing a point.
+
+        Returns:
+            Geocoding-style district entry with "distance_km" to its
+            headquarters, or None if the point is outside every district
+        """
+        return self.locate_many([(latitude, longitude)])[0]
+
+    def locate_many(self, points: List[Tuple[float, float]]) -> List[Optional[Dict[str, Any]]]:
+        """Districts containing many points in one tree query, in order."""
+        if not points:
+            return []
+        coordinates = np.asarray(points, dtype=float)
+        query = shapely.points(self._project(coordinates[:, 0], coordinates[:, 1]))
+        point_indices, district_indices = self._tree.query(query, predicate="intersects")
+        results: List[Optional[Dict[str, Any]]] = [None] * len(points)
+        for point_index, district_index in zip(point_indices, district_indices):
+            # Points on a shared edge match both districts; the first is kept
+            if results[point_index] is not None:
+                continue
+            entry = self._entries[district_index]
+            latitude, longitude = points[point_index]
+            distance = haversine_km(latitude, longitude, entry["latitude"], entry["longitude"])
+            results[point_index] = {**entry, "distance_km": round(distance, 1)}
+        return results
+
+
+# Global district index
+_district_index: Optional[DistrictIndex] = None
+
+
+def get_district_index() -> DistrictIndex:
+    """
+    Get or create the global district index.
+
+    Returns:
+        DistrictIndex instance
+    """
+    global _district_index
+    if _district_index is None:
+        _district_index = DistrictIndex(get_gazetteer())
+    return _district_index
@@ -0,0 +1,232 @@
+"""
+Fuzzy resolution of user-supplied names to canonical database values.
+Maps spellings such as "Chattogram", "Cox Bazar" or "HYV aman" to the exact
+DISTRICT_NAME / CROP_TYPE values so forecast lookups can use equality predicates.
+"""
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+# Equivalent spellings of Bangladesh district names (official 2018 renames,
+# common transliterations). Whichever spelling the catalog holds becomes the
+# canonical value for the whole group.
+DISTRICT_SPELLINGS: List[Sequence[str]] = [
+    ("Chittagong", "Chattogram", "Ctg"),
+    ("Comilla", "Cumilla"),
+    ("Barisal", "Barishal"),
+    ("Jessore", "Jashore"),
+    ("Bogra", "Bogura"),
+    ("Cox's Bazar", "Coxs Bazar", "Cox Bazar", "Coxsbazar"),
+    ("Jhalokati", "Jhalakathi", "Jhalokathi", "Jhalakati"),
+    ("Chapai Nawabganj", "Chapainawabganj", "Nawabganj", "Chapai"),
+    ("Netrokona", "Netrakona"),
+    ("Moulvibazar", "Maulvibazar", "Moulvi Bazar"),
+    ("Brahmanbaria", "Brahamanbaria", "B. Baria"),
+    ("Narsingdi", "Narshingdi"),
+    ("Sirajganj", "Sirajgonj"),
+    ("Lakshmipur", "Laxmipur", "Lakshipur"),
+    ("Panchagarh", "Panchagar"),
+    ("Khagrachhari", "Khagrachari"),
+    ("Habiganj", "Hobiganj"),
+    ("Jhenaidah", "Jhenaidaha", "Jhenidah"),
+    ("Kishoreganj", "Kishorganj"),
+    ("Mymensingh", "Maymansingh"),
+    ("Joypurhat", "Jaipurhat"),
+    ("Bandarban", "Bandarbans"),
+    ("Munshiganj", "Munsiganj"),
+    ("Gopalganj", "Gopalgonj"),
+]
+
+# Abbreviations used in CROP_TYPE values, expanded before matching so that
+# "HYV Aman" and "High Yielding Variety (HYV) Aman" normalize to the same key
+CROP_TYPE_ABBREVIATIONS: Dict[str, str] = {
+    "hyv": "high yielding variety",
+    "lt": "local transplanted",
+}
+
+# Words that qualify a name without being part of it
+_NOISE_WORDS = {"district", "zila", "zilla", "jela", "rice"}
+
+
+def normalize(text: str, abbreviations: Optional[Dict[str, str]] = None) -> str:
+    """
+    Normalize a name for matching.
+
+    Lowercases, drops apostrophes and dots ("Cox's" -> "coxs", "L.T" -> "lt"),
+    turns other punctuation into spaces, expands abbreviations and removes
+    noise words and repeated tokens.
+    """
+    text = re.sub(r"['’.]", "", text.lower())
+    words = re.sub(r"[^a-z0-9]+", " ", text).split()
+    if abbreviations:
+        words = " ".join(abbreviations.get(word, word) for word in words).split()
+
+    tokens: List[str] = []
+    for word in words:
+        if word not in tokens:
+            tokens.append(word)
+    # Noise words are only dropped when something else is left
+    kept = [t for t in tokens if t not in _NOISE_WORDS]
+    return " ".join(kept or tokens)
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of each word, padded so word boundaries count."""
+    grams: Set[str] = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class Resolution:
+    """Outcome of resolving one name."""
+
+    __slots__ = ("query", "value", "score", "method", "candidates")
+
+    def __init__(
+        self,
+        query: str,
+        value: Optional[str],
+        score: float,
+        method: str,
+        candidates: Optional[List[str]] = None
+    ):
+        self.query = query
+        self.value = value
+        self.score = score
+        self.method = method
+        self.candidates = candidates or []
+
+    @property
+    def resolved(self) -> bool:
+        return self.value is not None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "input": self.query,
+            "matched": self.value,
+            "method": self.method,
+            "score": round(self.score, 3),
+        }
+
+
+class EntityResolver:
+    """
+    Resolves free-text names against a fixed set of canonical values.
+
+    Lookup order:
+    1. exact match on the normalized name
+    2. alias table
+    3. fuzzy match: candidates sharing trigrams are ranked by trigram overlap,
+       then the best few are scored by edit-distance similarity
+
+    A fuzzy match is only accepted above min_score and when it is clearly
+    better than the runner-up, so ambiguous input stays unresolved.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        aliases: Optional[Dict[str, str]] = None,
+        abbreviations: Optional[Dict[str, str]] = None,
+        min_score: float = 0.8,
+        min_margin: float = 0.05,
+        shortlist: int = 5
+    ):
+        self.abbreviations = abbreviations
+        self.min_score = min_score
+        self.min_margin = min_margin
+        self.shortlist = shortlist
+
+        self._names: Dict[str, str] = {}
+        for name in names:
+            if name:
+                self._names.setdefault(self._key(name), name)
+
+        # Aliases only count when they point at a value that actually exists
+        self._aliases: Dict[str, str] = {}
+        for alias, target in (aliases or {}).items():
+            canonical = self._names.get(self._key(target))
+            if canonical is not None:
+                self._aliases.setdefault(self._key(alias), canonical)
+
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        self._trigrams: Dict[str, Set[str]] = {}
+        for key in self._names:
+            grams = trigrams(key)
+            self._trigrams[key] = grams
+            for gram in grams:
+                self._trigram_index[gram].add(key)
+
+    @classmethod
+    def for_districts(cls, names: Iterable[str], **kwargs) -> "EntityResolver":
+        """Resolver over district names with the known alternate spellings as aliases."""
+        names = list(names)
+        aliases: Dict[str, str] = {}
+        keys = {normalize(name): name for name in names if name}
+        for group in DISTRICT_SPELLINGS:
+            canonical = next((keys[normalize(s)] for s in group if normalize(s) in keys), None)
+            if canonical is not None:
+                for spelling in group:
+                    aliases[spelling] = canonical
+        return cls(names, aliases=aliases, **kwargs)
+
+    @classmethod
+    def for_crop_types(cls, names: Iterable[str], **kwargs) -> "EntityResolver":
+        """Resolver over CROP_TYPE values with their abbreviations expanded."""
+        return cls(names, abbreviations=CROP_TYPE_ABBREVIATIONS, **kwargs)
+
+    def _key(self, text: str) -> str:
+        return normalize(text, self.abbreviations)
+
+    def resolve(self, text: Optional[str]) -> Resolution:
+        """
+        Resolve text to a canonical name.
+
+        Returns:
+            Resolution; value is None when nothing matches confidently, and
+            candidates then lists the closest names as suggestions
+        """
+        query = text or ""
+        key = self._key(query)
+        if not key:
+            return Resolution(query, None, 0.0, "none")
+
+        if key in self._names:
+            return Resolution(query, self._names[key], 1.0, "exact")
+        if key in self._aliases:
+            return Resolution(query, self._aliases[key], 1.0, "alias")
+
+        ranked = self._rank(key)
+        if not ranked:
+            return Resolution(query, None, 0.0, "none")
+
+        best_key, best_score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        suggestions = [self._names[k] for k, _ in ranked[:3]]
+        if best_score >= self.min_score and best_score - runner_up >= self.min_margin:
+            return Resolution(query, self._names[best_key], best_score, "fuzzy", suggestions)
+        return Resolution(query, None, best_score, "none", suggestions)
+
+    def _rank(self, key: str) -> List[tuple]:
+        """Score names sharing trigrams with key, best first."""
+        grams = trigrams(key)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in grams:
+            for candidate in self._trigram_index.get(gram, ()):
+                shared[candidate] += 1
+        if not shared:
+            return []
+
+        # Dice coefficient on trigrams picks the shortlist cheaply
+        dice = {
+            candidate: 2 * count / (len(grams) + len(self._trigrams[candidate]))
+            for candidate, count in shared.items()
+        }
+        shortlist = sorted(dice, key=dice.get, reverse=True)[:self.shortlist]
+
+        scored = [(candidate, SequenceMatcher(None, key, candidate).ratio()) for candidate in shortlist]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored
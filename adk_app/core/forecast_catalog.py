@@ -0,0 +1,203 @@
+"""
+Discovery catalog for the yield forecast table.
+Varieties, districts and years with their forecast counts, fetched in a
+single GROUPING SETS query and cached as one versioned object.
+"""
+import hashlib
+import threading
+import time
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Tuple
+from adk_app.core.columnar import ColumnarResult
+from adk_app.core.entity_resolver import EntityResolver
+from adk_app.core.forecast_replica import FORECAST_TABLE, ForecastSnapshot
+
+CATALOG_QUERY = f"""
+SELECT
+    CROP_TYPE,
+    DISTRICT_NAME,
+    FORECAST_YEAR,
+    COUNT(*) AS FORECAST_COUNT,
+    GROUPING(CROP_TYPE) AS GROUPED_CROP_TYPE,
+    GROUPING(DISTRICT_NAME) AS GROUPED_DISTRICT_NAME,
+    GROUPING(FORECAST_YEAR) AS GROUPED_FORECAST_YEAR
+FROM {FORECAST_TABLE}
+GROUP BY GROUPING SETS ((CROP_TYPE), (DISTRICT_NAME), (FORECAST_YEAR), ())
+"""
+
+
+class ForecastCatalog:
+    """
+    Immutable catalog of valid forecast lookup values.
+
+    The version is a short hash of the catalog contents, so it only changes
+    when the set of varieties, districts, years or their counts changes.
+    Name resolvers are built lazily per catalog, so they follow catalog refreshes.
+    """
+
+    def __init__(
+        self,
+        crop_types: Dict[str, int],
+        districts: Dict[str, int],
+        years: Dict[int, int],
+        total_forecasts: int,
+        snapshot_version: Optional[int] = None
+    ):
+        # NULL values are not valid lookup values, so they are left out
+        self._crop_types = sorted(
+            ((k, v) for k, v in crop_types.items() if k is not None), key=lambda item: (-item[1], item[0])
+        )
+        self._districts = sorted((k, v) for k, v in districts.items() if k is not None)
+        self._years = sorted(((k, v) for k, v in years.items() if k is not None), reverse=True)
+        self.total_forecasts = total_forecasts
+        self.snapshot_version = snapshot_version
+        self.built_at = time.time()
+
+        digest = hashlib.sha1(
+            repr((self._crop_types, self._districts, self._years, total_forecasts)).encode("utf-8")
+        )
+        self.version = digest.hexdigest()[:12]
+
+    @classmethod
+    def from_grouping_sets(cls, result: ColumnarResult) -> "ForecastCatalog":
+        """Build the catalog from the rows of CATALOG_QUERY."""
+        crop_types: Dict[str, int] = {}
+        districts: Dict[str, int] = {}
+        years: Dict[int, int] = {}
+        total = 0
+
+        rows = zip(
+            result.column("crop_type"),
+            result.column("district_name"),
+            result.column("forecast_year"),
+            result.column("forecast_count"),
+            result.column("grouped_crop_type"),
+            result.column("grouped_district_name"),
+            result.column("grouped_forecast_year"),
+        )
+        for crop_type, district, year, count, g_crop, g_district, g_year in rows:
+            # GROUPING(x) is 0 for the set that groups by x, 1 where x is rolled up
+            if not g_crop:
+                crop_types[crop_type] = count
+            elif not g_district:
+                districts[district] = count
+            elif not g_year:
+                years[year] = count
+            else:
+                total = count
+        return cls(crop_types, districts, years, total)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ForecastSnapshot) -> "ForecastCatalog":
+        """Build the catalog from the in-memory forecast replica."""
+        return cls(
+            snapshot.counts("crop_type"),
+            snapshot.counts("district_name"),
+            snapshot.counts("forecast_year"),
+            len(snapshot),
+            snapshot_version=snapshot.version,
+        )
+
+    @property
+    def crop_type_names(self) -> List[str]:
+        return [name for name, _ in self._crop_types]
+
+    @property
+    def district_names(self) -> List[str]:
+        return [name for name, _ in self._districts]
+
+    @property
+    def forecast_years(self) -> List[int]:
+        return [year for year, _ in self._years]
+
+    @cached_property
+    def district_resolver(self) -> EntityResolver:
+        """Fuzzy resolver mapping user input to DISTRICT_NAME values."""
+        return EntityResolver.for_districts(self.district_names)
+
+    @cached_property
+    def crop_type_resolver(self) -> EntityResolver:
+        """Fuzzy resolver mapping user input to CROP_TYPE values."""
+        return EntityResolver.for_crop_types(self.crop_type_names)
+
+    @staticmethod
+    def _as_columns(entries: List[Tuple[Any, int]], key: str) -> ColumnarResult:
+        return ColumnarResult({
+            key: [value for value, _ in entries],
+            "forecast_count": [count for _, count in entries],
+        })
+
+    def crop_types(self) -> ColumnarResult:
+        """Varieties ordered by forecast count, then name."""
+        return self._as_columns(self._crop_types, "crop_type")
+
+    def districts(self) -> ColumnarResult:
+        """Districts ordered by name."""
+        return self._as_columns(self._districts, "district_name")
+
+    def years(self) -> ColumnarResult:
+        """Forecast years, newest first."""
+        return self._as_columns(self._years, "forecast_year")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the catalog for tool responses."""
+        return {
+            "version": self.version,
+            "total_forecasts": self.total_forecasts,
+            "crop_types": self.crop_types().to_records(),
+            "districts": self.districts().to_records(),
+            "years": self.years().to_records(),
+        }
+
+
+class ForecastCatalogStore:
+    """
+    Holds the current catalog for ttl_seconds.
+
+    When the replica is in use, a catalog built from an older snapshot is
+    treated as stale regardless of its age.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600.0):
+        self.ttl_seconds = ttl_seconds
+        self._catalog: Optional[ForecastCatalog] = None
+        self._lock = threading.Lock()
+
+    def get(self, snapshot: Optional[ForecastSnapshot] = None) -> Optional[ForecastCatalog]:
+        """Current catalog, or None if missing or stale."""
+        catalog = self._catalog
+        if catalog is None:
+            return None
+        if time.time() - catalog.built_at > self.ttl_seconds:
+            return None
+        if snapshot is not None and catalog.snapshot_version != snapshot.version:
+            return None
+        return catalog
+
+    def put(self, catalog: ForecastCatalog):
+        with self._lock:
+            self._catalog = catalog
+
+    def invalidate(self):
+        with self._lock:
+            self._catalog = None
+
+
+# Global catalog store
+_catalog_store: Optional[ForecastCatalogStore] = None
+_catalog_store_lock = threading.Lock()
+
+
+def get_catalog_store() -> ForecastCatalogStore:
+    """
+    Get or create the global forecast catalog store.
+
+    Returns:
+        ForecastCatalogStore instance
+    """
+    global _catalog_store
+    if _catalog_store is None:
+        with _catalog_store_lock:
+            if _catalog_store is None:
+                _catalog_store = ForecastCatalogStore()
+    return _catalog_store
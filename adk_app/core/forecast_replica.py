@@ -0,0 +1,359 @@
+"""
+In-process replica of the yield forecast table.
+Keeps STG_ML_YIELD_FORECASTS in memory with hash indexes so the forecast
+tools can be answered locally; Snowflake is only used to refresh it.
+"""
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from adk_app.core.columnar import ColumnarResult
+
+logger = logging.getLogger(__name__)
+
+FORECAST_TABLE = "DEV_DATA_ML_DB.DATA_ML_SCHEMA.STG_ML_YIELD_FORECASTS"
+
+FORECAST_COLUMNS = [
+    "ID",
+    "DISTRICT_NAME",
+    "CROP_TYPE",
+    "FORECAST_YEAR",
+    "PREDICTED_YIELD",
+    "CONFIDENCE_LOWER",
+    "CONFIDENCE_UPPER",
+    "MODEL_USED",
+    "PREDICTION_DATE",
+]
+
+
+def _descending(values: List[Any], positions: List[int]) -> List[int]:
+    """Order row positions by a column, descending, with NULLs last (Snowflake default)."""
+    present = [i for i in positions if values[i] is not None]
+    missing = [i for i in positions if values[i] is None]
+    present.sort(key=values.__getitem__, reverse=True)
+    return present + missing
+
+
+class ForecastSnapshot:
+    """
+    Immutable, indexed copy of the forecast table.
+
+    Indexes (all keyed on lowercased text):
+    - (district, year) -> row positions
+    - variety (CROP_TYPE) -> row positions
+    Snapshots are never mutated after construction, so readers can use one
+    without locking while a newer snapshot is being built.
+    """
+
+    def __init__(self, table: ColumnarResult, version: int = 1):
+        self.table = table
+        self.version = version
+        self.loaded_at = time.time()
+
+        districts = table.column("district_name")
+        varieties = table.column("crop_type")
+        years = table.column("forecast_year")
+
+        by_district_year: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        by_variety: Dict[str, List[int]] = defaultdict(list)
+        for position, (district, variety, year) in enumerate(zip(districts, varieties, years)):
+            by_district_year[((district or "").lower(), year)].append(position)
+            by_variety[(variety or "").lower()].append(position)
+
+        self._by_district_year = dict(by_district_year)
+        self._by_variety = dict(by_variety)
+        # Latest-first ordering used by get_latest_yield_forecasts
+        self._latest_order = self._order_latest(range(len(table)))
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def _order_latest(self, positions) -> List[int]:
+        """Order positions by PREDICTION_DATE DESC, FORECAST_YEAR DESC."""
+        ordered = _descending(self.table.column("forecast_year"), list(positions))
+        return _descending(self.table.column("prediction_date"), ordered)
+
+    def _variety_positions(self, variety: str) -> set:
+        """Row positions whose CROP_TYPE contains the given text (LIKE '%x%')."""
+        needle = variety.lower()
+        positions = set()
+        for name, rows in self._by_variety.items():
+            if needle in name:
+                positions.update(rows)
+        return positions
+
+    def forecasts(
+        self,
+        yield_variety: str,
+        district: str,
+        forecast_year: int,
+        limit: int,
+        exact_variety: bool = False
+    ) -> ColumnarResult:
+        """
+        Equivalent of the get_yield_forecast_from_db query.
+        With exact_variety the variety must equal CROP_TYPE instead of containing it.
+        """
+        bucket = self._by_district_year.get((district.lower(), int(forecast_year)), [])
+        if exact_variety:
+            wanted = set(self._by_variety.get(yield_variety.lower(), ()))
+        else:
+            wanted = self._variety_positions(yield_variety)
+        matches = [i for i in bucket if i in wanted]
+        ordered = _descending(self.table.column("prediction_date"), matches)
+        return self.table.take(ordered[:max(limit, 0)])
+
+    def latest(self, limit: int) -> ColumnarResult:
+        """Equivalent of the get_latest_yield_forecasts query."""
+        return self.table.take(self._latest_order[:max(limit, 0)])
+
+    def summary(self, crop_type: Optional[str] = None, district: Optional[str] = None) -> ColumnarResult:
+        """Equivalent of the get_yield_forecast_summary GROUP BY query."""
+        varieties = self.table.column("crop_type")
+        districts = self.table.column("district_name")
+        years = self.table.column("forecast_year")
+        yields = self.table.column("predicted_yield")
+        dates = self.table.column("prediction_date")
+
+        positions = range(len(self.table))
+        if crop_type:
+            wanted = self._variety_positions(crop_type)
+            positions = [i for i in positions if i in wanted]
+        if district:
+            needle = district.lower()
+            positions = [i for i in positions if needle in (districts[i] or "").lower()]
+
+        groups: Dict[Tuple[Any, Any, Any], List[int]] = defaultdict(list)
+        for i in positions:
+            groups[(varieties[i], districts[i], years[i])].append(i)
+
+        ordered = sorted(groups.items(), key=lambda item: len(item[1]), reverse=True)
+        columns: Dict[str, List[Any]] = {
+            "crop_type": [], "district_name": [], "forecast_year": [],
+            "forecast_count": [], "avg_predicted_yield": [], "min_predicted_yield": [],
+            "max_predicted_yield": [], "latest_prediction_date": [],
+        }
+        for (variety, district_name, year), rows in ordered:
+            values = [yields[i] for i in rows if yields[i] is not None]
+            row_dates = [dates[i] for i in rows if dates[i] is not None]
+            columns["crop_type"].append(variety)
+            columns["district_name"].append(district_name)
+            columns["forecast_year"].append(year)
+            columns["forecast_count"].append(len(rows))
+            columns["avg_predicted_yield"].append(sum(values) / len(values) if values else None)
+            columns["min_predicted_yield"].append(min(values) if values else None)
+            columns["max_predicted_yield"].append(max(values) if values else None)
+            columns["latest_prediction_date"].append(max(row_dates) if row_dates else None)
+        return ColumnarResult(columns)
+
+    def watermark(self) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Highest (PREDICTION_DATE, ID) pair held by the snapshot.
+
+        Returns:
+            Tuple of (max prediction date, max ID on that date), or (None, None) if empty
+        """
+        dates = self.table.column("prediction_date")
+        ids = self.table.column("id")
+        max_date = max((d for d in dates if d is not None), default=None)
+        if max_date is None:
+            return None, max((i for i in ids if i is not None), default=None)
+        max_id = max((i for d, i in zip(dates, ids) if d == max_date and i is not None), default=None)
+        return max_date, max_id
+
+    def merge(self, delta: ColumnarResult) -> Tuple["ForecastSnapshot", int, int]:
+        """
+        Upsert changed rows by ID into a copy of this snapshot (copy-on-write).
+
+        The current snapshot is left untouched, so readers holding it keep a
+        consistent view while the merged snapshot is built.
+
+        Args:
+            delta: Rows pulled since the last refresh, with the same columns
+
+        Returns:
+            Tuple of (new snapshot, rows inserted, rows updated)
+        """
+        columns = {name: list(values) for name, values in self.table.columns.items()}
+        position_by_id = {row_id: position for position, row_id in enumerate(columns["id"])}
+        inserted = updated = 0
+
+        for row in delta.to_records():
+            position = position_by_id.get(row["id"])
+            if position is None:
+                position_by_id[row["id"]] = len(columns["id"])
+                for name, values in columns.items():
+                    values.append(row.get(name))
+                inserted += 1
+            elif any(columns[name][position] != row.get(name) for name in columns):
+                for name, values in columns.items():
+                    values[position] = row.get(name)
+                updated += 1
+
+        if not inserted and not updated:
+            return self, 0, 0
+        return ForecastSnapshot(ColumnarResult(columns), version=self.version + 1), inserted, updated
+
+    def counts(self, column: str) -> Dict[Any, int]:
+        """Row counts per distinct value of a column."""
+        counts: Dict[Any, int] = defaultdict(int)
+        for value in self.table.column(column):
+            counts[value] += 1
+        return dict(counts)
+
+
+class ForecastReplica:
+    """
+    Holder for the current forecast snapshot.
+
+    The snapshot reference is swapped atomically on reload, so tool calls
+    always read a complete, consistent table.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._snapshot: Optional[ForecastSnapshot] = None
+        self._load_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._loading = False
+
+    def load(self) -> ForecastSnapshot:
+        """
+        Load the full forecast table from Snowflake and swap it in.
+
+        Returns:
+            The newly loaded snapshot
+        """
+        # Imported here to avoid a circular import with the database module
+        from adk_app.core.database import get_snowflake_manager
+
+        with self._load_lock:
+            query = f"SELECT {', '.join(FORECAST_COLUMNS)} FROM {FORECAST_TABLE}"
+            started = time.monotonic()
+            table = get_snowflake_manager().execute_query(query, result_format="columns", use_cache=False)
+            version = self._snapshot.version + 1 if self._snapshot else 1
+            snapshot = ForecastSnapshot(table, version=version)
+            self._snapshot = snapshot
+            logger.info(
+                f"Loaded forecast replica v{version}: {len(snapshot)} rows "
+                f"in {time.monotonic() - started:.2f}s"
+            )
+            return snapshot
+
+    def swap(self, snapshot: ForecastSnapshot):
+        """Atomically replace the current snapshot."""
+        self._snapshot = snapshot
+
+    def apply(
+        self,
+        update: Callable[[Optional[ForecastSnapshot]], Optional[ForecastSnapshot]]
+    ) -> Optional[ForecastSnapshot]:
+        """
+        Replace the snapshot with update(current snapshot) under the load lock.
+
+        No full load can be swapped in between reading the snapshot and
+        replacing it, so an update built from an older snapshot never
+        overwrites a newer one. update returns None to keep the current one.
+
+        Returns:
+            The snapshot in place afterwards
+        """
+        with self._load_lock:
+            snapshot = update(self._snapshot)
+            if snapshot is not None:
+                self._snapshot = snapshot
+            return self._snapshot
+
+    def current(self) -> Optional[ForecastSnapshot]:
+        """Current snapshot without triggering a load (None if not loaded)."""
+        return self._snapshot
+
+    def load_in_background(self):
+        """Start loading the replica in a daemon thread if not already loading."""
+        with self._state_lock:
+            if self._loading:
+                return
+            self._loading = True
+
+        def run():
+            try:
+                self.load()
+            except Exception as e:
+                logger.error(f"Failed to load forecast replica: {str(e)}")
+            finally:
+                self._loading = False
+
+        threading.Thread(target=run, name="forecast-replica-load", daemon=True).start()
+
+    def snapshot(self) -> Optional[ForecastSnapshot]:
+        """
+        Get the current snapshot.
+
+        Returns None when replica mode is disabled or the first load has not
+        finished yet (in which case a background load is started), so callers
+        fall back to querying Snowflake.
+        """
+        if not self.enabled:
+            return None
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.load_in_background()
+        return snapshot
+
+    def stats(self) -> Dict[str, Any]:
+        """Get replica status information."""
+        snapshot = self._snapshot
+        return {
+            "enabled": self.enabled,
+            "loaded": snapshot is not None,
+            "version": snapshot.version if snapshot else None,
+            "rows": len(snapshot) if snapshot else 0,
+            "loaded_at": snapshot.loaded_at if snapshot else None,
+        }
+
+
+# Global replica instance
+_forecast_replica: Optional[ForecastReplica] = None
+_forecast_replica_lock = threading.Lock()
+
+
+def get_forecast_replica() -> ForecastReplica:
+    """
+    Get or create the global forecast replica.
+    Replica mode is enabled with FORECAST_REPLICA_ENABLED=true.
+
+    Returns:
+        ForecastReplica instance
+    """
+    global _forecast_replica
+    if _forecast_replica is None:
+        with _forecast_replica_lock:
+            if _forecast_replica is None:
+                enabled = os.getenv("FORECAST_REPLICA_ENABLED", "false").lower() in ("1", "true", "yes")
+                _forecast_replica = ForecastReplica(enabled=enabled)
+    return _forecast_replica
+
+
+def start_forecast_replica() -> ForecastReplica:
+    """
+    Load the replica at application startup when replica mode is enabled,
+    then start its incremental background refresh.
+    Failures are logged and tools keep querying Snowflake directly.
+
+    Returns:
+        ForecastReplica instance
+    """
+    # Imported here to avoid a circular import with the database module
+    from adk_app.core.database import get_forecast_refresher
+
+    replica = get_forecast_replica()
+    if replica.enabled:
+        refresher = get_forecast_refresher()
+        try:
+            refresher.refresh_once()
+        except Exception as e:
+            logger.error(f"Forecast replica startup load failed: {str(e)}")
+        refresher.start()
+    return replica
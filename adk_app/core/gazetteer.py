@@ -0,0 +1,177 @@
+"""
+Offline gazetteer of Bangladesh's 64 districts.
+Resolves district names and their alternate spellings to coordinates without
+calling a geocoding API.
+"""
+import re
+from typing import Dict, Any, List, Optional, Tuple
+from adk_app.core.entity_resolver import EntityResolver
+
+# (district, division, latitude, longitude) of each district headquarters
+BANGLADESH_DISTRICTS: List[Tuple[str, str, float, float]] = [
+    # Dhaka division
+    ("Dhaka", "Dhaka", 23.8103, 90.4125),
+    ("Faridpur", "Dhaka", 23.6070, 89.8429),
+    ("Gazipur", "Dhaka", 23.9999, 90.4203),
+    ("Gopalganj", "Dhaka", 23.0050, 89.8266),
+    ("Kishoreganj", "Dhaka", 24.4449, 90.7766),
+    ("Madaripur", "Dhaka", 23.1641, 90.1897),
+    ("Manikganj", "Dhaka", 23.8617, 90.0003),
+    ("Munshiganj", "Dhaka", 23.5422, 90.5305),
+    ("Narayanganj", "Dhaka", 23.6238, 90.5000),
+    ("Narsingdi", "Dhaka", 23.9322, 90.7151),
+    ("Rajbari", "Dhaka", 23.7574, 89.6445),
+    ("Shariatpur", "Dhaka", 23.2423, 90.4348),
+    ("Tangail", "Dhaka", 24.2513, 89.9167),
+    # Mymensingh division
+    ("Mymensingh", "Mymensingh", 24.7471, 90.4203),
+    ("Jamalpur", "Mymensingh", 24.9375, 89.9378),
+    ("Netrokona", "Mymensingh", 24.8709, 90.7279),
+    ("Sherpur", "Mymensingh", 25.0205, 90.0153),
+    # Chittagong division
+    ("Chittagong", "Chittagong", 22.3569, 91.7832),
+    ("Bandarban", "Chittagong", 22.1953, 92.2184),
+    ("Brahmanbaria", "Chittagong", 23.9571, 91.1115),
+    ("Chandpur", "Chittagong", 23.2333, 90.6713),
+    ("Comilla", "Chittagong", 23.4607, 91.1809),
+    ("Cox's Bazar", "Chittagong", 21.4272, 92.0058),
+    ("Feni", "Chittagong", 23.0159, 91.3976),
+    ("Khagrachhari", "Chittagong", 23.1193, 91.9847),
+    ("Lakshmipur", "Chittagong", 22.9447, 90.8282),
+    ("Noakhali", "Chittagong", 22.8696, 91.0995),
+    ("Rangamati", "Chittagong", 22.6533, 92.1789),
+    # Rajshahi division
+    ("Rajshahi", "Rajshahi", 24.3745, 88.6042),
+    ("Bogra", "Rajshahi", 24.8465, 89.3773),
+    ("Chapai Nawabganj", "Rajshahi", 24.5965, 88.2776),
+    ("Joypurhat", "Rajshahi", 25.0968, 89.0227),
+    ("Naogaon", "Rajshahi", 24.7936, 88.9318),
+    ("Natore", "Rajshahi", 24.4206, 89.0003),
+    ("Pabna", "Rajshahi", 24.0064, 89.2372),
+    ("Sirajganj", "Rajshahi", 24.4534, 89.7007),
+    # Rangpur division
+    ("Rangpur", "Rangpur", 25.7439, 89.2752),
+    ("Dinajpur", "Rangpur", 25.6217, 88.6355),
+    ("Gaibandha", "Rangpur", 25.3288, 89.5286),
+    ("Kurigram", "Rangpur", 25.8054, 89.6362),
+    ("Lalmonirhat", "Rangpur", 25.9923, 89.2847),
+    ("Nilphamari", "Rangpur", 25.9310, 88.8560),
+    ("Panchagarh", "Rangpur", 26.3411, 88.5542),
+    ("Thakurgaon", "Rangpur", 26.0336, 88.4616),
+    # Khulna division
+    ("Khulna", "Khulna", 22.8456, 89.5403),
+    ("Bagerhat", "Khulna", 22.6516, 89.7859),
+    ("Chuadanga", "Khulna", 23.6402, 88.8418),
+    ("Jessore", "Khulna", 23.1664, 89.2081),
+    ("Jhenaidah", "Khulna", 23.5448, 89.1726),
+    ("Kushtia", "Khulna", 23.9013, 89.1204),
+    ("Magura", "Khulna", 23.4855, 89.4198),
+    ("Meherpur", "Khulna", 23.7622, 88.6318),
+    ("Narail", "Khulna", 23.1725, 89.5127),
+    ("Satkhira", "Khulna", 22.7185, 89.0705),
+    # Barisal division
+    ("Barisal", "Barisal", 22.7010, 90.3535),
+    ("Barguna", "Barisal", 22.1591, 90.1262),
+    ("Bhola", "Barisal", 22.6859, 90.6482),
+    ("Jhalokati", "Barisal", 22.6406, 90.1987),
+    ("Patuakhali", "Barisal", 22.3596, 90.3299),
+    ("Pirojpur", "Barisal", 22.5841, 89.9720),
+    # Sylhet division
+    ("Sylhet", "Sylhet", 24.8949, 91.8687),
+    ("Habiganj", "Sylhet", 24.3840, 91.4169),
+    ("Moulvibazar", "Sylhet", 24.4829, 91.7774),
+    ("Sunamganj", "Sylhet", 25.0715, 91.3992),
+]
+
+# Trailing qualifiers that don't change which district is meant
+_COUNTRY_SUFFIX = re.compile(r"\s*,?\s*\b(bangladesh|bd)\s*$", re.IGNORECASE)
+_PLACE_SUFFIX = re.compile(r"\s+(city|sadar|town|division)\s*$", re.IGNORECASE)
+_DIVISION = re.compile(r"^(.+?)\s+division$", re.IGNORECASE)
+
+
+class DistrictGazetteer:
+    """
+    Lookup of district coordinates by name.
+
+    Names go through the same resolver as forecast lookups, so official
+    renames ("Chattogram", "Bogura") resolve offline. Close typos resolve
+    only when the place is qualified with Bangladesh, since a near miss is
+    often a real place elsewhere ("Ghazipur" is a district in India).
+    Results have the shape of an Open-Meteo geocoding result.
+    """
+
+    def __init__(self, districts: List[Tuple[str, str, float, float]] = BANGLADESH_DISTRICTS):
+        self._entries: Dict[str, Dict[str, Any]] = {
+            name: {
+                "name": name,
+                "latitude": latitude,
+                "longitude": longitude,
+                "country": "Bangladesh",
+                "country_code": "BD",
+                "admin1": f"{division} Division",
+            }
+            for name, division, latitude, longitude in districts
+        }
+        # Stricter than forecast lookups: input here can be any place in the world
+        self._resolver = EntityResolver.for_districts(list(self._entries), min_score=0.9)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def district_names(self) -> List[str]:
+        return list(self._entries)
+
+    def lookup(self, location: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a district by name.
+
+        Accepts qualified names such as "Dhaka, Bangladesh" or "Rangpur city".
+
+        Returns:
+            Copy of the geocoding-style entry, or None if the place isn't a known district
+        """
+        name = _COUNTRY_SUFFIX.sub("", location.strip())
+        in_bangladesh = name != location.strip()
+        name = _PLACE_SUFFIX.sub("", name)
+        match = self._resolver.resolve(name)
+        if not match.resolved or (match.method == "fuzzy" and not in_bangladesh):
+            return None
+        return dict(self._entries[match.value])
+
+    def division_districts(self, location: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        All districts of a division named like "Rajshahi division".
+
+        Divisions are named after their headquarters district, so the
+        division name goes through the district resolver as well.
+
+        Returns:
+            Geocoding-style entries of the division's districts, or None if
+            location doesn't name a division
+        """
+        match = _DIVISION.match(_COUNTRY_SUFFIX.sub("", location.strip()))
+        if not match:
+            return None
+        headquarters = self._resolver.resolve(match.group(1))
+        if not headquarters.resolved:
+            return None
+        division = self._entries[headquarters.value]["admin1"]
+        return [dict(entry) for entry in self._entries.values() if entry["admin1"] == division]
+
+
+# Global gazetteer instance
+_gazetteer: Optional[DistrictGazetteer] = None
+
+
+def get_gazetteer() -> DistrictGazetteer:
+    """
+    Get or create the global district gazetteer.
+
+    Returns:
+        DistrictGazetteer instance
+    """
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = DistrictGazetteer()
+    return _gazetteer
@@ -0,0 +1,318 @@
+"""
+Location geocoding with offline and cached lookups.
+Known Bangladesh districts come from the bundled gazetteer; other places are
+geocoded through Open-Meteo once and cached in memory and on disk.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from adk_app.core.cache import TTLCache
+from adk_app.core.district_index import DistrictIndex, get_district_index
+from adk_app.core.gazetteer import DistrictGazetteer, get_gazetteer
+from adk_app.core.http_client import get_async_http_client, get_http_client
+
+logger = logging.getLogger(__name__)
+
+GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+
+
+# Coordinates given as a location, e.g. "23.81, 90.41" or "23.81 90.41"
+_COORDINATES = re.compile(r"^\s*(-?\d{1,2}(?:\.\d+)?)\s*[,\s]\s*(-?\d{1,3}(?:\.\d+)?)\s*$")
+
+
+def _search_params(location: str) -> Dict[str, Any]:
+    return {"name": location, "count": 1, "language": "en", "format": "json"}
+
+# Place coordinates practically never change; misses are kept shorter in case
+# the geocoding service adds the place or the lookup failed transiently
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_NEGATIVE_TTL_SECONDS = 24 * 3600
+
+
+def _cache_key(location: str) -> str:
+    return " ".join(location.lower().split())
+
+
+class GeocodingCache:
+    """
+    Two-level geocoding cache: an in-memory LRU in front of a JSON file.
+
+    Not-found results are cached too (as None) with a shorter TTL. The file
+    is rewritten atomically on every new entry, which is fine for the small
+    number of distinct places users ask about.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        max_bytes: int = 1024 * 1024
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._memory = TTLCache(max_bytes=max_bytes, default_ttl=ttl_seconds, name="geocoding")
+        # key -> {"value": result or None, "expires_at": epoch seconds}
+        self._disk: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def _load_disk_locked(self) -> Dict[str, Dict[str, Any]]:
+        if self._disk is None:
+            self._disk = {}
+            if self.path is not None and self.path.exists():
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._disk = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable geocoding cache {self.path}: {str(e)}")
+        return self._disk
+
+    def get(self, location: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a location.
+
+        Returns:
+            Tuple of (found, result); result is None for cached misses
+        """
+        key = _cache_key(location)
+        found, value = self._memory.get(key)
+        if found:
+            return True, value
+
+        with self._lock:
+            entry = self._load_disk_locked().get(key)
+        if entry is None:
+            return False, None
+        remaining = entry["expires_at"] - time.time()
+        if remaining <= 0:
+            return False, None
+        self._memory.set(key, entry["value"], ttl=remaining)
+        return True, entry["value"]
+
+    def set(self, location: str, result: Optional[Dict[str, Any]]):
+        """Cache a geocoding result (None for a place that wasn't found)."""
+        key = _cache_key(location)
+        ttl = self.ttl_seconds if result is not None else self.negative_ttl_seconds
+        self._memory.set(key, result, ttl=ttl)
+
+        if self.path is None:
+            return
+        with self._lock:
+            disk = self._load_disk_locked()
+            now = time.time()
+            # Drop expired entries while rewriting the file anyway
+            for stale in [k for k, entry in disk.items() if entry["expires_at"] <= now]:
+                del disk[stale]
+            disk[key] = {"value": result, "expires_at": now + ttl}
+            self._write_locked(disk)
+
+    def _write_locked(self, disk: Dict[str, Dict[str, Any]]):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".geocoding-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(disk, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist geocoding cache to {self.path}: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            disk_entries = len(self._disk) if self._disk is not None else None
+        return {**self._memory.stats(), "disk_entries": disk_entries, "path": str(self.path) if self.path else None}
+
+
+class Geocoder:
+    """
+    Resolves place names to coordinates: gazetteer first, then the cache,
+    then the Open-Meteo geocoding API. Locations given as "latitude, longitude"
+    are used as-is and named after the district containing them, if any.
+
+    Results have the shape of an Open-Meteo geocoding result
+    (name, latitude, longitude, country, ...).
+    """
+
+    def __init__(
+        self,
+        gazetteer: DistrictGazetteer,
+        cache: GeocodingCache,
+        district_index: Optional[DistrictIndex] = None
+    ):
+        self.gazetteer = gazetteer
+        self.cache = cache
+        self.district_index = district_index
+        # Async API lookups in flight, by cache key
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._coordinate_hits = 0
+        self._gazetteer_hits = 0
+        self._cache_hits = 0
+        self._api_calls = 0
+        self._coalesced = 0
+
+    def _from_coordinates(self, location: str) -> Optional[Dict[str, Any]]:
+        """Geocoding-style result for a "latitude, longitude" location, else None."""
+        match = _COORDINATES.match(location)
+        if not match:
+            return None
+        latitude, longitude = float(match.group(1)), float(match.group(2))
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            return None
+        self._coordinate_hits += 1
+        result = {"name": f"{latitude}, {longitude}", "latitude": latitude, "longitude": longitude, "country": ""}
+        district = self.district_index.locate(latitude, longitude) if self.district_index is not None else None
+        if district is not None:
+            result.update(
+                name=district["name"],
+                country=district["country"],
+                country_code=district["country_code"],
+                admin1=district["admin1"],
+                district=district["name"]
+            )
+        return result
+
+    def geocode(self, location: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the coordinates of a place.
+
+        Returns:
+            Best match, or None if the place is unknown
+
+        Raises:
+            requests.exceptions.RequestException: If the geocoding API is needed and fails
+        """
+        result = self._from_coordinates(location)
+        if result is not None:
+            return result
+
+        result = self.gazetteer.lookup(location)
+        if result is not None:
+            self._gazetteer_hits += 1
+            return result
+
+        found, result = self.cache.get(location)
+        if found:
+            self._cache_hits += 1
+            return result
+
+        self._api_calls += 1
+        geo_data = get_http_client().get_json(GEOCODING_URL, params=_search_params(location))
+        results = geo_data.get("results")
+        result = results[0] if results else None
+        self.cache.set(location, result)
+        return result
+
+    async def geocode_async(self, location: str) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of geocode().
+
+        Concurrent lookups of the same uncached place share one API call. If
+        the caller making the call is cancelled, waiting callers retry it
+        themselves instead of failing.
+
+        Raises:
+            httpx.HTTPError: If the geocoding API is needed and fails
+        """
+        result = self._from_coordinates(location)
+        if result is not None:
+            return result
+
+        result = self.gazetteer.lookup(location)
+        if result is not None:
+            self._gazetteer_hits += 1
+            return result
+
+        key = _cache_key(location)
+        while True:
+            found, result = self.cache.get(location)
+            if found:
+                self._cache_hits += 1
+                return result
+
+            with self._lock:
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = self._inflight[key] = Future()
+                else:
+                    self._coalesced += 1
+            if not leader:
+                try:
+                    # Shielded so a cancelled waiter doesn't cancel the shared lookup
+                    return await asyncio.shield(asyncio.wrap_future(future))
+                except asyncio.CancelledError:
+                    if future.cancelled() and not asyncio.current_task().cancelling():
+                        continue
+                    raise
+
+            self._api_calls += 1
+            try:
+                geo_data = await get_async_http_client().get_json(GEOCODING_URL, params=_search_params(location))
+                results = geo_data.get("results")
+                result = results[0] if results else None
+                self.cache.set(location, result)
+            except asyncio.CancelledError:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                future.cancel()
+                raise
+            except BaseException as e:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                future.set_exception(e)
+                raise
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_result(result)
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Get lookup counters per source."""
+        return {
+            "coordinate_hits": self._coordinate_hits,
+            "gazetteer_hits": self._gazetteer_hits,
+            "cache_hits": self._cache_hits,
+            "api_calls": self._api_calls,
+            "coalesced": self._coalesced,
+            "cache": self.cache.stats(),
+        }
+
+
+# Global geocoder instance
+_geocoder: Optional[Geocoder] = None
+_geocoder_lock = threading.Lock()
+
+
+def get_geocoder() -> Geocoder:
+    """
+    Get or create the global geocoder.
+    The disk cache lives at GEOCODING_CACHE_PATH (default .cache/geocoding.json
+    in the project root); set it to an empty value to keep the cache in memory only.
+
+    Returns:
+        Geocoder instance
+    """
+    global _geocoder
+    if _geocoder is None:
+        with _geocoder_lock:
+            if _geocoder is None:
+                default_path = Path(__file__).parent.parent.parent / ".cache" / "geocoding.json"
+                path = os.getenv("GEOCODING_CACHE_PATH", str(default_path))
+                cache = GeocodingCache(
+                    path=Path(path) if path else None,
+                    ttl_seconds=float(os.getenv("GEOCODING_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+                    negative_ttl_seconds=float(
+                        os.getenv("GEOCODING_CACHE_NEGATIVE_TTL_SECONDS", str(DEFAULT_NEGATIVE_TTL_SECONDS))
+                    ),
+                )
+                _geocoder = Geocoder(get_gazetteer(), cache, get_district_index())
+    return _geocoder
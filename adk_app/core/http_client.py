@@ -0,0 +1,316 @@
+"""
+Shared HTTP clients for external APIs (Open-Meteo).
+Keeps connections alive between calls so each request skips the TCP and TLS handshake,
+and paces requests through the shared rate limiter, retrying throttled ones.
+"""
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from adk_app.core.rate_limit import PRIORITY_INTERACTIVE, RateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "agripulse-adk/0.1"
+
+
+def _should_retry(status_code: int) -> bool:
+    """Rate limited or a transient server error."""
+    return status_code == 429 or status_code >= 500
+
+
+def _retry_after(headers: Any) -> Optional[float]:
+    """Seconds from a Retry-After header, if given as a number."""
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_config() -> Dict[str, Any]:
+    """HTTP client settings from the environment (defaults shown in .env.example)."""
+    return {
+        # Number of per-host connection pools kept (sync client)
+        "pool_connections": int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+        # Connections kept alive and allowed concurrently per host
+        "max_connections_per_host": int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10")),
+        # Total connections across hosts (async client)
+        "max_connections": int(os.getenv("HTTP_MAX_CONNECTIONS", "20")),
+        "keepalive_expiry": float(os.getenv("HTTP_KEEPALIVE_SECONDS", "30")),
+        "connect_timeout": float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05")),
+        "read_timeout": float(os.getenv("HTTP_READ_TIMEOUT", "10")),
+        # Retries of throttled (429) and 5xx responses
+        "max_retries": int(os.getenv("HTTP_MAX_RETRIES", "3")),
+    }
+
+
+class HttpClient:
+    """
+    Thread-safe pooled HTTP client built on a requests.Session.
+
+    Each host gets a keep-alive pool of up to max_connections_per_host
+    connections; when all are busy, callers wait for one to free up
+    (pool_block) instead of opening extra short-lived connections.
+
+    With a limiter, every request first takes tokens from it, and 429/5xx
+    responses back the limiter off and are retried up to max_retries times.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        max_connections_per_host: int = 10,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_connections_per_host = max_connections_per_host
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=max_connections_per_host,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.limiter = limiter
+        self.max_retries = max_retries if limiter is not None else 0
+        self._requests = 0
+        self._retries = 0
+
+    def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        priority: int = PRIORITY_INTERACTIVE,
+        cost: float = 1.0
+    ) -> Any:
+        """
+        GET a URL and decode the JSON body.
+
+        Args:
+            url: URL to fetch
+            params: Query parameters
+            timeout: Overrides the client's (connect, read) timeouts
+            priority: Rate limiter queue priority (PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND)
+            cost: Rate limiter tokens the request uses (e.g. number of locations)
+
+        Raises:
+            requests.exceptions.RequestException: On connection errors, timeouts
+                and non-2xx responses (after retries)
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.limiter is not None:
+                self.limiter.acquire(cost, priority)
+            self._requests += 1
+            response = self.session.get(url, params=params, timeout=timeout or self.timeout)
+            if _should_retry(response.status_code) and attempt < self.max_retries:
+                # The limiter pauses every caller; this one retries once it's let through
+                self._retries += 1
+                self.limiter.throttled(_retry_after(response.headers))
+                continue
+            if self.limiter is not None and response.ok:
+                self.limiter.succeeded()
+            response.raise_for_status()
+            return response.json()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self._requests,
+            "retries": self._retries,
+            "max_connections_per_host": self.max_connections_per_host,
+            "timeout": self.timeout,
+            "rate_limiter": self.limiter.stats() if self.limiter is not None else None,
+        }
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncHttpClient:
+    """
+    Pooled async HTTP client built on httpx.AsyncClient.
+
+    httpx connection pools belong to the event loop that opened them, so one
+    AsyncClient is kept per running loop. Connections are only reused by a
+    long-lived loop (main.py runs every agent turn on one); code that runs a
+    short-lived loop should aclose() before it ends. Concurrency per host is capped with
+    a semaphore, since httpx only limits connections in total. Rate limiting
+    and retries work as for HttpClient.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_connections_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        # None uses httpx's default pooled transport
+        self._transport = transport
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._host_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.limiter = limiter
+        self.max_retries = max_retries if limiter is not None else 0
+        self._requests = 0
+        self._retries = 0
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self._limits,
+                timeout=self._timeout,
+                headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+                transport=self._transport,
+            )
+            self._clients[loop] = client
+            self._host_slots[loop] = {}
+        return client
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        slots = self._host_slots[asyncio.get_running_loop()]
+        host = urlsplit(url).netloc
+        slot = slots.get(host)
+        if slot is None:
+            slot = slots[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return slot
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        priority: int = PRIORITY_INTERACTIVE,
+        cost: float = 1.0
+    ) -> Any:
+        """
+        GET a URL and decode the JSON body.
+
+        Raises:
+            httpx.HTTPError: On connection errors, timeouts and non-2xx responses
+                (after retries)
+        """
+        client = self._client()
+        for attempt in range(self.max_retries + 1):
+            if self.limiter is not None:
+                await self.limiter.acquire_async(cost, priority)
+            self._requests += 1
+            async with self._host_slot(url):
+                response = await client.get(url, params=params, timeout=timeout or self._timeout)
+            if _should_retry(response.status_code) and attempt < self.max_retries:
+                self._retries += 1
+                self.limiter.throttled(_retry_after(response.headers))
+                continue
+            if self.limiter is not None and response.is_success:
+                self.limiter.succeeded()
+            response.raise_for_status()
+            return response.json()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self._requests,
+            "retries": self._retries,
+            "event_loops": len(self._clients),
+            "max_connections": self._limits.max_connections,
+            "max_connections_per_host": self.max_connections_per_host,
+            "rate_limiter": self.limiter.stats() if self.limiter is not None else None,
+        }
+
+    async def aclose(self):
+        """Close the client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        self._host_slots.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+# Global client instances
+_http_client: Optional[HttpClient] = None
+_async_http_client: Optional[AsyncHttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get or create the global pooled HTTP client.
+
+    Returns:
+        HttpClient instance
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                config = _load_config()
+                _http_client = HttpClient(
+                    pool_connections=config["pool_connections"],
+                    max_connections_per_host=config["max_connections_per_host"],
+                    connect_timeout=config["connect_timeout"],
+                    read_timeout=config["read_timeout"],
+                    limiter=get_rate_limiter(),
+                    max_retries=config["max_retries"],
+                )
+    return _http_client
+
+
+def get_async_http_client() -> AsyncHttpClient:
+    """
+    Get or create the global pooled async HTTP client.
+
+    Returns:
+        AsyncHttpClient instance
+    """
+    global _async_http_client
+    if _async_http_client is None:
+        with _http_client_lock:
+            if _async_http_client is None:
+                config = _load_config()
+                _async_http_client = AsyncHttpClient(
+                    max_connections=config["max_connections"],
+                    max_connections_per_host=config["max_connections_per_host"],
+                    keepalive_expiry=config["keepalive_expiry"],
+                    connect_timeout=config["connect_timeout"],
+                    read_timeout=config["read_timeout"],
+                    limiter=get_rate_limiter(),
+                    max_retries=config["max_retries"],
+                )
+    return _async_http_client
+
+
+def close_http_clients():
+    """Close the global sync client. Async clients close with their event loop."""
+    global _http_client, _async_http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            logger.info("HTTP client closed")
+        _http_client = None
+        _async_http_client = None
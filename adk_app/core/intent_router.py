@@ -0,0 +1,279 @@
+"""
+Deterministic intent pre-routing.
+Sends unambiguous queries straight to a specialist agent, skipping the
+coordinator's model round trips; everything else still goes to the coordinator.
+"""
+import logging
+import math
+import re
+import threading
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+from adk_app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+WEATHER = "weather"
+YIELD = "yield"
+GENERAL = "general"
+# Route for queries with several specialist intents, answered concurrently
+PARALLEL = "parallel"
+
+# Terms that on their own identify an intent. "forecast" and "monsoon" are
+# deliberately missing: both appear in weather and yield questions.
+RULE_TERMS: Dict[str, List[str]] = {
+    WEATHER: [
+        r"weather", r"rain\w*", r"temperature\w*", r"humid\w*", r"wind(s|y|speed)?", r"storm\w*", r"cyclone\w*",
+        r"sunny", r"cloud\w*", r"celsius", r"precipitation", r"drizzle", r"fog\w*", r"heat ?wave\w*",
+        r"evapotranspiration", r"et0", r"degree days?", r"spray\w*",
+    ],
+    YIELD: [
+        r"yield\w*", r"harvest\w*", r"production", r"variet(y|ies)", r"hyv", r"aman", r"aus", r"boro",
+        r"crop types?", r"cultivation", r"soil\w*", r"fertili[sz]er\w*", r"tonnes?", r"hectares?",
+        r"forecast years?",
+    ],
+}
+
+# Seed utterances for the local classifier
+TRAINING_EXAMPLES: Dict[str, List[str]] = {
+    WEATHER: [
+        "what's the weather in dhaka",
+        "will it rain tomorrow in chittagong",
+        "temperature forecast for the next week",
+        "how hot will it be on friday",
+        "is a storm coming this week",
+        "how much rain fell last month in sylhet",
+        "is it a good day to spray pesticide",
+        "weather across rajshahi division",
+        "how humid is it in khulna today",
+        "will there be strong wind tomorrow",
+        "growing degree days for bogra this week",
+        "compare the weather in dhaka and rangpur",
+        "is it going to be sunny tomorrow",
+        "forecast for the next 10 days in barisal",
+    ],
+    YIELD: [
+        "yield forecast for hyv aman in dhaka for 2025",
+        "show me the latest yield forecasts",
+        "what's the expected production of boro rice in mymensingh",
+        "which crop types are available for forecasting",
+        "show me all available districts",
+        "what years have forecast data available",
+        "best practices for rice cultivation",
+        "how much fertilizer should i use for aman",
+        "compare aman yield in bogra and rangpur",
+        "predict my harvest for next season",
+        "soil analysis for my field",
+        "which variety gives the highest yield",
+        "yield summary for local transplanted aman",
+        "how many tonnes per hectare for aus rice",
+    ],
+    GENERAL: [
+        "hello",
+        "hi there",
+        "good morning",
+        "thank you",
+        "thanks a lot",
+        "what can you do",
+        "who are you",
+        "help",
+        "how are you",
+        "bye",
+    ],
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+class NaiveBayesIntentClassifier:
+    """Multinomial naive Bayes over word tokens with Laplace smoothing."""
+
+    def __init__(self, examples: Dict[str, List[str]], alpha: float = 1.0):
+        self.alpha = alpha
+        self.intents = list(examples)
+        total = sum(len(utterances) for utterances in examples.values())
+        self._log_prior = {intent: math.log(len(examples[intent]) / total) for intent in self.intents}
+        self._counts: Dict[str, Counter] = {
+            intent: Counter(token for utterance in utterances for token in tokenize(utterance))
+            for intent, utterances in examples.items()
+        }
+        self._vocabulary = set().union(*self._counts.values())
+        self._totals = {intent: sum(counts.values()) for intent, counts in self._counts.items()}
+
+    def predict_proba(self, tokens: List[str]) -> Dict[str, float]:
+        """Posterior probability of each intent; unknown tokens are ignored."""
+        known = [token for token in tokens if token in self._vocabulary]
+        vocabulary_size = len(self._vocabulary)
+        scores = {}
+        for intent in self.intents:
+            denominator = self._totals[intent] + self.alpha * vocabulary_size
+            scores[intent] = self._log_prior[intent] + sum(
+                math.log((self._counts[intent][token] + self.alpha) / denominator) for token in known
+            )
+        top = max(scores.values())
+        exp_scores = {intent: math.exp(score - top) for intent, score in scores.items()}
+        norm = sum(exp_scores.values())
+        return {intent: value / norm for intent, value in exp_scores.items()}
+
+
+class RoutingDecision:
+    """
+    Outcome of routing one query; route is None when the coordinator should
+    handle it, PARALLEL when each intent's specialist should answer its part.
+    """
+
+    __slots__ = ("route", "confidence", "method", "reason", "probabilities", "rule_hits")
+
+    def __init__(
+        self,
+        route: Optional[str],
+        confidence: float,
+        method: str,
+        reason: str,
+        probabilities: Dict[str, float],
+        rule_hits: Dict[str, List[str]]
+    ):
+        self.route = route
+        self.confidence = confidence
+        self.method = method
+        self.reason = reason
+        self.probabilities = probabilities
+        self.rule_hits = rule_hits
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "route": self.route or "coordinator",
+            "confidence": round(self.confidence, 3),
+            "method": self.method,
+            "reason": self.reason,
+            "probabilities": {intent: round(p, 3) for intent, p in self.probabilities.items()},
+            "rule_hits": self.rule_hits,
+        }
+
+
+class IntentRouter:
+    """
+    Routes a query to a specialist intent or to the coordinator.
+
+    - Rule terms found for more than one intent -> PARALLEL (multi-topic).
+    - Rule terms for one intent -> that intent, if the classifier agrees.
+    - No rule terms -> the classifier's intent, if at least min_confidence sure.
+    Greetings and general questions always go to the coordinator.
+    """
+
+    def __init__(
+        self,
+        classifier: NaiveBayesIntentClassifier,
+        min_confidence: float = 0.85,
+        rule_confidence: float = 0.95,
+        history_size: int = 200
+    ):
+        self.classifier = classifier
+        self.min_confidence = min_confidence
+        self.rule_confidence = rule_confidence
+        self._rules = {
+            intent: re.compile(r"\b(" + "|".join(terms) + r")\b", re.IGNORECASE)
+            for intent, terms in RULE_TERMS.items()
+        }
+        self._lock = threading.Lock()
+        self._routes: Counter = Counter()
+        self._methods: Counter = Counter()
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+
+    def route(self, text: str) -> RoutingDecision:
+        """Decide where a user query goes."""
+        hits = {
+            intent: sorted({match.group(0).lower() for match in rule.finditer(text)})
+            for intent, rule in self._rules.items()
+        }
+        hits = {intent: terms for intent, terms in hits.items() if terms}
+        probabilities = self.classifier.predict_proba(tokenize(text))
+        best = max(probabilities, key=probabilities.get)
+
+        if len(hits) > 1:
+            decision = RoutingDecision(
+                PARALLEL, self.rule_confidence, "rules", f"multiple intents: {', '.join(sorted(hits))}",
+                probabilities, hits
+            )
+        elif hits:
+            (intent,) = hits
+            agrees = best == intent
+            confidence = max(probabilities[intent], self.rule_confidence) if agrees else probabilities[intent]
+            decision = self._decide(
+                intent, confidence, "rules+classifier",
+                "rule terms" if agrees else f"classifier prefers {best}", probabilities, hits
+            )
+        else:
+            decision = self._decide(best, probabilities[best], "classifier", "no rule terms", probabilities, hits)
+
+        self._record(text, decision)
+        return decision
+
+    def _decide(
+        self,
+        intent: str,
+        confidence: float,
+        method: str,
+        reason: str,
+        probabilities: Dict[str, float],
+        hits: Dict[str, List[str]]
+    ) -> RoutingDecision:
+        if intent == GENERAL:
+            return RoutingDecision(None, confidence, method, "general conversation", probabilities, hits)
+        if confidence < self.min_confidence:
+            return RoutingDecision(
+                None, confidence, method, f"{reason}; below {self.min_confidence} confidence", probabilities, hits
+            )
+        return RoutingDecision(intent, confidence, method, reason, probabilities, hits)
+
+    def _record(self, text: str, decision: RoutingDecision):
+        entry = {"query": text[:200], **decision.to_dict()}
+        with self._lock:
+            self._routes[entry["route"]] += 1
+            self._methods[decision.method] += 1
+            self._recent.append(entry)
+        logger.info(
+            f"Routed to {entry['route']} ({decision.method}, confidence {decision.confidence:.2f}): {decision.reason}"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get routing statistics for tuning.
+
+        Returns:
+            Dictionary with counts per route and method and the most recent decisions
+        """
+        with self._lock:
+            total = sum(self._routes.values())
+            return {
+                "decisions": total,
+                "routes": dict(self._routes),
+                "methods": dict(self._methods),
+                "bypass_rate": round(1 - self._routes["coordinator"] / total, 4) if total else 0.0,
+                "recent": list(self._recent),
+            }
+
+
+# Global router instance
+_intent_router: Optional[IntentRouter] = None
+
+
+def get_intent_router() -> IntentRouter:
+    """
+    Get or create the global intent router.
+
+    Returns:
+        IntentRouter instance
+    """
+    global _intent_router
+    if _intent_router is None:
+        settings = get_settings()
+        _intent_router = IntentRouter(
+            NaiveBayesIntentClassifier(TRAINING_EXAMPLES),
+            min_confidence=float(settings.get_runtime_config("routing.intent_router.min_confidence", 0.85)),
+        )
+    return _intent_router
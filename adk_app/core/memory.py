@@ -1,36 +1,121 @@
 """
 Session memory adapters for ADK.
-Provides in-memory and persistent storage options.
+Provides in-memory and persistent storage options, shared by every user of
+the process; sessions are keyed by user_id/session_id and expire when idle.
 """
-from google.adk.sessions import InMemorySessionService
-from typing import Optional
+import threading
+import time
+from google.adk.sessions import BaseSessionService, InMemorySessionService, Session
+from typing import Any, Dict, Optional, Tuple
+from adk_app.core.settings import get_settings
 
 
 class MemoryManager:
-    """Manages session memory services."""
-    
-    def __init__(self, service_type: str = "in_memory"):
+    """
+    Manages session memory services.
+
+    One session service holds the sessions of all users. Sessions idle for
+    longer than ttl_seconds are deleted on the next session lookup, so memory
+    follows the number of active conversations rather than all past ones.
+    """
+
+    def __init__(self, service_type: str = "in_memory", ttl_seconds: Optional[float] = None):
         self.service_type = service_type
+        self.ttl_seconds = ttl_seconds
         self._service = None
-    
-    def get_session_service(self):
+        # (app_name, user_id, session_id) -> monotonic time of last use
+        self._last_used: Dict[Tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._expired = 0
+
+    def get_session_service(self) -> BaseSessionService:
         """Get the appropriate session service."""
         if self._service is None:
-            if self.service_type == "in_memory":
-                self._service = InMemorySessionService()
-            # Add other service types here (Redis, etc.)
-            else:
-                self._service = InMemorySessionService()
+            with self._lock:
+                if self._service is None:
+                    if self.service_type == "in_memory":
+                        self._service = InMemorySessionService()
+                    # Add other service types here (Redis, etc.)
+                    else:
+                        self._service = InMemorySessionService()
         return self._service
 
+    async def ensure_session(self, app_name: str, user_id: str, session_id: str) -> Session:
+        """
+        Get a user's session, creating it if it doesn't exist (or has expired).
+
+        Returns:
+            The session
+        """
+        await self.expire_idle_sessions()
+        service = self.get_session_service()
+        session = await service.get_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        if session is None:
+            session = await service.create_session(app_name=app_name, user_id=user_id, session_id=session_id)
+            with self._lock:
+                self._created += 1
+        with self._lock:
+            self._last_used[(app_name, user_id, session_id)] = time.monotonic()
+        return session
+
+    async def end_session(self, app_name: str, user_id: str, session_id: str):
+        """Delete a session that won't be used again (e.g. after clearing the chat)."""
+        with self._lock:
+            self._last_used.pop((app_name, user_id, session_id), None)
+        await self.get_session_service().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+    async def expire_idle_sessions(self) -> int:
+        """
+        Delete sessions idle for longer than ttl_seconds.
+
+        Returns:
+            Number of sessions deleted
+        """
+        if not self.ttl_seconds:
+            return 0
+        cutoff = time.monotonic() - self.ttl_seconds
+        with self._lock:
+            idle = [key for key, last_used in self._last_used.items() if last_used < cutoff]
+            for key in idle:
+                del self._last_used[key]
+            self._expired += len(idle)
+        service = self.get_session_service()
+        for app_name, user_id, session_id in idle:
+            await service.delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        return len(idle)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get session counts."""
+        with self._lock:
+            return {
+                "service_type": self.service_type,
+                "active_sessions": len(self._last_used),
+                "active_users": len({user_id for _, user_id, _ in self._last_used}),
+                "created": self._created,
+                "expired": self._expired,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
 
 # Global memory manager instance
 _memory_manager: Optional[MemoryManager] = None
+_memory_manager_lock = threading.Lock()
 
 
-def get_memory_manager(service_type: str = "in_memory") -> MemoryManager:
-    """Get or create the global memory manager."""
+def get_memory_manager(service_type: Optional[str] = None) -> MemoryManager:
+    """
+    Get or create the global memory manager.
+    The service type and idle session TTL come from session.service and
+    session.ttl_seconds in runtime.yaml unless given.
+    """
     global _memory_manager
     if _memory_manager is None:
-        _memory_manager = MemoryManager(service_type)
+        with _memory_manager_lock:
+            if _memory_manager is None:
+                settings = get_settings()
+                _memory_manager = MemoryManager(
+                    service_type or settings.get_runtime_config("session.service", "in_memory"),
+                    ttl_seconds=float(settings.get_runtime_config("session.ttl_seconds", 3600)),
+                )
     return _memory_manager
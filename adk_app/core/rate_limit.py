@@ -0,0 +1,255 @@
+"""
+Client-side rate limiting for external APIs (Open-Meteo).
+One token bucket is shared by every request in the process, so concurrent
+tool calls, refreshes and prefetching together stay under the provider's limits.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+
+class _Waiter:
+    __slots__ = ("cost", "priority", "granted", "cancelled", "event", "loop", "future")
+
+    def __init__(self, cost: float, priority: int):
+        self.cost = cost
+        self.priority = priority
+        self.granted = False
+        self.cancelled = False
+        self.event: Optional[threading.Event] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.future: Optional[asyncio.Future] = None
+
+    def wake(self):
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None:
+            try:
+                self.loop.call_soon_threadsafe(_set_done, self.future)
+            except RuntimeError:
+                # Event loop already closed; nobody is waiting anymore
+                pass
+
+
+def _set_done(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class RateLimiter:
+    """
+    Token bucket with a priority queue and adaptive backoff.
+
+    - Tokens refill at the current rate up to burst; a request costs one
+      token per location it covers.
+    - Waiting callers are served strictly by priority, then arrival order,
+      so interactive requests overtake queued background prefetches.
+    - A throttled response (429/5xx) halves the rate and pauses the whole
+      bucket for a jittered, exponentially growing delay (or the server's
+      Retry-After); each success restores part of the rate.
+    - Works for threads (acquire) and coroutines (acquire_async) at once.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: float = 50.0,
+        min_rate: float = 0.5,
+        recovery: float = 0.1,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0
+    ):
+        self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.recovery = recovery
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._rate = rate
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._acquired = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+        self._max_wait = 0.0
+        self._throttled = 0
+
+    def _dispatch_locked(self) -> float:
+        """
+        Grant tokens to queued waiters in priority order.
+
+        Returns:
+            Seconds until the waiter at the head of the queue can be served
+            (0 if the queue is empty)
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        while self._queue:
+            waiter = self._queue[0][2]
+            if waiter.cancelled:
+                heapq.heappop(self._queue)
+                continue
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._tokens < waiter.cost:
+                return (waiter.cost - self._tokens) / self._rate
+            heapq.heappop(self._queue)
+            self._tokens -= waiter.cost
+            waiter.granted = True
+            waiter.wake()
+        return 0.0
+
+    def _enqueue_locked(self, waiter: _Waiter):
+        heapq.heappush(self._queue, (waiter.priority, next(self._sequence), waiter))
+
+    def _record_wait(self, started: float):
+        waited = time.monotonic() - started
+        with self._lock:
+            self._acquired += 1
+            if waited > 0.001:
+                self._waited += 1
+                self._wait_seconds += waited
+                self._max_wait = max(self._max_wait, waited)
+
+    def acquire(self, cost: float = 1.0, priority: int = PRIORITY_INTERACTIVE):
+        """Block until cost tokens are granted."""
+        started = time.monotonic()
+        waiter = _Waiter(min(cost, self.burst), priority)
+        waiter.event = threading.Event()
+        with self._lock:
+            self._enqueue_locked(waiter)
+        while True:
+            with self._lock:
+                delay = self._dispatch_locked()
+                if waiter.granted:
+                    break
+            waiter.event.wait(delay)
+        self._record_wait(started)
+
+    async def acquire_async(self, cost: float = 1.0, priority: int = PRIORITY_INTERACTIVE):
+        """
+        Wait without blocking the event loop until cost tokens are granted.
+        A cancelled caller leaves the queue (or returns its tokens).
+        """
+        started = time.monotonic()
+        waiter = _Waiter(min(cost, self.burst), priority)
+        waiter.loop = asyncio.get_running_loop()
+        waiter.future = waiter.loop.create_future()
+        with self._lock:
+            self._enqueue_locked(waiter)
+        try:
+            while True:
+                with self._lock:
+                    delay = self._dispatch_locked()
+                    if waiter.granted:
+                        break
+                await asyncio.wait({waiter.future}, timeout=delay)
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._tokens = min(self.burst, self._tokens + waiter.cost)
+                waiter.cancelled = True
+            raise
+        self._record_wait(started)
+
+    def throttled(self, retry_after: Optional[float] = None) -> float:
+        """
+        Record a throttled or failed response and back off.
+
+        Args:
+            retry_after: Delay requested by the server, in seconds
+
+        Returns:
+            Seconds the bucket is paused for
+        """
+        with self._lock:
+            self._throttled += 1
+            self._consecutive_throttles += 1
+            self._rate = max(self.min_rate, self._rate / 2)
+            if retry_after is None:
+                ceiling = min(self.backoff_max, self.backoff_base * 2 ** (self._consecutive_throttles - 1))
+                # Jitter so clients that were throttled together don't retry together
+                pause = random.uniform(ceiling / 2, ceiling)
+            else:
+                pause = min(retry_after, self.backoff_max)
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        logger.warning(f"Rate limited by upstream API; pausing {pause:.1f}s at {self._rate:.2f} req/s")
+        return pause
+
+    def succeeded(self):
+        """Record a successful response, recovering part of the rate."""
+        with self._lock:
+            self._consecutive_throttles = 0
+            self._rate = min(self.max_rate, self._rate + self.recovery * self.max_rate)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with the current rate, queue depth, wait and throttle counters
+        """
+        with self._lock:
+            now = time.monotonic()
+            queued: Dict[int, int] = {}
+            for priority, _, waiter in self._queue:
+                if not waiter.cancelled:
+                    queued[priority] = queued.get(priority, 0) + 1
+            return {
+                "rate_per_second": round(self._rate, 3),
+                "max_rate_per_second": self.max_rate,
+                "burst": self.burst,
+                "tokens": round(min(self.burst, self._tokens + (now - self._updated) * self._rate), 2),
+                "queued": queued,
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "wait_seconds_total": round(self._wait_seconds, 3),
+                "max_wait_seconds": round(self._max_wait, 3),
+                "throttled": self._throttled,
+                "paused_for_s": round(max(self._paused_until - now, 0.0), 3),
+            }
+
+
+# Global limiter shared by the sync and async HTTP clients
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get or create the process-wide Open-Meteo rate limiter.
+
+    Returns:
+        RateLimiter instance
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter(
+                    rate=float(os.getenv("OPEN_METEO_RATE_PER_SECOND", "5")),
+                    burst=float(os.getenv("OPEN_METEO_BURST", "50")),
+                    backoff_base=float(os.getenv("HTTP_BACKOFF_BASE_SECONDS", "1")),
+                    backoff_max=float(os.getenv("HTTP_BACKOFF_MAX_SECONDS", "60")),
+                )
+    return _rate_limiter
@@ -0,0 +1,96 @@
+"""
+Row-based query result formatting.
+Converts cursor rows to JSON-friendly values with one converter per column,
+chosen once from the cursor description.
+"""
+from datetime import date
+from operator import methodcaller
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from snowflake.connector.constants import FIELD_ID_TO_NAME
+from adk_app.core.columnar import ColumnarResult
+
+Converter = Optional[Callable[[Any], Any]]
+
+_isoformat = methodcaller("isoformat")
+
+
+def _column_converter(type_name: str, scale: Optional[int]) -> Converter:
+    """
+    Pick the converter for a column from its Snowflake type.
+
+    Mirrors the Arrow path (see adk_app.core.columnar):
+    - FIXED (NUMBER/DECIMAL) with scale 0 -> int
+    - FIXED with scale > 0 -> float
+    - DATE -> "YYYY-MM-DD"
+    - TIMESTAMP_*/TIME -> ISO 8601 string
+    - BINARY -> hex string
+    - everything else is already a JSON type and is passed through (None)
+    """
+    if type_name == "FIXED":
+        return int if not scale else float
+    if type_name == "DATE":
+        # date.isoformat would drop the time part of a datetime, so only for DATE
+        return date.isoformat
+    if type_name.startswith("TIMESTAMP") or type_name == "TIME":
+        return _isoformat
+    if type_name == "BINARY":
+        return bytes.hex
+    return None
+
+
+class RowFormatter:
+    """
+    Formatter compiled once per cursor description.
+
+    Converters are resolved per column up front, so formatting a row does no
+    type checks; only the columns that need a conversion are touched.
+    """
+
+    def __init__(self, columns: Sequence[Tuple[str, Converter]]):
+        self.names: List[str] = [name for name, _ in columns]
+        self.converters: List[Converter] = [converter for _, converter in columns]
+        self._converted: List[Tuple[int, Callable[[Any], Any]]] = [
+            (index, converter) for index, converter in enumerate(self.converters) if converter is not None
+        ]
+
+    @classmethod
+    def from_description(cls, description: Sequence[Any]) -> "RowFormatter":
+        """
+        Build a formatter from a cursor description (ResultMetadata entries).
+        Column names are kept as reported by Snowflake.
+        """
+        return cls([
+            (column.name, _column_converter(FIELD_ID_TO_NAME.get(column.type_code, ""), column.scale))
+            for column in description
+        ])
+
+    def convert_row(self, row: Sequence[Any]) -> List[Any]:
+        """Convert the values of one row (tuple) in column order."""
+        values = list(row)
+        for index, converter in self._converted:
+            value = values[index]
+            if value is not None:
+                values[index] = converter(value)
+        return values
+
+    def format_rows(self, rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+        """Convert tuple rows to dictionaries keyed by column name."""
+        names = self.names
+        if not self._converted:
+            return [dict(zip(names, row)) for row in rows]
+        convert_row = self.convert_row
+        return [dict(zip(names, convert_row(row))) for row in rows]
+
+    def to_columnar(self, rows: Sequence[Sequence[Any]]) -> ColumnarResult:
+        """
+        Convert tuple rows to a ColumnarResult with lowercased column names.
+        Used when a result can't be fetched through Arrow.
+        """
+        columns = list(zip(*rows)) if rows else [() for _ in self.names]
+        result: Dict[str, List[Any]] = {}
+        for name, converter, values in zip(self.names, self.converters, columns):
+            if converter is None:
+                result[name.lower()] = list(values)
+            else:
+                result[name.lower()] = [None if value is None else converter(value) for value in values]
+        return ColumnarResult(result)
@@ -0,0 +1,483 @@
+"""
+Weather forecast cache keyed by grid cell.
+Forecasts only change when the upstream weather models update, so nearby
+points share one cached payload until the next model run is available.
+"""
+import asyncio
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+GridKey = Tuple[float, float, Hashable]
+
+# First element of tuple variants holding historical data, which never changes
+ARCHIVE_VARIANT = "archive"
+
+
+class _ForecastEntry:
+    __slots__ = ("value", "fetched_at", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, fetched_at: float, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class ForecastCache:
+    """
+    LRU cache of forecast payloads per (grid cell, request variant).
+
+    - Points are snapped to a grid of cell_degrees, so every request inside
+      a cell shares one entry and one upstream fetch.
+    - Entries stay fresh until the next model update: the next multiple of
+      update_interval (UTC) plus update_delay for the new run to be published.
+      Archive variants (("archive", ...)) hold past observations and never
+      expire; they only leave the cache by LRU eviction.
+    - Stale entries are served for up to max_stale seconds while a background
+      refresh runs (stale-while-revalidate); older entries are refetched inline.
+    - Concurrent misses for the same key wait on a single fetch (coalescing).
+      Async callers may wait on fetches led by threads, but threads never
+      wait on fetches led by an event loop: a sync tool running on that loop
+      would block it, so the fetch could never finish.
+    """
+
+    def __init__(
+        self,
+        cell_degrees: float = 0.1,
+        update_interval: float = 3600.0,
+        update_delay: float = 600.0,
+        max_stale: float = 6 * 3600.0,
+        max_entries: int = 2048,
+        refresh_workers: int = 2
+    ):
+        self.cell_degrees = cell_degrees
+        self.update_interval = update_interval
+        self.update_delay = update_delay
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[GridKey, _ForecastEntry]" = OrderedDict()
+        # In-flight fetches led by threads (sync path) and by event loop tasks (async path)
+        self._inflight: Dict[GridKey, Future] = {}
+        self._inflight_async: Dict[GridKey, Future] = {}
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="forecast-refresh")
+        # Strong references to background refresh tasks of the async path
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+        # Statistics
+        self._fresh_hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+
+    def cell(self, latitude: float, longitude: float) -> Tuple[float, float]:
+        """Center of the grid cell containing a point."""
+        size = self.cell_degrees
+        return (
+            round(math.floor(latitude / size) * size + size / 2, 6),
+            round(math.floor(longitude / size) * size + size / 2, 6),
+        )
+
+    def key(self, latitude: float, longitude: float, variant: Hashable = "") -> GridKey:
+        return (*self.cell(latitude, longitude), variant)
+
+    def next_update(self, fetched_at: float) -> float:
+        """When the next model run after fetched_at is expected to be published."""
+        since_run = (fetched_at - self.update_delay) % self.update_interval
+        return fetched_at - since_run + self.update_interval
+
+    def get_or_fetch(
+        self,
+        latitude: float,
+        longitude: float,
+        fetcher: Callable[[float, float], Any],
+        variant: Hashable = ""
+    ) -> Tuple[Any, str]:
+        """
+        Get the forecast for the cell containing a point.
+
+        Args:
+            latitude: Latitude of the requested point
+            longitude: Longitude of the requested point
+            fetcher: Called with the cell center (latitude, longitude) to fetch
+                a fresh payload
+            variant: Distinguishes payloads for different request parameters
+
+        Returns:
+            Tuple of (payload, cache status: "fresh", "stale" or "miss")
+        """
+        return self.get_or_fetch_many(
+            [(latitude, longitude)],
+            lambda cells: [fetcher(*cells[0])],
+            variant
+        )[0]
+
+    def get_or_fetch_many(
+        self,
+        points: List[Tuple[float, float]],
+        batch_fetcher: Callable[[List[Tuple[float, float]]], List[Any]],
+        variant: Hashable = ""
+    ) -> List[Tuple[Any, str]]:
+        """
+        Get forecasts for many points, fetching every missing cell in one call.
+
+        Args:
+            points: (latitude, longitude) pairs
+            batch_fetcher: Called with a list of cell centers, returns one
+                payload per cell in the same order
+            variant: Distinguishes payloads for different request parameters
+
+        Returns:
+            One (payload, cache status) tuple per point, in order
+        """
+        keys = [self.key(latitude, longitude, variant) for latitude, longitude in points]
+        results: Dict[GridKey, Tuple[Any, str]] = {}
+        stale: List[GridKey] = []
+        missing: List[GridKey] = []
+        for key in dict.fromkeys(keys):
+            found = self._lookup(key)
+            if found is None:
+                missing.append(key)
+            else:
+                results[key] = found
+                if found[1] == "stale":
+                    stale.append(key)
+
+        if stale:
+            self._refresh_in_background(stale, batch_fetcher)
+
+        while missing:
+            led: List[Tuple[GridKey, Future]] = []
+            waiting: List[Tuple[GridKey, Future]] = []
+            for key in missing:
+                future, leader = self._join_flight(key)
+                (led if leader else waiting).append((key, future))
+            if led:
+                self._fetch(led, batch_fetcher)
+            retry = []
+            for key, future in led + waiting:
+                try:
+                    results[key] = (future.result(), "miss")
+                except CancelledError:
+                    retry.append(key)
+            missing = retry
+
+        return [results[key] for key in keys]
+
+    async def get_or_fetch_async(
+        self,
+        latitude: float,
+        longitude: float,
+        fetcher: Callable[[float, float], Awaitable[Any]],
+        variant: Hashable = ""
+    ) -> Tuple[Any, str]:
+        """Async counterpart of get_or_fetch()."""
+        async def fetch_one(cells: List[Tuple[float, float]]) -> List[Any]:
+            return [await fetcher(*cells[0])]
+
+        return (await self.get_or_fetch_many_async([(latitude, longitude)], fetch_one, variant))[0]
+
+    async def get_or_fetch_many_async(
+        self,
+        points: List[Tuple[float, float]],
+        batch_fetcher: Callable[[List[Tuple[float, float]]], Awaitable[List[Any]]],
+        variant: Hashable = ""
+    ) -> List[Tuple[Any, str]]:
+        """
+        Async counterpart of get_or_fetch_many().
+
+        Shares entries with the sync path and waits on its in-flight fetches
+        too; sync callers don't wait on fetches started here. If the caller
+        that is fetching a cell is cancelled, the fetch is abandoned and
+        waiting callers retry it themselves instead of failing.
+        """
+        keys = [self.key(latitude, longitude, variant) for latitude, longitude in points]
+        results: Dict[GridKey, Tuple[Any, str]] = {}
+        stale: List[GridKey] = []
+        missing: List[GridKey] = []
+        for key in dict.fromkeys(keys):
+            found = self._lookup(key)
+            if found is None:
+                missing.append(key)
+            else:
+                results[key] = found
+                if found[1] == "stale":
+                    stale.append(key)
+
+        if stale:
+            self._refresh_in_background_async(stale, batch_fetcher)
+
+        while missing:
+            led: List[Tuple[GridKey, Future]] = []
+            waiting: List[Tuple[GridKey, Future]] = []
+            for key in missing:
+                future, leader = self._join_flight_async(key)
+                (led if leader else waiting).append((key, future))
+            if led:
+                values = await self._fetch_async(led, batch_fetcher)
+                for (key, _), value in zip(led, values):
+                    results[key] = (value, "miss")
+            retry = []
+            for key, future in waiting:
+                try:
+                    # Shielded so a cancelled waiter doesn't cancel the shared fetch
+                    results[key] = (await asyncio.shield(asyncio.wrap_future(future)), "miss")
+                except asyncio.CancelledError:
+                    if future.cancelled() and not asyncio.current_task().cancelling():
+                        retry.append(key)
+                        continue
+                    raise
+            missing = retry
+
+        return [results[key] for key in keys]
+
+    async def _fetch_async(
+        self,
+        flights: List[Tuple[GridKey, Future]],
+        batch_fetcher: Callable[[List[Tuple[float, float]]], Awaitable[List[Any]]]
+    ) -> List[Any]:
+        """Fetch the cells of flights this caller leads in one awaited call, store and publish them."""
+        try:
+            values = await batch_fetcher([(key[0], key[1]) for key, _ in flights])
+            if len(values) != len(flights):
+                raise ValueError(f"Expected {len(flights)} forecasts, got {len(values)}")
+        except asyncio.CancelledError:
+            with self._lock:
+                for key, _ in flights:
+                    self._inflight_async.pop(key, None)
+            for _, future in flights:
+                future.cancel()
+            raise
+        except BaseException as e:
+            with self._lock:
+                for key, _ in flights:
+                    self._inflight_async.pop(key, None)
+            for _, future in flights:
+                future.set_exception(e)
+            raise
+        for (key, future), value in zip(flights, values):
+            self.put(key, value)
+            with self._lock:
+                self._inflight_async.pop(key, None)
+            future.set_result(value)
+        return values
+
+    def _refresh_in_background_async(
+        self,
+        keys: List[GridKey],
+        batch_fetcher: Callable[[List[Tuple[float, float]]], Awaitable[List[Any]]]
+    ):
+        """Refresh stale entries in one task on the running event loop, skipping cells already being fetched."""
+        flights = []
+        for key in keys:
+            future, leader = self._join_flight_async(key)
+            if leader:
+                flights.append((key, future))
+        if not flights:
+            return
+
+        async def run():
+            try:
+                await self._fetch_async(flights, batch_fetcher)
+                self._refreshes += len(flights)
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                self._refresh_failures += 1
+                logger.warning(f"Background forecast refresh failed for {len(flights)} cell(s): {str(e)}")
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def prefetch(
+        self,
+        points: List[Tuple[float, float]],
+        batch_fetcher: Callable[[List[Tuple[float, float]]], List[Any]],
+        variant: Hashable = ""
+    ) -> int:
+        """
+        Fetch every cell among points that isn't fresh, in one call.
+        Cells already being fetched by someone else are skipped.
+
+        Returns:
+            Number of cells fetched
+        """
+        now = time.time()
+        flights: List[Tuple[GridKey, Future]] = []
+        for key in dict.fromkeys(self.key(latitude, longitude, variant) for latitude, longitude in points):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and now < entry.fresh_until:
+                    continue
+                if key in self._inflight or key in self._inflight_async:
+                    continue
+                future = Future()
+                self._inflight[key] = future
+            flights.append((key, future))
+        if flights:
+            self._fetch(flights, batch_fetcher)
+        return len(flights)
+
+    def _lookup(self, key: GridKey) -> Optional[Tuple[Any, str]]:
+        """Cached (payload, "fresh" | "stale") for a key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self._fresh_hits += 1
+                return entry.value, "fresh"
+            self._stale_hits += 1
+            return entry.value, "stale"
+
+    def _join_flight(self, key: GridKey) -> Tuple[Future, bool]:
+        """Join or lead a sync fetch of key; returns (future, whether this caller leads)."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._coalesced += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _join_flight_async(self, key: GridKey) -> Tuple[Future, bool]:
+        """Like _join_flight(), but joins sync fetches too and leads in the async flights."""
+        with self._lock:
+            future = self._inflight.get(key) or self._inflight_async.get(key)
+            if future is not None:
+                self._coalesced += 1
+                return future, False
+            future = Future()
+            self._inflight_async[key] = future
+            return future, True
+
+    def _fetch(
+        self,
+        flights: List[Tuple[GridKey, Future]],
+        batch_fetcher: Callable[[List[Tuple[float, float]]], List[Any]]
+    ):
+        """Fetch the cells of flights this caller leads in one call, store and publish them."""
+        try:
+            values = batch_fetcher([(key[0], key[1]) for key, _ in flights])
+            if len(values) != len(flights):
+                raise ValueError(f"Expected {len(flights)} forecasts, got {len(values)}")
+        except BaseException as e:
+            with self._lock:
+                for key, _ in flights:
+                    self._inflight.pop(key, None)
+            for _, future in flights:
+                future.set_exception(e)
+            raise
+        for (key, future), value in zip(flights, values):
+            self.put(key, value)
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_result(value)
+
+    def _refresh_in_background(
+        self,
+        keys: List[GridKey],
+        batch_fetcher: Callable[[List[Tuple[float, float]]], List[Any]]
+    ):
+        """Refresh stale entries in one background fetch, skipping cells already being fetched."""
+        flights = []
+        for key in keys:
+            future, leader = self._join_flight(key)
+            if leader:
+                flights.append((key, future))
+        if not flights:
+            return
+
+        def run():
+            try:
+                self._fetch(flights, batch_fetcher)
+                self._refreshes += len(flights)
+            except Exception as e:
+                self._refresh_failures += 1
+                logger.warning(f"Background forecast refresh failed for {len(flights)} cell(s): {str(e)}")
+
+        self._refresher.submit(run)
+
+    def put(self, key: GridKey, value: Any, fetched_at: Optional[float] = None):
+        """Store a freshly fetched payload for a key."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        variant = key[2]
+        if isinstance(variant, tuple) and variant and variant[0] == ARCHIVE_VARIANT:
+            fresh_until = math.inf
+        else:
+            fresh_until = self.next_update(fetched_at)
+        entry = _ForecastEntry(value, fetched_at, fresh_until, fresh_until + self.max_stale)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Drop every cached forecast."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with fresh/stale hit counters, misses, coalesced waits and refreshes
+        """
+        with self._lock:
+            lookups = self._fresh_hits + self._stale_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "cell_degrees": self.cell_degrees,
+                "fresh_hits": self._fresh_hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "hit_rate": round((self._fresh_hits + self._stale_hits) / lookups, 4) if lookups else 0.0,
+                "coalesced": self._coalesced,
+                "background_refreshes": self._refreshes,
+                "refresh_failures": self._refresh_failures,
+                "in_flight": len(self._inflight) + len(self._inflight_async),
+            }
+
+
+# Global forecast cache
+_forecast_cache: Optional[ForecastCache] = None
+_forecast_cache_lock = threading.Lock()
+
+
+def get_forecast_cache() -> ForecastCache:
+    """
+    Get or create the global weather forecast cache.
+
+    Returns:
+        ForecastCache instance
+    """
+    global _forecast_cache
+    if _forecast_cache is None:
+        with _forecast_cache_lock:
+            if _forecast_cache is None:
+                _forecast_cache = ForecastCache(
+                    cell_degrees=float(os.getenv("WEATHER_CACHE_CELL_DEGREES", "0.1")),
+                    update_interval=float(os.getenv("WEATHER_MODEL_UPDATE_SECONDS", "3600")),
+                    update_delay=float(os.getenv("WEATHER_MODEL_UPDATE_DELAY_SECONDS", "600")),
+                    max_stale=float(os.getenv("WEATHER_CACHE_MAX_STALE_SECONDS", str(6 * 3600))),
+                    max_entries=int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", "2048")),
+                )
+    return _forecast_cache
@@ -0,0 +1,230 @@
+"""
+Background weather prefetch.
+Keeps the forecast cache warm for every district in the yield catalog, so
+interactive weather questions about those districts are served from cache.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from adk_app.core.gazetteer import DistrictGazetteer, get_gazetteer
+from adk_app.core.rate_limit import PRIORITY_BACKGROUND
+from adk_app.core.weather_cache import ForecastCache, get_forecast_cache
+
+logger = logging.getLogger(__name__)
+
+Point = Tuple[float, float]
+
+
+class WeatherPrefetcher:
+    """
+    Periodically batch-fetches forecasts for a set of locations into the cache.
+
+    Runs are scheduled just after each expected model update, when cached
+    forecasts go stale, plus a random jitter so several app processes don't
+    hit Open-Meteo at the same moment. Each run only fetches cells that
+    aren't fresh, at most batch_size locations per request and with at least
+    min_request_interval seconds between requests. batch_fetcher fills the
+    default payload variant; variants maps further cached variants to their
+    batch fetchers, and they are warmed the same way.
+    """
+
+    def __init__(
+        self,
+        cache: ForecastCache,
+        batch_fetcher: Callable[[List[Point]], List[Any]],
+        points_provider: Callable[[], List[Point]],
+        batch_size: int = 20,
+        min_request_interval: float = 2.0,
+        jitter_seconds: float = 120.0,
+        variants: Optional[Dict[Hashable, Callable[[List[Point]], List[Any]]]] = None
+    ):
+        self.cache = cache
+        self.batch_fetcher = batch_fetcher
+        self.variants = variants or {}
+        self.points_provider = points_provider
+        self.batch_size = batch_size
+        self.min_request_interval = min_request_interval
+        self.jitter_seconds = jitter_seconds
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self._cycles = 0
+        self._failures = 0
+        self._requests = 0
+        self._cells_fetched = 0
+        self._next_run_at: Optional[float] = None
+        self._last_cycle: Dict[str, Any] = {}
+
+    def prefetch_once(self) -> Dict[str, Any]:
+        """
+        Run one prefetch cycle.
+
+        Returns:
+            Dictionary describing the cycle (locations, cells fetched, requests, duration)
+        """
+        with self._run_lock:
+            started = time.monotonic()
+            points = self.points_provider()
+            fetched = requests = 0
+            batches = [
+                (variant, batch_fetcher, points[start:start + self.batch_size])
+                for variant, batch_fetcher in [("", self.batch_fetcher), *self.variants.items()]
+                for start in range(0, len(points), self.batch_size)
+            ]
+            for index, (variant, batch_fetcher, batch) in enumerate(batches):
+                if self._stop.is_set():
+                    break
+                count = self.cache.prefetch(batch, batch_fetcher, variant)
+                if count:
+                    fetched += count
+                    requests += 1
+                    # Rate limit between upstream requests
+                    if index + 1 < len(batches) and self._stop.wait(self.min_request_interval):
+                        break
+
+            cycle = {
+                "locations": len(points),
+                "cells_fetched": fetched,
+                "requests": requests,
+                "duration_s": round(time.monotonic() - started, 4),
+            }
+            self._cycles += 1
+            self._requests += requests
+            self._cells_fetched += fetched
+            self._last_cycle = cycle
+            logger.info(
+                f"Weather prefetch: {fetched} cells for {len(points)} locations "
+                f"in {requests} requests ({cycle['duration_s']}s)"
+            )
+            return cycle
+
+    def _next_delay(self) -> float:
+        """Seconds until just after the next model update, plus jitter."""
+        now = time.time()
+        next_run = self.cache.next_update(now) + random.uniform(0, self.jitter_seconds)
+        self._next_run_at = next_run
+        return max(next_run - now, 0.0)
+
+    def start(self):
+        """Start prefetching in a daemon thread (first run after a short jitter)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="weather-prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the prefetch thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        delay = random.uniform(0, min(self.jitter_seconds, 30.0))
+        while not self._stop.wait(delay):
+            try:
+                self.prefetch_once()
+            except Exception as e:
+                self._failures += 1
+                logger.error(f"Weather prefetch failed: {str(e)}")
+            delay = self._next_delay()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get prefetch statistics.
+
+        Returns:
+            Dictionary with cycle counts, totals and the next scheduled run
+        """
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "cycles": self._cycles,
+            "failures": self._failures,
+            "requests": self._requests,
+            "cells_fetched": self._cells_fetched,
+            "next_run_in_s": round(self._next_run_at - time.time(), 1) if self._next_run_at else None,
+            "last_cycle": self._last_cycle,
+        }
+
+
+def catalog_district_points(gazetteer: Optional[DistrictGazetteer] = None) -> List[Point]:
+    """
+    Coordinates of every district in the yield forecast catalog.
+    Falls back to all gazetteer districts when the catalog can't be loaded.
+    """
+    # Imported here to keep core modules independent of the tool layer at import time
+    from adk_app.tools.snowflake_yield_tools import load_forecast_catalog
+
+    gazetteer = gazetteer or get_gazetteer()
+    try:
+        names = load_forecast_catalog().district_names
+    except Exception as e:
+        logger.warning(f"Forecast catalog unavailable, prefetching all districts: {str(e)}")
+        names = gazetteer.district_names
+
+    points = []
+    for name in names:
+        entry = gazetteer.lookup(name)
+        if entry is None:
+            logger.debug(f"No coordinates for catalog district {name!r}")
+            continue
+        points.append((entry["latitude"], entry["longitude"]))
+    return list(dict.fromkeys(points))
+
+
+# Global prefetcher instance
+_weather_prefetcher: Optional[WeatherPrefetcher] = None
+_weather_prefetcher_lock = threading.Lock()
+
+
+def get_weather_prefetcher() -> WeatherPrefetcher:
+    """
+    Get or create the global weather prefetcher.
+
+    Returns:
+        WeatherPrefetcher instance
+    """
+    # Imported here to avoid a circular import with the weather tools
+    from adk_app.tools.weather_tools import FORECAST_PARAMS, _request_forecasts
+
+    global _weather_prefetcher
+    if _weather_prefetcher is None:
+        with _weather_prefetcher_lock:
+            if _weather_prefetcher is None:
+                _weather_prefetcher = WeatherPrefetcher(
+                    get_forecast_cache(),
+                    # Queued behind interactive weather requests at the rate limiter
+                    lambda points: _request_forecasts(points, priority=PRIORITY_BACKGROUND),
+                    catalog_district_points,
+                    batch_size=int(os.getenv("WEATHER_PREFETCH_BATCH_SIZE", "20")),
+                    min_request_interval=float(os.getenv("WEATHER_PREFETCH_MIN_REQUEST_INTERVAL", "2")),
+                    jitter_seconds=float(os.getenv("WEATHER_PREFETCH_JITTER_SECONDS", "120")),
+                    # Daily forecasts up to the horizon, for dated reports
+                    variants={
+                        "forecast": lambda points: _request_forecasts(
+                            points, FORECAST_PARAMS, priority=PRIORITY_BACKGROUND
+                        ),
+                    },
+                )
+    return _weather_prefetcher
+
+
+def start_weather_prefetch() -> Optional[WeatherPrefetcher]:
+    """
+    Start the background prefetcher at application startup when
+    WEATHER_PREFETCH_ENABLED=true.
+
+    Returns:
+        WeatherPrefetcher instance, or None when disabled
+    """
+    if os.getenv("WEATHER_PREFETCH_ENABLED", "false").lower() not in ("1", "true", "yes"):
+        return None
+    prefetcher = get_weather_prefetcher()
+    prefetcher.start()
+    return prefetcher
@@ -0,0 +1,202 @@
+"""
+Slot-filling fast path for yield forecast questions.
+Questions naming one variety, district and year ("HYV Boro in Mymensingh for
+2026") are answered with a direct forecast lookup and the template from
+docs/RESPONSE_FORMAT.md, without any model calls. Anything else is left to
+the yield agent.
+"""
+import logging
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from adk_app.core.entity_resolver import EntityResolver
+from adk_app.core.forecast_catalog import ForecastCatalog
+
+logger = logging.getLogger(__name__)
+
+# Words ending a variety name in CROP_TYPE values
+_SEASON = re.compile(r"\b(aman|aus|boro)\b", re.IGNORECASE)
+_YEAR = re.compile(r"\b(20\d{2})\b")
+_WORD = re.compile(r"[A-Za-z][A-Za-z'.]*")
+
+# Words of questions that want more than one forecast's numbers or an explanation
+OPEN_ENDED = re.compile(
+    r"\b(why|how|compare\w*|versus|vs|trend\w*|explain\w*|factors?|improve\w*|increase\w*|decrease\w*|"
+    r"best|practices?|recommend\w*|should|all|latest|each|every|between|which|list|available)\b",
+    re.IGNORECASE
+)
+
+# Longest variety name in words, e.g. "(Broadcast+L.T + HYV) Aman"
+MAX_VARIETY_WORDS = 8
+MAX_DISTRICT_WORDS = 3
+
+RESPONSE_TEMPLATE = """Here is the yield forecast for {crop_type} rice in {district_name} for {forecast_year}:
+
+* From our standard best practice:
+  - Predicted Yield: Will be implemented later
+
+* From our historical analysis:
+  - Predicted Yield: {predicted_yield:.2f} tons per hectare
+  - Confidence Interval: {confidence_lower:.2f} to {confidence_upper:.2f} tons per hectare"""
+
+
+class YieldSlots:
+    """Variety, district and year found in a question; None where missing or ambiguous."""
+
+    __slots__ = ("yield_variety", "district", "forecast_year")
+
+    def __init__(
+        self,
+        yield_variety: Optional[str] = None,
+        district: Optional[str] = None,
+        forecast_year: Optional[int] = None
+    ):
+        self.yield_variety = yield_variety
+        self.district = district
+        self.forecast_year = forecast_year
+
+    @property
+    def missing(self) -> List[str]:
+        return [name for name in self.__slots__ if getattr(self, name) is None]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _exact_matches(resolver: EntityResolver, phrases: List[str]) -> List[str]:
+    """Distinct values the phrases resolve to exactly or by alias, not fuzzily."""
+    values = []
+    for phrase in phrases:
+        match = resolver.resolve(phrase)
+        if match.method in ("exact", "alias") and match.value not in values:
+            values.append(match.value)
+    return values
+
+
+def parse_yield_slots(text: str, catalog: ForecastCatalog) -> YieldSlots:
+    """
+    Extract the forecast lookup slots from a question.
+
+    Only exact and alias matches against the catalog count, and a slot is
+    left empty when the question names several values for it, so a filled
+    slot is never a guess.
+    """
+    slots = YieldSlots()
+
+    # Varieties end with the season word; try each run of words leading up to
+    # it and keep the longest that names a variety
+    tokens = text.split()
+    for end, token in enumerate(tokens):
+        if not _SEASON.search(token):
+            continue
+        phrases = [" ".join(tokens[start:end + 1]) for start in range(max(0, end - MAX_VARIETY_WORDS + 1), end + 1)]
+        varieties = _exact_matches(catalog.crop_type_resolver, phrases)[:1]
+        if varieties and slots.yield_variety not in (None, varieties[0]):
+            slots.yield_variety = None
+            break
+        if varieties:
+            slots.yield_variety = varieties[0]
+
+    words = _WORD.findall(_SEASON.sub(" ", text))
+    phrases = [
+        " ".join(words[start:start + size])
+        for size in range(1, MAX_DISTRICT_WORDS + 1)
+        for start in range(len(words) - size + 1)
+    ]
+    districts = _exact_matches(catalog.district_resolver, phrases)
+    if len(districts) == 1:
+        slots.district = districts[0]
+
+    years = {int(year) for year in _YEAR.findall(text)}
+    if len(years) == 1 and next(iter(years)) in catalog.forecast_years:
+        slots.forecast_year = years.pop()
+    return slots
+
+
+def format_yield_forecast(forecast: Dict[str, Any]) -> str:
+    """Render one forecast record in the standard response format (docs/RESPONSE_FORMAT.md)."""
+    return RESPONSE_TEMPLATE.format(**forecast)
+
+
+class YieldFastPath:
+    """
+    Answers fully specified yield forecast questions without the model.
+
+    answer() returns None whenever the yield agent should answer instead:
+    open-ended questions, missing or ambiguous slots, no forecast found, or
+    any lookup error.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._answered = 0
+        self._fallbacks: Counter = Counter()
+
+    async def answer(self, text: str) -> Optional[str]:
+        """Answer a question from the forecast table, or None to fall back to the agent."""
+        # Imported here to keep core modules independent of the tool layer at import time
+        from adk_app.tools.snowflake_yield_tools import get_yield_forecast_from_db_async, load_forecast_catalog_async
+
+        if OPEN_ENDED.search(text):
+            return self._fall_back("open-ended question")
+        try:
+            catalog = await load_forecast_catalog_async()
+        except Exception as e:
+            logger.warning(f"Yield fast path skipped, catalog unavailable: {str(e)}")
+            return self._fall_back("catalog unavailable")
+
+        slots = parse_yield_slots(text, catalog)
+        if slots.missing:
+            return self._fall_back("missing slots", ", ".join(slots.missing))
+
+        result = await get_yield_forecast_from_db_async(limit=1, **slots.to_dict())
+        if result.get("status") != "success" or not result.get("forecasts"):
+            return self._fall_back("no forecast found")
+        forecast = result["forecasts"][0]
+        if any(forecast.get(key) is None for key in ("predicted_yield", "confidence_lower", "confidence_upper")):
+            return self._fall_back("incomplete forecast")
+
+        with self._lock:
+            self._answered += 1
+        logger.info(f"Yield fast path answered: {slots.to_dict()}")
+        return format_yield_forecast(forecast)
+
+    def _fall_back(self, reason: str, detail: str = "") -> None:
+        with self._lock:
+            self._fallbacks[reason] += 1
+        logger.info(f"Yield fast path fell back to the agent: {reason}{f' ({detail})' if detail else ''}")
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get fast path statistics.
+
+        Returns:
+            Dictionary with answered questions and fallbacks per reason
+        """
+        with self._lock:
+            total = self._answered + sum(self._fallbacks.values())
+            return {
+                "questions": total,
+                "answered": self._answered,
+                "fallbacks": dict(self._fallbacks),
+                "hit_rate": round(self._answered / total, 4) if total else 0.0,
+            }
+
+
+# Global fast path instance
+_yield_fast_path: Optional[YieldFastPath] = None
+
+
+def get_yield_fast_path() -> YieldFastPath:
+    """
+    Get or create the global yield fast path.
+
+    Returns:
+        YieldFastPath instance
+    """
+    global _yield_fast_path
+    if _yield_fast_path is None:
+        _yield_fast_path = YieldFastPath()
+    return _yield_fast_path
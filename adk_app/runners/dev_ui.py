@@ -7,7 +7,10 @@ import logging
 from google.adk.runners import Runner
 from adk_app.core.settings import get_settings
 from adk_app.core.memory import get_memory_manager
-from adk_app.agents.multi.coordinator import coordinator_agent
+from adk_app.core.catalog_context import start_catalog_context
+from adk_app.core.forecast_replica import start_forecast_replica
+from adk_app.core.weather_prefetch import start_weather_prefetch
+from adk_app.agents.multi.router import router_agent
 
 # Configure logging
 logging.basicConfig(
@@ -24,19 +27,28 @@ async def run_dev_ui():
     logger.info("🌾 Starting AgriPulse AI Development UI...")
     logger.info(f"Port: {settings.dev_ui_port}")
     
+    # Load the in-memory forecast replica (no-op unless enabled)
+    start_forecast_replica()
+    
+    # List the forecast catalog in the yield agent's instruction (no-op unless enabled)
+    start_catalog_context()
+    
+    # Keep weather forecasts for catalog districts warm (no-op unless enabled)
+    start_weather_prefetch()
+    
     # Get session service
     memory_manager = get_memory_manager()
     session_service = memory_manager.get_session_service()
     
     # Create runner
     runner = Runner(
-        agent=coordinator_agent,
+        agent=router_agent,
         app_name="agripulse",
         session_service=session_service
     )
     
     logger.info("✅ AgriPulse AI is ready!")
-    logger.info("Available agents: weather_agent, yield_agent, coordinator_agent")
+    logger.info("Available agents: weather_agent, yield_agent, coordinator_agent (behind agripulse_router)")
     
     # Note: The actual ADK dev UI would be launched here
     # For now, this is a placeholder for the runner setup
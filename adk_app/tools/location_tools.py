@@ -0,0 +1,46 @@
+"""
+Location Tools for coordinate-based queries.
+Maps GPS coordinates to the district names used by the yield forecast tools.
+"""
+from typing import Dict, Any
+from adk_app.core.district_index import get_district_index
+
+
+def get_district_for_coordinates(latitude: float, longitude: float) -> Dict[str, Any]:
+    """
+    Finds the Bangladesh district for GPS coordinates.
+    
+    Use this when the user gives a latitude/longitude instead of a district name,
+    then pass the returned district to the yield forecast tools.
+    
+    Args:
+        latitude: Latitude in decimal degrees (e.g., 24.85)
+        longitude: Longitude in decimal degrees (e.g., 89.37)
+    
+    Returns:
+        Dictionary with the district, its division and the distance to the district headquarters
+    """
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return {
+            "status": "error",
+            "error_message": "Invalid coordinates. Latitude must be within -90..90 and longitude within -180..180."
+        }
+    
+    district = get_district_index().locate(latitude, longitude)
+    if district is None:
+        return {
+            "status": "error",
+            "error_message": f"({latitude}, {longitude}) is not within any Bangladesh district covered by the forecasts."
+        }
+    
+    return {
+        "status": "success",
+        "district": district["name"],
+        "division": district["admin1"],
+        "district_headquarters": {
+            "latitude": district["latitude"],
+            "longitude": district["longitude"]
+        },
+        "distance_km": district["distance_km"],
+        "note": "District is matched by the area containing the coordinates; distance_km is to its headquarters"
+    }
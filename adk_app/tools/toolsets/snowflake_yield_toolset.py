@@ -2,11 +2,12 @@
 
 from google.adk.tools import FunctionTool
 from ..snowflake_yield_tools import (
-    get_yield_forecast_from_db,
-    get_latest_yield_forecasts,
-    get_yield_forecast_summary,
-    get_crop_practice_data,
-    test_database_connection
+    get_yield_forecast_from_db_async,
+    get_yield_forecasts_batch_async,
+    get_latest_yield_forecasts_async,
+    get_yield_forecast_summary_async,
+    get_crop_practice_data_async,
+    test_database_connection_async
 )
 
 
@@ -17,9 +18,10 @@ class SnowflakeYieldToolset:
     def get_tools():
         """Get all Snowflake yield prediction tools."""
         return [
-            FunctionTool(func=get_yield_forecast_from_db),
-            FunctionTool(func=get_latest_yield_forecasts),
-            FunctionTool(func=get_yield_forecast_summary),
-            FunctionTool(func=get_crop_practice_data),
-            FunctionTool(func=test_database_connection)
+            FunctionTool(func=get_yield_forecast_from_db_async),
+            FunctionTool(func=get_yield_forecasts_batch_async),
+            FunctionTool(func=get_latest_yield_forecasts_async),
+            FunctionTool(func=get_yield_forecast_summary_async),
+            FunctionTool(func=get_crop_practice_data_async),
+            FunctionTool(func=test_database_connection_async)
         ]
@@ -1,7 +1,7 @@
 """Weather toolset for organizing weather-related tools."""
 
 from google.adk.tools import FunctionTool
-from ..weather_tools import get_weather_report
+from ..weather_tools import get_weather_report_async, get_weather_for_locations_async, get_agromet_indices_async
 
 
 class WeatherToolset:
@@ -11,5 +11,8 @@ class WeatherToolset:
     def get_tools():
         """Get all weather tools."""
         return [
-            FunctionTool(func=get_weather_report)
+            # Native coroutines: never block the event loop
+            FunctionTool(func=get_weather_report_async),
+            FunctionTool(func=get_weather_for_locations_async),
+            FunctionTool(func=get_agromet_indices_async)
         ]
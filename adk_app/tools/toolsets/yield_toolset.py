@@ -2,14 +2,17 @@
 
 from google.adk.tools import FunctionTool
 from ..yield_tools import predict_yield, analyze_soil_conditions
+from ..location_tools import get_district_for_coordinates
 from ..snowflake_yield_tools import (
-    get_yield_forecast_from_db,
-    get_latest_yield_forecasts,
-    get_yield_forecast_summary,
-    get_available_crop_types,
-    get_available_districts,
-    get_available_forecast_years,
-    get_crop_practice_data
+    get_yield_forecast_from_db_async,
+    get_yield_forecasts_batch_async,
+    get_latest_yield_forecasts_async,
+    get_yield_forecast_summary_async,
+    get_available_crop_types_async,
+    get_available_districts_async,
+    get_available_forecast_years_async,
+    get_forecast_catalog_async,
+    get_crop_practice_data_async
 )
 
 
@@ -23,14 +26,18 @@ class YieldToolset:
             # Calculated predictions
             FunctionTool(func=predict_yield),
             FunctionTool(func=analyze_soil_conditions),
-            # Database-backed forecasts
-            FunctionTool(func=get_yield_forecast_from_db),
-            FunctionTool(func=get_latest_yield_forecasts),
-            FunctionTool(func=get_yield_forecast_summary),
+            # Database-backed forecasts (async variants never block the event loop)
+            FunctionTool(func=get_yield_forecast_from_db_async),
+            FunctionTool(func=get_yield_forecasts_batch_async),
+            FunctionTool(func=get_latest_yield_forecasts_async),
+            FunctionTool(func=get_yield_forecast_summary_async),
             # Crop practice recommendations
-            FunctionTool(func=get_crop_practice_data),
+            FunctionTool(func=get_crop_practice_data_async),
             # Database metadata/discovery tools
-            FunctionTool(func=get_available_crop_types),
-            FunctionTool(func=get_available_districts),
-            FunctionTool(func=get_available_forecast_years)
+            FunctionTool(func=get_forecast_catalog_async),
+            FunctionTool(func=get_available_crop_types_async),
+            FunctionTool(func=get_available_districts_async),
+            FunctionTool(func=get_available_forecast_years_async),
+            # GPS coordinates to district names
+            FunctionTool(func=get_district_for_coordinates)
         ]
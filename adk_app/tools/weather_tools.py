@@ -2,117 +2,750 @@
 Weather API Tools for fetching weather information.
 Uses Open-Meteo API (free weather API, no API key required).
 """
+import logging
+from functools import wraps
+import httpx
+import numpy as np
 import requests
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Generator, List, Optional, Tuple
+from datetime import date as date_type, datetime, timedelta
+from adk_app.core.agromet import DAILY_VARIABLES, HOURLY_VARIABLES, compute_indices
+from adk_app.core.district_index import get_district_index
+from adk_app.core.gazetteer import get_gazetteer
+from adk_app.core.geocoding import get_geocoder
+from adk_app.core.http_client import get_async_http_client, get_http_client
+from adk_app.core.rate_limit import PRIORITY_INTERACTIVE
+from adk_app.core.weather_cache import ARCHIVE_VARIANT, get_forecast_cache
 
+logger = logging.getLogger(__name__)
 
-def get_weather_report(location: str, date: Optional[str] = None) -> Dict[str, Any]:
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+
+# Forecasts reach 16 days ahead; the forecast API also serves the last
+# 92 days, older dates come from the historical archive
+FORECAST_HORIZON_DAYS = 16
+PAST_DAYS_LIMIT = 92
+MAX_RANGE_DAYS = 31
+
+# Raised by the sync (requests) and async (httpx) clients
+HTTP_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+
+DAILY_REPORT_VARIABLES = "temperature_2m_max,temperature_2m_min,precipitation_sum,weather_code"
+
+
+def _geocode(location: str) -> Optional[Dict[str, Any]]:
+    """Coordinates of a location: district gazetteer, then geocoding cache, then Open-Meteo."""
+    return get_geocoder().geocode(location)
+
+
+# Open-Meteo accepts comma-separated coordinate lists; larger batches are
+# split so request URLs stay short
+MAX_LOCATIONS_PER_REQUEST = 50
+MAX_LOCATIONS_PER_CALL = 100
+
+# Current conditions only; dated reports fetch their days separately
+CURRENT_PARAMS = {
+    "current": "temperature_2m,relative_humidity_2m,apparent_temperature,precipitation,weather_code,wind_speed_10m",
+    "timezone": "auto"
+}
+
+# Current conditions plus the daily forecast up to the horizon, for dated
+# multi-location reports
+FORECAST_PARAMS = {
+    **CURRENT_PARAMS,
+    "daily": DAILY_REPORT_VARIABLES,
+    "forecast_days": FORECAST_HORIZON_DAYS
+}
+
+# Hourly and daily series for the agro-meteorological indices
+AGROMET_PARAMS = {
+    "hourly": ",".join(HOURLY_VARIABLES),
+    "daily": ",".join(DAILY_VARIABLES),
+    "timezone": "auto",
+    "forecast_days": 7
+}
+
+
+def _fetch_forecast(latitude: float, longitude: float) -> Dict[str, Any]:
+    """
+    Current conditions for a point.
+    Served from the grid-cell forecast cache; stale entries refresh in the background.
     """
-    Fetches weather information for a specific location and optional date.
+    forecast, cache_status = get_forecast_cache().get_or_fetch(latitude, longitude, _request_forecast)
+    logger.debug(f"Forecast for ({latitude}, {longitude}): cache {cache_status}")
+    return forecast
+
+
+def fetch_forecasts(points: List[Tuple[float, float]], daily: bool = False) -> List[Dict[str, Any]]:
+    """
+    Forecasts for many points, in order.
+    Cached cells are served from the forecast cache and every missing cell is
+    fetched in one batched Open-Meteo request.
     
     Args:
-        location: City name or location (e.g., "London", "New York", "Tokyo")
-        date: Optional date in YYYY-MM-DD format. If not provided, returns current weather.
+        points: (latitude, longitude) pairs
+        daily: Include the daily forecast up to the horizon, not just current conditions
     
     Returns:
-        Dictionary containing weather information with status, temperature, conditions, etc.
+        One Open-Meteo forecast payload per point
     """
-    try:
-        # First, get coordinates for the location using geocoding
-        geocoding_url = "https://geocoding-api.open-meteo.com/v1/search"
-        geocoding_params = {
-            "name": location,
-            "count": 1,
-            "language": "en",
-            "format": "json"
+    if daily:
+        results = get_forecast_cache().get_or_fetch_many(
+            points, lambda cells: _request_forecasts(cells, FORECAST_PARAMS), variant="forecast"
+        )
+    else:
+        results = get_forecast_cache().get_or_fetch_many(points, _request_forecasts)
+    return [forecast for forecast, _ in results]
+
+
+def _request_forecast(latitude: float, longitude: float) -> Dict[str, Any]:
+    """Fetch current conditions from Open-Meteo."""
+    return get_http_client().get_json(FORECAST_URL, params={
+        "latitude": latitude,
+        "longitude": longitude,
+        **CURRENT_PARAMS
+    })
+
+
+def _request_forecasts(
+    points: List[Tuple[float, float]],
+    params: Dict[str, Any] = CURRENT_PARAMS,
+    priority: int = PRIORITY_INTERACTIVE
+) -> List[Dict[str, Any]]:
+    """
+    Fetch forecasts for many points with one Open-Meteo request per chunk.
+    Each location counts as one call against the rate limit.
+    """
+    forecasts: List[Dict[str, Any]] = []
+    for start in range(0, len(points), MAX_LOCATIONS_PER_REQUEST):
+        chunk = points[start:start + MAX_LOCATIONS_PER_REQUEST]
+        data = get_http_client().get_json(FORECAST_URL, params={
+            "latitude": ",".join(str(latitude) for latitude, _ in chunk),
+            "longitude": ",".join(str(longitude) for _, longitude in chunk),
+            **params
+        }, priority=priority, cost=len(chunk))
+        # A single location comes back as an object, several as a list
+        forecasts.extend(data if isinstance(data, list) else [data])
+    return forecasts
+
+
+def _format_current(current: Dict[str, Any]) -> Dict[str, Any]:
+    """Current conditions section of a weather report."""
+    return {
+        "temperature": f"{current.get('temperature_2m', 'N/A')}°C",
+        "feels_like": f"{current.get('apparent_temperature', 'N/A')}°C",
+        "humidity": f"{current.get('relative_humidity_2m', 'N/A')}%",
+        "wind_speed": f"{current.get('wind_speed_10m', 'N/A')} km/h",
+        "precipitation": f"{current.get('precipitation', 0)} mm",
+        "conditions": _interpret_weather_code(current.get("weather_code", 0)),
+        "time": current.get("time", "")
+    }
+
+
+def _format_day(daily: Dict[str, Any], idx: int) -> Dict[str, Any]:
+    """One day of a daily series."""
+    return {
+        "date": daily["time"][idx],
+        "temperature_max": f"{daily['temperature_2m_max'][idx]}°C",
+        "temperature_min": f"{daily['temperature_2m_min'][idx]}°C",
+        "precipitation": f"{daily['precipitation_sum'][idx]} mm",
+        "conditions": _interpret_weather_code(daily['weather_code'][idx])
+    }
+
+
+def _location_header(location_data: Dict[str, Any]) -> Dict[str, Any]:
+    header = {
+        "status": "success",
+        "location": f"{location_data['name']}, {location_data.get('country', '')}",
+        "coordinates": {
+            "latitude": location_data["latitude"],
+            "longitude": location_data["longitude"]
         }
+    }
+    # District name the yield tools accept for the same place
+    district = location_data.get("district")
+    if district is None and location_data.get("country_code") == "BD":
+        containing = get_district_index().locate(location_data["latitude"], location_data["longitude"])
+        district = containing["name"] if containing is not None else None
+    if district is not None:
+        header["district"] = district
+    return header
+
+
+def _format_weather(location_data: Dict[str, Any], weather_data: Dict[str, Any], date: Optional[str]) -> Dict[str, Any]:
+    """Build the weather report for one geocoded location from a cached forecast payload."""
+    result = _location_header(location_data)
+    result["current_weather"] = _format_current(weather_data.get("current", {}))
+    
+    # Add forecast if requested date is in the future
+    if date:
+        try:
+            target_date = datetime.strptime(date, "%Y-%m-%d")
+            current_date = datetime.now()
+            
+            if target_date.date() > current_date.date():
+                # Find the date in the forecast
+                daily = weather_data.get("daily", {})
+                dates = daily.get("time", [])
+                if date in dates:
+                    result["forecast"] = _format_day(daily, dates.index(date))
+                elif dates:
+                    result["forecast_note"] = (
+                        f"Forecast for {date} is not available (forecasts reach {dates[-1]}, {len(dates)} days ahead)"
+                    )
+                else:
+                    result["forecast_note"] = f"Forecast for {date} is not available"
+        except ValueError:
+            result["date_error"] = "Invalid date format. Please use YYYY-MM-DD format."
+    
+    return result
+
+
+def _parse_period(date: str, end_date: Optional[str]) -> Tuple[date_type, date_type]:
+    """
+    Validate a requested date range.
+    
+    Raises:
+        ValueError: With a user-facing message for malformed or oversized ranges
+    """
+    try:
+        start = datetime.strptime(date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else start
+    except ValueError:
+        raise ValueError("Invalid date format. Please use YYYY-MM-DD format.")
+    if end < start:
+        raise ValueError("end_date must not be before date.")
+    if (end - start).days + 1 > MAX_RANGE_DAYS:
+        raise ValueError(f"Date range is too long. At most {MAX_RANGE_DAYS} days can be requested at once.")
+    return start, end
+
+
+def _archive_cutoff() -> date_type:
+    """First date still served by the forecast API; earlier dates are archived."""
+    return datetime.now().date() - timedelta(days=PAST_DAYS_LIMIT)
+
+
+def _daily_range_variant(start: date_type, end: date_type) -> Tuple[str, str, str]:
+    """Cache variant of a daily range; ranges entirely in the archive never expire."""
+    kind = ARCHIVE_VARIANT if end < _archive_cutoff() else "daily"
+    return kind, start.isoformat(), end.isoformat()
+
+
+def _daily_range_requests(
+    latitude: float,
+    longitude: float,
+    start: date_type,
+    end: date_type
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    (url, params) requests for the daily report variables of exactly [start, end].
+    Dates older than the forecast API's past window come from the archive API.
+    """
+    cutoff = _archive_cutoff()
+    segments = []
+    if start < cutoff:
+        segments.append((ARCHIVE_URL, start, min(end, cutoff - timedelta(days=1))))
+    if end >= cutoff:
+        segments.append((FORECAST_URL, max(start, cutoff), end))
+    return [
+        (url, {
+            "latitude": latitude,
+            "longitude": longitude,
+            "daily": DAILY_REPORT_VARIABLES,
+            "timezone": "auto",
+            "start_date": segment_start.isoformat(),
+            "end_date": segment_end.isoformat()
+        })
+        for url, segment_start, segment_end in segments
+    ]
+
+
+def _merge_daily(payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+    daily: Dict[str, List[Any]] = {}
+    for data in payloads:
+        for variable, values in data.get("daily", {}).items():
+            daily.setdefault(variable, []).extend(values)
+    return {"daily": daily}
+
+
+def _request_daily_range(latitude: float, longitude: float, start: date_type, end: date_type) -> Dict[str, Any]:
+    """Fetch the daily report variables for exactly [start, end]."""
+    return _merge_daily([
+        get_http_client().get_json(url, params=params)
+        for url, params in _daily_range_requests(latitude, longitude, start, end)
+    ])
+
+
+def _fetch_daily_range(latitude: float, longitude: float, start: date_type, end: date_type) -> Dict[str, Any]:
+    """Daily series for a date range, cached per grid cell and range."""
+    forecast, cache_status = get_forecast_cache().get_or_fetch(
+        latitude,
+        longitude,
+        lambda lat, lon: _request_daily_range(lat, lon, start, end),
+        variant=_daily_range_variant(start, end)
+    )
+    logger.debug(f"Daily {start}..{end} for ({latitude}, {longitude}): cache {cache_status}")
+    return forecast
+
+
+def _request_agromet_forecasts(points: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+    return _request_forecasts(points, AGROMET_PARAMS)
+
+
+def _fetch_agromet_forecasts(points: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+    """Hourly and daily agromet series for many points, cached separately from the regular forecast payloads."""
+    results = get_forecast_cache().get_or_fetch_many(points, _request_agromet_forecasts, variant="agromet")
+    return [forecast for forecast, _ in results]
+
+
+async def _geocode_async(location: str) -> Optional[Dict[str, Any]]:
+    return await get_geocoder().geocode_async(location)
+
+
+async def _request_forecast_async(latitude: float, longitude: float) -> Dict[str, Any]:
+    return await get_async_http_client().get_json(FORECAST_URL, params={
+        "latitude": latitude,
+        "longitude": longitude,
+        **CURRENT_PARAMS
+    })
+
+
+async def _fetch_forecast_async(latitude: float, longitude: float) -> Dict[str, Any]:
+    forecast, cache_status = await get_forecast_cache().get_or_fetch_async(
+        latitude, longitude, _request_forecast_async
+    )
+    logger.debug(f"Forecast for ({latitude}, {longitude}): cache {cache_status}")
+    return forecast
+
+
+async def _request_forecasts_async(
+    points: List[Tuple[float, float]],
+    params: Dict[str, Any] = CURRENT_PARAMS,
+    priority: int = PRIORITY_INTERACTIVE
+) -> List[Dict[str, Any]]:
+    forecasts: List[Dict[str, Any]] = []
+    for start in range(0, len(points), MAX_LOCATIONS_PER_REQUEST):
+        chunk = points[start:start + MAX_LOCATIONS_PER_REQUEST]
+        data = await get_async_http_client().get_json(FORECAST_URL, params={
+            "latitude": ",".join(str(latitude) for latitude, _ in chunk),
+            "longitude": ",".join(str(longitude) for _, longitude in chunk),
+            **params
+        }, priority=priority, cost=len(chunk))
+        forecasts.extend(data if isinstance(data, list) else [data])
+    return forecasts
+
+
+async def fetch_forecasts_async(points: List[Tuple[float, float]], daily: bool = False) -> List[Dict[str, Any]]:
+    """Async counterpart of fetch_forecasts()."""
+    if daily:
+        async def request(cells: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+            return await _request_forecasts_async(cells, FORECAST_PARAMS)
+
+        results = await get_forecast_cache().get_or_fetch_many_async(points, request, variant="forecast")
+    else:
+        results = await get_forecast_cache().get_or_fetch_many_async(points, _request_forecasts_async)
+    return [forecast for forecast, _ in results]
+
+
+async def _fetch_daily_range_async(
+    latitude: float,
+    longitude: float,
+    start: date_type,
+    end: date_type
+) -> Dict[str, Any]:
+    async def request(lat: float, lon: float) -> Dict[str, Any]:
+        client = get_async_http_client()
+        return _merge_daily([
+            await client.get_json(url, params=params)
+            for url, params in _daily_range_requests(lat, lon, start, end)
+        ])
+
+    forecast, cache_status = await get_forecast_cache().get_or_fetch_async(
+        latitude,
+        longitude,
+        request,
+        variant=_daily_range_variant(start, end)
+    )
+    logger.debug(f"Daily {start}..{end} for ({latitude}, {longitude}): cache {cache_status}")
+    return forecast
+
+
+async def _request_agromet_forecasts_async(points: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+    return await _request_forecasts_async(points, AGROMET_PARAMS)
+
+
+async def _fetch_agromet_forecasts_async(points: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+    results = await get_forecast_cache().get_or_fetch_many_async(
+        points, _request_agromet_forecasts_async, variant="agromet"
+    )
+    return [forecast for forecast, _ in results]
+
+
+# The weather tools are written once as fetch plans, like the yield query
+# plans: a generator that yields (fetch, args) requests ("geocode",
+# "current", "daily", "forecasts" or "agromet"), receives each result and
+# returns the report. It is driven by blocking fetches or by awaited ones
+# (the _async tools, which ADK runs on its event loop). Fetch errors are
+# thrown back into the plan so its own error handling applies to both
+# variants.
+WeatherPlan = Generator[Tuple[str, Tuple[Any, ...]], Any, Dict[str, Any]]
+
+_FETCHES = {
+    "geocode": _geocode,
+    "current": _fetch_forecast,
+    "daily": _fetch_daily_range,
+    "forecasts": fetch_forecasts,
+    "agromet": _fetch_agromet_forecasts,
+}
+
+_ASYNC_FETCHES = {
+    "geocode": _geocode_async,
+    "current": _fetch_forecast_async,
+    "daily": _fetch_daily_range_async,
+    "forecasts": fetch_forecasts_async,
+    "agromet": _fetch_agromet_forecasts_async,
+}
+
+
+def _run_weather_plan(plan: WeatherPlan) -> Dict[str, Any]:
+    """Drive a weather plan with blocking fetches."""
+    try:
+        request = next(plan)
+        while True:
+            try:
+                fetch, args = request
+                result = _FETCHES[fetch](*args)
+            except Exception as e:
+                request = plan.throw(e)
+            else:
+                request = plan.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def _run_weather_plan_async(plan: WeatherPlan) -> Dict[str, Any]:
+    """
+    Drive a weather plan with async fetches, never blocking the event loop.
+    Cancellation of the awaiting task propagates into the in-flight request.
+    """
+    try:
+        request = next(plan)
+        while True:
+            try:
+                fetch, args = request
+                result = await _ASYNC_FETCHES[fetch](*args)
+            except Exception as e:
+                request = plan.throw(e)
+            else:
+                request = plan.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _weather_report_plan(location: str, date: Optional[str] = None, end_date: Optional[str] = None) -> WeatherPlan:
+    """Fetch plan behind get_weather_report()."""
+    try:
+        # First, get coordinates for the location (offline for known districts)
+        location_data = yield "geocode", (location,)
         
-        geo_response = requests.get(geocoding_url, params=geocoding_params, timeout=10)
-        geo_response.raise_for_status()
-        geo_data = geo_response.json()
-        
-        if not geo_data.get("results"):
+        if location_data is None:
             return {
                 "status": "error",
                 "error_message": f"Location '{location}' not found. Please check the spelling or try a different location."
             }
         
-        # Extract coordinates
-        location_data = geo_data["results"][0]
         latitude = location_data["latitude"]
         longitude = location_data["longitude"]
-        location_name = location_data["name"]
-        country = location_data.get("country", "")
         
-        # Fetch weather data
-        weather_url = "https://api.open-meteo.com/v1/forecast"
-        weather_params = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "current": "temperature_2m,relative_humidity_2m,apparent_temperature,precipitation,weather_code,wind_speed_10m",
-            "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,weather_code",
-            "timezone": "auto",
-            "forecast_days": 7
-        }
+        if not date:
+            # Current conditions only (cached per grid cell, pooled keep-alive connections)
+            weather_data = yield "current", (latitude, longitude)
+            return _format_weather(location_data, weather_data, None)
+        
+        result = _location_header(location_data)
+        try:
+            start, end = _parse_period(date, end_date)
+        except ValueError as e:
+            weather_data = yield "current", (latitude, longitude)
+            result["current_weather"] = _format_current(weather_data.get("current", {}))
+            result["date_error"] = str(e)
+            return result
+        
+        today = datetime.now().date()
+        horizon = today + timedelta(days=FORECAST_HORIZON_DAYS - 1)
+        if end > horizon:
+            result["forecast_note"] = (
+                f"Forecasts are only available up to {horizon.isoformat()} ({FORECAST_HORIZON_DAYS} days ahead)"
+            )
+            end = horizon
+            if start > end:
+                return result
+        
+        result["period"] = {"start": start.isoformat(), "end": end.isoformat()}
+        if start >= today:
+            # Future days come from the cached forecast payload the prefetcher
+            # keeps warm, current conditions included
+            forecasts = yield "forecasts", ([(latitude, longitude)], True)
+            forecast = forecasts[0]
+            daily = forecast.get("daily", {})
+            days = [
+                idx for idx, day in enumerate(daily.get("time", []))
+                if start.isoformat() <= day <= end.isoformat()
+            ]
+            if len(days) == (end - start).days + 1:
+                if start == today:
+                    result["current_weather"] = _format_current(forecast.get("current", {}))
+                result["daily"] = [_format_day(daily, idx) for idx in days]
+                return result
         
-        weather_response = requests.get(weather_url, params=weather_params, timeout=10)
-        weather_response.raise_for_status()
-        weather_data = weather_response.json()
+        if start <= today <= end:
+            weather_data = yield "current", (latitude, longitude)
+            result["current_weather"] = _format_current(weather_data.get("current", {}))
         
-        # Parse current weather
-        current = weather_data.get("current", {})
-        daily = weather_data.get("daily", {})
+        # Only the requested days are fetched
+        range_data = yield "daily", (latitude, longitude, start, end)
+        daily = range_data.get("daily", {})
+        result["daily"] = [_format_day(daily, idx) for idx in range(len(daily.get("time", [])))]
+        return result
+        
+    except HTTP_ERRORS as e:
+        return {
+            "status": "error",
+            "error_message": f"Failed to fetch weather data: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error_message": f"An unexpected error occurred: {str(e)}"
+        }
+
+
+def get_weather_report(location: str, date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetches weather information for a specific location and optional date or date range.
+    
+    Past dates return observed weather; future dates return the forecast
+    (up to 16 days ahead). Request only the days you need.
+    
+    Args:
+        location: City name, location or "latitude, longitude" (e.g., "London", "Bogra", "24.85, 89.37")
+        date: Optional date in YYYY-MM-DD format (start of the range when end_date is given).
+            If not provided, returns current weather.
+        end_date: Optional last date of the range in YYYY-MM-DD format (at most 31 days after date)
+    
+    Returns:
+        Dictionary containing weather information with status, temperature, conditions, etc.
+    """
+    return _run_weather_plan(_weather_report_plan(location, date, end_date))
+
+
+@wraps(get_weather_report)
+async def get_weather_report_async(
+    location: str,
+    date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Dict[str, Any]:
+    return await _run_weather_plan_async(_weather_report_plan(location, date, end_date))
+
+
+def _geocode_locations_plan(
+    locations: List[str]
+) -> Generator[Tuple[str, Tuple[Any, ...]], Any, Tuple[List[Dict[str, Any]], List[str]]]:
+    """
+    Geocode location names, expanding division names to their districts.
+    Sub-plan of the multi-location plans, run with yield from.
+    
+    Returns:
+        Tuple of (unique geocoded locations, names that weren't found)
+    """
+    gazetteer = get_gazetteer()
+    geocoded: List[Dict[str, Any]] = []
+    not_found: List[str] = []
+    for location in locations or []:
+        districts = gazetteer.division_districts(location)
+        if districts is not None:
+            geocoded.extend(districts)
+            continue
+        location_data = yield "geocode", (location,)
+        if location_data is None:
+            not_found.append(location)
+        else:
+            geocoded.append(location_data)
+    
+    # The same place can be named twice (e.g. a district and its division)
+    unique = list({(entry["name"], entry["latitude"], entry["longitude"]): entry for entry in geocoded}.values())
+    return unique, not_found
+
+
+def _check_locations(unique: List[Dict[str, Any]], not_found: List[str]) -> Optional[Dict[str, Any]]:
+    """Error response when no location was found or there are too many, else None."""
+    if not unique:
+        return {
+            "status": "error",
+            "error_message": "None of the locations were found. Please check the spelling or try different locations.",
+            "not_found": not_found
+        }
+    if len(unique) > MAX_LOCATIONS_PER_CALL:
+        return {
+            "status": "error",
+            "error_message": f"Too many locations ({len(unique)}). At most {MAX_LOCATIONS_PER_CALL} are allowed per call."
+        }
+    return None
+
+
+def _weather_for_locations_plan(locations: List[str], date: Optional[str] = None) -> WeatherPlan:
+    """Fetch plan behind get_weather_for_locations()."""
+    try:
+        unique, not_found = yield from _geocode_locations_plan(locations)
+        error = _check_locations(unique, not_found)
+        if error:
+            return error
         
-        # Weather code interpretation
-        weather_code = current.get("weather_code", 0)
-        weather_description = _interpret_weather_code(weather_code)
+        # All forecasts come from the cache or one batched request; the daily
+        # forecast is only fetched for a date
+        points = [(entry["latitude"], entry["longitude"]) for entry in unique]
+        forecasts = yield "forecasts", (points, bool(date))
+        reports = [
+            _format_weather(location_data, weather_data, date)
+            for location_data, weather_data in zip(unique, forecasts)
+        ]
         
-        # Build response
         result = {
             "status": "success",
-            "location": f"{location_name}, {country}",
-            "coordinates": {
-                "latitude": latitude,
-                "longitude": longitude
-            },
-            "current_weather": {
-                "temperature": f"{current.get('temperature_2m', 'N/A')}°C",
-                "feels_like": f"{current.get('apparent_temperature', 'N/A')}°C",
-                "humidity": f"{current.get('relative_humidity_2m', 'N/A')}%",
-                "wind_speed": f"{current.get('wind_speed_10m', 'N/A')} km/h",
-                "precipitation": f"{current.get('precipitation', 0)} mm",
-                "conditions": weather_description,
-                "time": current.get("time", "")
-            }
+            "count": len(reports),
+            "reports": reports
         }
+        if not_found:
+            result["not_found"] = not_found
+        return result
         
-        # Add forecast if requested date is in the future
-        if date:
-            try:
-                target_date = datetime.strptime(date, "%Y-%m-%d")
-                current_date = datetime.now()
-                
-                if target_date.date() > current_date.date():
-                    # Find the date in the forecast
-                    dates = daily.get("time", [])
-                    if date in dates:
-                        idx = dates.index(date)
-                        result["forecast"] = {
-                            "date": date,
-                            "temperature_max": f"{daily['temperature_2m_max'][idx]}°C",
-                            "temperature_min": f"{daily['temperature_2m_min'][idx]}°C",
-                            "precipitation": f"{daily['precipitation_sum'][idx]} mm",
-                            "conditions": _interpret_weather_code(daily['weather_code'][idx])
-                        }
-                    else:
-                        result["forecast_note"] = f"Forecast for {date} is not available (only 7 days ahead)"
-            except ValueError:
-                result["date_error"] = "Invalid date format. Please use YYYY-MM-DD format."
+    except HTTP_ERRORS as e:
+        return {
+            "status": "error",
+            "error_message": f"Failed to fetch weather data: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error_message": f"An unexpected error occurred: {str(e)}"
+        }
+
+
+def get_weather_for_locations(locations: List[str], date: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetches weather for several locations at once.
+    
+    Use this instead of calling get_weather_report repeatedly when the user asks
+    about more than one place. A division name such as "Rajshahi division"
+    expands to all districts in that division.
+    
+    Args:
+        locations: Location names (e.g., ["Dhaka", "Bogra", "Rangpur"] or ["Rajshahi division"])
+        date: Optional date in YYYY-MM-DD format. If not provided, returns current weather.
+    
+    Returns:
+        Dictionary with one weather report per location under "reports"
+    """
+    return _run_weather_plan(_weather_for_locations_plan(locations, date))
+
+
+@wraps(get_weather_for_locations)
+async def get_weather_for_locations_async(locations: List[str], date: Optional[str] = None) -> Dict[str, Any]:
+    return await _run_weather_plan_async(_weather_for_locations_plan(locations, date))
+
+
+def _rounded(values: np.ndarray) -> List[Optional[float]]:
+    """JSON-friendly values rounded to 0.1, with None for missing data."""
+    return [None if np.isnan(value) else round(float(value), 1) for value in values]
+
+
+def _format_agromet(location_data: Dict[str, Any], indices: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Build the agro-meteorological summary for one location from the batch indices."""
+    dates = indices["dates"][index]
+    gdd = indices["gdd"][index]
+    et0 = indices["et0"][index]
+    rain = indices["rain"][index]
+    heat = indices["heat_stress_hours"][index]
+    times = indices["hourly_times"][index]
+    daily = [
+        {
+            "date": date,
+            "growing_degree_days": gdd_value,
+            "et0_mm": et0_value,
+            "rain_mm": rain_value,
+            "cumulative_rain_mm": cumulative_value,
+            "heat_stress_hours": int(heat_value)
+        }
+        for date, gdd_value, et0_value, rain_value, cumulative_value, heat_value in zip(
+            dates, _rounded(gdd), _rounded(et0), _rounded(rain), _rounded(indices["cumulative_rain"][index]), heat
+        )
+    ]
+    return {
+        "location": f"{location_data['name']}, {location_data.get('country', '')}",
+        "coordinates": {
+            "latitude": location_data["latitude"],
+            "longitude": location_data["longitude"]
+        },
+        "period": {"start": dates[0], "end": dates[-1]} if dates else None,
+        "totals": {
+            "growing_degree_days": round(float(np.nansum(gdd)), 1),
+            "et0_mm": round(float(np.nansum(et0)), 1),
+            "rain_mm": round(float(np.nansum(rain)), 1),
+            # Negative when the crop is expected to need irrigation
+            "water_balance_mm": round(float(np.nansum(rain) - np.nansum(et0)), 1),
+            "heat_stress_hours": int(heat.sum())
+        },
+        "daily": daily,
+        "spray_windows": [
+            {
+                "start": times[start],
+                # Hourly values cover the hour starting at their timestamp
+                "end": str(np.datetime64(times[end - 1]) + np.timedelta64(1, "h")),
+                "hours": end - start
+            }
+            for start, end in indices["spray_windows"][index]
+        ]
+    }
+
+
+def _agromet_indices_plan(
+    locations: List[str],
+    base_temperature: float = 10.0,
+    heat_stress_threshold: float = 35.0
+) -> WeatherPlan:
+    """Fetch plan behind get_agromet_indices()."""
+    try:
+        unique, not_found = yield from _geocode_locations_plan(locations)
+        error = _check_locations(unique, not_found)
+        if error:
+            return error
+        
+        # Hourly series are cached separately from the regular forecast payloads
+        forecasts = yield "agromet", ([(entry["latitude"], entry["longitude"]) for entry in unique],)
+        
+        # One vectorized pass over all locations
+        indices = compute_indices(
+            forecasts,
+            base_temperature=base_temperature,
+            heat_stress_threshold=heat_stress_threshold
+        )
         
+        result = {
+            "status": "success",
+            "count": len(unique),
+            "parameters": {
+                "base_temperature": f"{base_temperature}°C",
+                "heat_stress_threshold": f"{heat_stress_threshold}°C",
+                "et0_method": "Hargreaves-Samani"
+            },
+            "locations": [_format_agromet(entry, indices, index) for index, entry in enumerate(unique)]
+        }
+        if not_found:
+            result["not_found"] = not_found
         return result
         
-    except requests.exceptions.RequestException as e:
+    except HTTP_ERRORS as e:
         return {
             "status": "error",
             "error_message": f"Failed to fetch weather data: {str(e)}"
@@ -124,6 +757,39 @@ def get_weather_report(location: str, date: Optional[str] = None) -> Dict[str, A
         }
 
 
+def get_agromet_indices(
+    locations: List[str],
+    base_temperature: float = 10.0,
+    heat_stress_threshold: float = 35.0
+) -> Dict[str, Any]:
+    """
+    Computes farm-relevant weather indices for the next 7 days for one or more locations.
+    
+    Use this for crop planning questions: growing degree days, crop water demand
+    (reference evapotranspiration ET0 vs. rainfall), heat stress and when it is
+    safe to spray. A division name such as "Rajshahi division" expands to all
+    districts in that division.
+    
+    Args:
+        locations: Location names (e.g., ["Bogra"] or ["Dhaka", "Rangpur"])
+        base_temperature: Base temperature in °C for growing degree days (10 for rice)
+        heat_stress_threshold: Hourly temperature in °C counted as heat stress (35 for rice at flowering)
+    
+    Returns:
+        Dictionary with per-location daily indices, 7-day totals and spray windows under "locations"
+    """
+    return _run_weather_plan(_agromet_indices_plan(locations, base_temperature, heat_stress_threshold))
+
+
+@wraps(get_agromet_indices)
+async def get_agromet_indices_async(
+    locations: List[str],
+    base_temperature: float = 10.0,
+    heat_stress_threshold: float = 35.0
+) -> Dict[str, Any]:
+    return await _run_weather_plan_async(_agromet_indices_plan(locations, base_temperature, heat_stress_threshold))
+
+
 def _interpret_weather_code(code: int) -> str:
     """
     Interprets WMO weather codes into human-readable descriptions.
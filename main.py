@@ -6,16 +6,22 @@ import streamlit as st
 import asyncio
 from pathlib import Path
 import sys
+import threading
+import uuid
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Any, Awaitable, Dict, List, Tuple
 import os
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from adk_app.agents import coordinator_agent
-from google.adk.runners import InMemoryRunner
+from adk_app.agents import router_agent
+from adk_app.core.catalog_context import start_catalog_context
+from adk_app.core.forecast_replica import start_forecast_replica
+from adk_app.core.memory import get_memory_manager
+from adk_app.core.weather_prefetch import start_weather_prefetch
+from google.adk.runners import Runner
 from google.genai import types
 
 
@@ -192,19 +198,61 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# ADK app name the shared runner and all user sessions belong to
+APP_NAME = "agripulse_ai"
+
+
+@st.cache_resource
+def get_shared_runner() -> Runner:
+    """Create the agent runner once per process; every browser session shares it and its session service"""
+    return Runner(
+        agent=router_agent,
+        app_name=APP_NAME,
+        session_service=get_memory_manager().get_session_service()
+    )
+
+
+@st.cache_resource
+def get_agent_loop() -> asyncio.AbstractEventLoop:
+    """Start one event loop in a background thread; every agent turn runs on it, so pooled async connections are reused"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="agent-event-loop", daemon=True).start()
+    return loop
+
+
+def run_on_agent_loop(coroutine: Awaitable[Any]) -> Any:
+    """Run a coroutine on the shared agent loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coroutine, get_agent_loop()).result()
+
+
+@st.cache_resource
+def init_forecast_replica():
+    """Load the in-memory forecast replica once per process (when enabled)"""
+    return start_forecast_replica()
+
+
+@st.cache_resource
+def init_catalog_context():
+    """Build the yield agent's forecast catalog context once per process (when enabled)"""
+    return start_catalog_context()
+
+
+@st.cache_resource
+def init_weather_prefetch():
+    """Start the background weather prefetcher once per process (when enabled)"""
+    return start_weather_prefetch()
+
+
 def initialize_session_state():
     """Initialize session state variables"""
     if "messages" not in st.session_state:
         st.session_state.messages = []
     
-    if "agent_runner" not in st.session_state:
-        st.session_state.agent_runner = None
-    
     if "user_id" not in st.session_state:
-        st.session_state.user_id = "user_001"
+        # Sessions of all browsers live in one shared service, keyed by user_id/session_id
+        st.session_state.user_id = f"user_{uuid.uuid4().hex[:12]}"
     
     if "session_id" not in st.session_state:
-        import uuid
         st.session_state.session_id = str(uuid.uuid4())
     
     if "conversation_count" not in st.session_state:
@@ -220,40 +268,24 @@ def initialize_session_state():
         st.session_state.pending_query = None
 
 
-async def get_agent_runner():
-    """Get or create agent runner with session"""
-    if st.session_state.agent_runner is None:
-        # Create runner with app_name
-        st.session_state.agent_runner = InMemoryRunner(
-            agent=coordinator_agent,
-            app_name="agripulse_ai"
-        )
-        
-        # Create session immediately after runner creation
-        user_id = st.session_state.user_id
-        session_id = st.session_state.session_id
-        
-        try:
-            await st.session_state.agent_runner.session_service.create_session(
-                app_name="agripulse_ai",
-                user_id=user_id,
-                session_id=session_id
-            )
-        except Exception as e:
-            # Session might already exist, that's okay
-            pass
-    
-    return st.session_state.agent_runner
-
-
-async def get_agent_response(user_message: str, retry_count: int = 0) -> str:
-    """Get response from agent"""
+async def get_agent_response(
+    runner: Runner,
+    user_message: str,
+    user_id: str,
+    session_id: str,
+    retry_count: int = 0
+) -> Tuple[str, str]:
+    """
+    Get response from agent.
+    Runs on the agent loop's thread, so it doesn't touch st.session_state.
+    
+    Returns:
+        Tuple of (response text, session id the turn ran in)
+    """
     try:
-        runner = await get_agent_runner()
         response_text = ""
         
-        user_id = st.session_state.user_id
-        session_id = st.session_state.session_id
+        await get_memory_manager().ensure_session(APP_NAME, user_id, session_id)
         
         # Create content object for the message
         new_message = types.Content(
@@ -261,7 +293,7 @@ async def get_agent_response(user_message: str, retry_count: int = 0) -> str:
             parts=[types.Part(text=user_message)]
         )
         
-        # Run agent - the session should already exist from get_agent_runner()
+        # Run agent - the session exists now (created or refreshed above)
         async for event in runner.run_async(
             user_id=user_id,
             session_id=session_id,
@@ -276,25 +308,31 @@ async def get_agent_response(user_message: str, retry_count: int = 0) -> str:
                             if hasattr(part, 'text'):
                                 response_text += part.text
         
-        return response_text if response_text else "I apologize, but I couldn't generate a response. Please try again."
+        return (
+            response_text if response_text else "I apologize, but I couldn't generate a response. Please try again.",
+            session_id
+        )
     
     except ValueError as e:
         if "Session not found" in str(e) and retry_count == 0:
-            # Session not found, reset everything and retry
-            import uuid
-            st.session_state.session_id = str(uuid.uuid4())
-            st.session_state.agent_runner = None  # Force new runner creation
-            
-            # Retry with new session
-            return await get_agent_response(user_message, retry_count=1)
+            # Session not found (e.g. expired mid-request), retry in a new one
+            return await get_agent_response(runner, user_message, user_id, str(uuid.uuid4()), retry_count=1)
         else:
-            return f"❌ **Session Error:** {str(e)}\n\nPlease refresh the page to start a new session."
+            return f"❌ **Session Error:** {str(e)}\n\nPlease refresh the page to start a new session.", session_id
     except Exception as e:
         import traceback
         error_details = traceback.format_exc()
         # Only show first 500 chars of traceback to avoid overwhelming the UI
         short_trace = error_details[:500] + "..." if len(error_details) > 500 else error_details
-        return f"❌ **Error:** {str(e)}\n\n```\n{short_trace}\n```"
+        return f"❌ **Error:** {str(e)}\n\n```\n{short_trace}\n```", session_id
+
+
+def run_agent_turn(user_message: str) -> str:
+    """Answer a message in the current browser session's agent session, on the shared agent loop"""
+    response, st.session_state.session_id = run_on_agent_loop(get_agent_response(
+        get_shared_runner(), user_message, st.session_state.user_id, st.session_state.session_id
+    ))
+    return response
 
 
 def display_header():
@@ -319,9 +357,10 @@ def display_sidebar():
         if st.button("🗑️ Clear Chat History", use_container_width=True):
             st.session_state.messages = []
             st.session_state.conversation_count = 0
-            # Reset agent runner and create new session
-            st.session_state.agent_runner = None
-            import uuid
+            # Drop the old session from the shared service and start a new one
+            run_on_agent_loop(get_memory_manager().end_session(
+                APP_NAME, st.session_state.user_id, st.session_state.session_id
+            ))
             st.session_state.session_id = str(uuid.uuid4())
             st.rerun()
         
@@ -458,7 +497,7 @@ def display_chat_interface():
         
         # Get and display assistant response
         with st.spinner("Thinking..."):
-            response = asyncio.run(get_agent_response(prompt))
+            response = run_agent_turn(prompt)
             st.session_state.messages.append({"role": "assistant", "content": response})
         
         st.rerun()
@@ -481,7 +520,7 @@ def display_chat_interface():
         # Get and display assistant response
         with st.chat_message("assistant"):
             with st.spinner("Thinking..."):
-                response = asyncio.run(get_agent_response(prompt))
+                response = run_agent_turn(prompt)
                 st.markdown(response)
                 st.session_state.messages.append({"role": "assistant", "content": response})
 
@@ -518,6 +557,11 @@ def display_welcome_message():
 
 def main():
     """Main application function"""
+    # Load shared process-wide resources
+    init_forecast_replica()
+    init_catalog_context()
+    init_weather_prefetch()
+    
     # Initialize session state
     initialize_session_state()
     
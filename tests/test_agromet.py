@@ -0,0 +1,76 @@
+"""Tests for the vectorized agro-meteorological indices."""
+import numpy as np
+from adk_app.core.agromet import (
+    compute_indices,
+    extraterrestrial_radiation,
+    find_windows,
+    growing_degree_days,
+)
+
+
+def test_growing_degree_days_clip_to_base_and_cap():
+    """Extremes outside [base, cap] are clipped before averaging."""
+    tmax = np.array([[34.0, 20.0, 8.0]])
+    tmin = np.array([[24.0, 6.0, 2.0]])
+    
+    gdd = growing_degree_days(tmax, tmin, base=10.0, cap=30.0)
+    
+    np.testing.assert_allclose(gdd, [[17.0, 5.0, 0.0]])
+
+
+def test_extraterrestrial_radiation_matches_fao56_example():
+    """FAO-56 example 8: 20°S on 3 September gives Ra = 32.2 MJ m-2 day-1."""
+    ra = extraterrestrial_radiation(np.array([[-20.0]]), np.array([[246]]))
+    
+    assert round(float(ra[0, 0]), 1) == 32.2
+
+
+def test_find_windows_per_location():
+    """Runs shorter than min_hours are dropped; runs touching the edges are kept."""
+    mask = np.array([
+        [1, 1, 0, 1, 0, 1, 1, 1],
+        [0, 0, 0, 0, 0, 0, 0, 0],
+    ], dtype=bool)
+    
+    assert find_windows(mask, min_hours=2) == [[(0, 2), (5, 8)], []]
+
+
+def _forecast(latitude, tmax, tmin, rain, hourly_temperature):
+    days = len(tmax)
+    return {
+        "latitude": latitude,
+        "daily": {
+            "time": [f"2026-05-{day + 1:02d}" for day in range(days)],
+            "temperature_2m_max": tmax,
+            "temperature_2m_min": tmin,
+            "precipitation_sum": rain,
+        },
+        "hourly": {
+            "time": [f"2026-05-{hour // 24 + 1:02d}T{hour % 24:02d}:00" for hour in range(days * 24)],
+            "temperature_2m": hourly_temperature,
+            "relative_humidity_2m": [70] * days * 24,
+            "precipitation": [0.0] * days * 24,
+            "wind_speed_10m": [8.0] * days * 24,
+            "is_day": [1 if 6 <= hour % 24 < 18 else 0 for hour in range(days * 24)],
+        },
+    }
+
+
+def test_compute_indices_for_many_locations():
+    """All locations are computed together, with missing values treated as no rain."""
+    hot = [36.0 if 12 <= hour % 24 < 15 else 28.0 for hour in range(48)]
+    mild = [25.0] * 48
+    forecasts = [
+        _forecast(24.85, [36.0, 35.0], [26.0, 25.0], [0.0, 12.5], hot),
+        _forecast(22.36, [30.0, 29.0], [24.0, 23.0], [None, 3.0], mild),
+    ]
+    
+    indices = compute_indices(forecasts)
+    
+    np.testing.assert_allclose(indices["gdd"], [[18.0, 17.5], [17.0, 16.0]])
+    np.testing.assert_allclose(indices["cumulative_rain"], [[0.0, 12.5], [0.0, 3.0]])
+    assert indices["heat_stress_hours"].tolist() == [[3, 3], [0, 0]]
+    assert (indices["et0"] > 3).all() and (indices["et0"] < 8).all()
+    # Hot afternoons split the daylight hours of the first location
+    assert indices["spray_windows"][0][:2] == [(6, 12), (15, 18)]
+    assert indices["spray_windows"][1][0] == (6, 18)
@@ -0,0 +1,153 @@
+"""Tests for the TTL/LRU result cache."""
+import asyncio
+import threading
+import time
+from adk_app.core.cache import TTLCache
+
+
+def test_hits_misses_and_expiry():
+    """Entries are served until their TTL passes."""
+    cache = TTLCache(default_ttl=0.05)
+    cache.set("a", 1)
+    
+    assert cache.get("a") == (True, 1)
+    time.sleep(0.06)
+    assert cache.get("a") == (False, None)
+    
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["expirations"] == 1
+
+
+def test_lru_eviction_by_size():
+    """The least recently used entry is evicted when the byte budget is exceeded."""
+    cache = TTLCache(max_bytes=300, sizeof=lambda value: 100)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    cache.get("a")
+    cache.set("d", 4)
+    
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 300
+
+
+def test_concurrent_loads_are_coalesced():
+    """Concurrent threads asking for the same key trigger one load."""
+    cache = TTLCache()
+    calls = []
+    release = threading.Event()
+    
+    def loader():
+        calls.append(1)
+        release.wait(2)
+        return "value"
+    
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+    
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_async_single_flight_and_cancelled_leader():
+    """Async waiters share one load and take over if the loading task is cancelled."""
+    cache = TTLCache()
+    calls = []
+    
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+    
+    async def scenario():
+        leader = asyncio.create_task(cache.get_or_load_async("k", loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_load_async("k", loader))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+    
+    assert asyncio.run(scenario()) == 2
+    assert len(calls) == 2
+    assert cache.get("k") == (True, 2)
+
+
+def test_sync_load_on_the_loop_does_not_wait_on_an_async_load():
+    """A blocking caller on the event loop loads itself instead of deadlocking on the loop's load."""
+    cache = TTLCache()
+    
+    async def slow_loader():
+        await asyncio.sleep(0.05)
+        return "async"
+    
+    async def sync_caller():
+        await asyncio.sleep(0.01)
+        return cache.get_or_load("k", lambda: "sync")
+    
+    async def scenario():
+        return await asyncio.gather(cache.get_or_load_async("k", slow_loader), sync_caller())
+    
+    assert asyncio.run(scenario()) == ["async", "sync"]
+
+
+def test_loader_errors_propagate_and_are_not_cached():
+    """Failed loads raise to every waiter and leave nothing in the cache."""
+    cache = TTLCache()
+    
+    def failing():
+        raise RuntimeError("boom")
+    
+    try:
+        cache.get_or_load("k", failing)
+    except RuntimeError:
+        pass
+    
+    assert cache.get("k") == (False, None)
+    assert cache.get_or_load("k", lambda: "ok") == "ok"
+
+
+def test_manager_caches_queries_by_normalized_sql():
+    """execute_query serves repeated reads from the cache, keyed on normalized SQL."""
+    from adk_app.core.database import SnowflakeConnectionManager
+    
+    manager = SnowflakeConnectionManager()
+    calls = []
+    manager._execute_query = lambda query, params, fetch_all, result_format: calls.append(query) or [{"N": 1}]
+    
+    query = "SELECT DISTINCT CROP_TYPE, COUNT(*) FROM STG_ML_YIELD_FORECASTS GROUP BY CROP_TYPE"
+    manager.execute_query(query)
+    manager.execute_query("  " + query.replace(" ", "\n        "))
+    manager.execute_query(query, use_cache=False)
+    manager.execute_query("UPDATE T SET X = 1")
+    
+    assert len(calls) == 3
+    stats = manager.cache_stats()
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+
+def test_cache_key_accepts_named_and_positional_params():
+    """Named parameters are keyed independent of order, positional ones by position."""
+    from adk_app.core.database import SnowflakeConnectionManager
+    
+    key = SnowflakeConnectionManager._cache_key
+    query = "SELECT * FROM T WHERE A = %s AND B = %s"
+    
+    assert key(query, {"a": 1, "b": 2}, True, "rows") == key(query, {"b": 2, "a": 1}, True, "rows")
+    assert key(query, [1, 2], True, "rows") == key(query, (1, 2), True, "rows")
+    assert key(query, (1, 2), True, "rows") != key(query, (2, 1), True, "rows")
+    assert key(query, None, True, "rows") == key(query, (), True, "rows")
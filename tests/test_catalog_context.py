@@ -0,0 +1,42 @@
+"""Tests for the yield agent's forecast catalog context."""
+import asyncio
+from types import SimpleNamespace
+from adk_app.core.catalog_context import SESSION_STATE_KEY, CatalogContext
+from adk_app.core.forecast_catalog import ForecastCatalog
+from tests.test_forecast_replica import make_snapshot
+
+
+def test_instruction_lists_catalog_and_rebuilds_on_refresh(monkeypatch):
+    """The catalog section is rendered once per catalog version and appended after the persona."""
+    import adk_app.tools.snowflake_yield_tools as tools
+    
+    catalog = ForecastCatalog.from_snapshot(make_snapshot())
+    
+    async def load_catalog():
+        return catalog
+    
+    monkeypatch.setattr(tools, "load_forecast_catalog_async", load_catalog)
+    context = CatalogContext()
+    instruction = context.instruction("Persona.", "\nBranch note.")
+    
+    text = asyncio.run(instruction(SimpleNamespace(invocation_id="i1")))
+    asyncio.run(instruction(SimpleNamespace(invocation_id="i1")))
+    
+    assert text.startswith("Persona.\n\n## Forecast Catalog (version " + catalog.version)
+    assert '"High Yielding Variety (HYV) Aman", "HYV Boro"' in text
+    assert "- Districts (district): Bogra, Dhaka\n- Forecast years (forecast_year): 2025, 2026" in text
+    assert text.endswith("\nBranch note.")
+    assert context.stats()["builds"] == 1
+    assert context.stats()["turns"] == 1
+
+
+def test_discovery_calls_are_counted_per_turn_and_session():
+    """Only discovery tools are counted, overall and in the session state."""
+    context = CatalogContext()
+    tool_context = SimpleNamespace(state={})
+    
+    for name in ["get_available_districts", "get_yield_forecast_from_db", "get_forecast_catalog"]:
+        assert context.before_tool_callback(SimpleNamespace(name=name), {}, tool_context) is None
+    
+    assert tool_context.state[SESSION_STATE_KEY] == 2
+    assert context.stats()["discovery_calls_by_tool"] == {"get_available_districts": 1, "get_forecast_catalog": 1}
@@ -0,0 +1,56 @@
+"""Tests for Arrow-backed columnar query results."""
+from datetime import date, datetime, timezone
+from decimal import Decimal
+import pyarrow as pa
+from adk_app.core.columnar import ColumnarResult
+
+
+def test_from_arrow_converts_each_column_type():
+    """Decimals, dates and timestamps are converted to JSON-friendly values."""
+    table = pa.table({
+        "FORECAST_YEAR": pa.array([Decimal("2025"), Decimal("2026")], pa.decimal128(4, 0)),
+        "PREDICTED_YIELD": pa.array([Decimal("2.50"), None], pa.decimal128(10, 2)),
+        "PREDICTION_DATE": pa.array([date(2025, 8, 24), date(2025, 8, 25)]),
+        "CREATED_AT": pa.array([datetime(2025, 8, 24, 10, 0), datetime(2025, 8, 24, 10, 0, 0, 5)]),
+        "DISTRICT_NAME": ["Dhaka", "Bogra"],
+    })
+    
+    result = ColumnarResult.from_arrow(table)
+    
+    assert result.column_names == [
+        "forecast_year", "predicted_yield", "prediction_date", "created_at", "district_name"
+    ]
+    assert result.column("FORECAST_YEAR") == [2025, 2026]
+    assert result.column("predicted_yield") == [2.5, None]
+    assert result.column("prediction_date") == ["2025-08-24", "2025-08-25"]
+    assert result.column("created_at") == [
+        "2025-08-24T10:00:00.000000",
+        "2025-08-24T10:00:00.000005",
+    ]
+    assert isinstance(result.column("forecast_year")[0], int)
+
+
+def test_whole_second_timestamps_match_isoformat():
+    """Timestamps without fractions and UTC offsets render like datetime.isoformat()."""
+    value = datetime(2025, 8, 24, 10, 0, tzinfo=timezone.utc)
+    table = pa.table({"TS": pa.array([value], pa.timestamp("us", tz="UTC"))})
+    
+    assert ColumnarResult.from_arrow(table).column("ts") == [value.isoformat()]
+
+
+def test_batches_are_concatenated_and_records_materialized():
+    """Batches are merged column by column and can be turned into row dicts."""
+    batches = [pa.table({"ID": [1, 2]}), pa.table({"ID": [3]})]
+    
+    result = ColumnarResult.from_arrow_batches(batches)
+    
+    assert len(result) == 3
+    assert result.to_records() == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_empty_result_is_falsy():
+    """A query returning no batches yields an empty, falsy result."""
+    result = ColumnarResult.from_arrow_batches([])
+    
+    assert not result
+    assert result.to_records() == []
@@ -0,0 +1,263 @@
+"""Tests for the Snowflake connection pool."""
+import threading
+import time
+import pytest
+from snowflake.connector.cursor import ResultMetadata
+from adk_app.core.database import SnowflakeConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    """Minimal stand-in for a SnowflakeConnection."""
+    
+    def __init__(self):
+        self.closed = False
+        self.valid = True
+    
+    def is_closed(self):
+        return self.closed
+    
+    def is_valid(self):
+        return self.valid
+    
+    def close(self):
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    created = []
+    
+    def factory():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+    
+    return SnowflakeConnectionPool(factory, **kwargs), created
+
+
+def test_connections_are_reused():
+    """A released connection is handed out again instead of creating a new one."""
+    pool, created = make_pool(min_size=0, max_size=2)
+    
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    
+    assert first is second
+    assert len(created) == 1
+    stats = pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["connections_created"] == 1
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+
+
+def test_checkout_timeout_when_exhausted():
+    """Borrowers time out once max_size connections are in use."""
+    pool, _ = make_pool(min_size=0, max_size=1, checkout_timeout=0.05)
+    held = pool.acquire()
+    
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    
+    pool.release(held)
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_waiter_receives_released_connection():
+    """A waiting borrower is woken when another thread releases a connection."""
+    pool, created = make_pool(min_size=0, max_size=1, checkout_timeout=2)
+    held = pool.acquire()
+    borrowed = []
+    
+    def borrow():
+        with pool.connection() as conn:
+            borrowed.append(conn)
+    
+    thread = threading.Thread(target=borrow)
+    thread.start()
+    time.sleep(0.05)
+    pool.release(held)
+    thread.join(timeout=2)
+    
+    assert borrowed == [held.connection]
+    assert len(created) == 1
+    assert pool.stats()["waits"] == 1
+
+
+def test_invalid_connection_is_replaced_on_borrow():
+    """Connections failing validation are discarded and replaced."""
+    pool, created = make_pool(min_size=0, max_size=1, validation_interval=0)
+    with pool.connection() as conn:
+        pass
+    conn.valid = False
+    time.sleep(0.01)
+    
+    with pool.connection() as replacement:
+        pass
+    
+    assert replacement is not conn
+    assert conn.closed
+    assert len(created) == 2
+
+
+def test_idle_reaping_and_lifetime_recycling():
+    """Idle connections above min_size are reaped; old connections are recycled."""
+    pool, created = make_pool(min_size=1, max_size=3, max_idle_time=0.01, max_lifetime=60)
+    a = pool.acquire()
+    b = pool.acquire()
+    pool.release(a)
+    pool.release(b)
+    time.sleep(0.02)
+    
+    assert pool.reap_idle() == 1
+    assert pool.stats()["size"] == 1
+    
+    pool.max_lifetime = 0
+    assert pool.reap_idle() == 1
+    assert pool.stats()["size"] == 0
+    assert all(conn.closed for conn in created)
+
+
+def test_fill_creates_min_size_connections():
+    """fill() warms the pool up to min_size."""
+    pool, created = make_pool(min_size=2, max_size=4)
+    pool.fill()
+    
+    assert len(created) == 2
+    assert pool.stats()["idle"] == 2
+    
+    pool.close()
+    assert all(conn.closed for conn in created)
+
+
+class FakeAsyncCursor:
+    """Cursor stand-in supporting Snowflake's async execution API."""
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.sfqid = None
+        self.closed = False
+        self.description = [ResultMetadata("ID", 0, None, None, 38, 0, False)]
+    
+    def execute_async(self, query, params=None):
+        self.sfqid = "query-1"
+    
+    def get_results_from_sfqid(self, query_id):
+        assert query_id == self.sfqid
+    
+    def fetchall(self):
+        return self.rows
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeAsyncConnection(FakeConnection):
+    """Connection whose query keeps running for a few status polls."""
+    
+    def __init__(self, rows, polls_until_done=3):
+        super().__init__()
+        self.rows = rows
+        self.polls_left = polls_until_done
+        self.status_checks = 0
+    
+    def cursor(self, cursor_class=None):
+        return FakeAsyncCursor(self.rows)
+    
+    def get_query_status_throw_if_error(self, query_id):
+        self.status_checks += 1
+        self.polls_left -= 1
+        return "RUNNING" if self.polls_left > 0 else "SUCCESS"
+    
+    def is_still_running(self, status):
+        return status == "RUNNING"
+
+
+def test_execute_query_async_polls_until_done():
+    """execute_query_async polls the query id and returns the fetched rows."""
+    import asyncio
+    from adk_app.core.database import SnowflakeConnectionManager
+    
+    rows = [(1,)]
+    conn = FakeAsyncConnection(rows)
+    manager = SnowflakeConnectionManager()
+    manager._pool = SnowflakeConnectionPool(lambda: conn, min_size=0, max_size=1)
+    
+    result = asyncio.run(manager.execute_query_async("SELECT 1", poll_interval=0.001))
+    
+    assert result == [{"ID": 1}]
+    assert conn.status_checks == 3
+    assert manager.pool_stats()["in_use"] == 0
+
+
+def test_execute_query_async_releases_connection_on_early_failure_and_cancel():
+    """Bad arguments and cancellation during checkout don't leak pool slots."""
+    import asyncio
+    from adk_app.core.database import SnowflakeConnectionManager
+    
+    def slow_factory():
+        time.sleep(0.05)
+        return FakeAsyncConnection([(1,)])
+    
+    manager = SnowflakeConnectionManager()
+    manager._pool = SnowflakeConnectionPool(slow_factory, min_size=0, max_size=1)
+    
+    with pytest.raises(ValueError):
+        asyncio.run(manager.execute_query_async("SELECT 1", result_format="xml", use_cache=False))
+    assert manager.pool_stats()["in_use"] == 0
+    
+    async def cancel_during_checkout():
+        task = asyncio.create_task(manager.execute_query_async("SELECT 2", use_cache=False))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.1)
+    
+    asyncio.run(cancel_during_checkout())
+    assert manager.pool_stats()["in_use"] == 0
+
+
+def test_cancel_during_a_worker_step_waits_before_release_and_cancels_query():
+    """A connection still used by a worker isn't released until the step ends; the submitted query is cancelled."""
+    import asyncio
+    from adk_app.core.database import SnowflakeConnectionManager
+    
+    class SlowSubmitCursor(FakeAsyncCursor):
+        def __init__(self, conn):
+            super().__init__(conn.rows)
+            self.conn = conn
+        
+        def execute_async(self, query, params=None):
+            time.sleep(0.1)
+            super().execute_async(query, params)
+        
+        def execute(self, query, params=None):
+            self.conn.cancelled.append(params[0])
+    
+    class SlowSubmitConnection(FakeAsyncConnection):
+        def __init__(self):
+            super().__init__([(1,)])
+            self.cancelled = []
+        
+        def cursor(self, cursor_class=None):
+            return SlowSubmitCursor(self)
+    
+    conn = SlowSubmitConnection()
+    manager = SnowflakeConnectionManager()
+    manager._pool = SnowflakeConnectionPool(lambda: conn, min_size=0, max_size=1)
+    
+    async def cancel_during_submit():
+        task = asyncio.create_task(manager.execute_query_async("SELECT 1", use_cache=False))
+        await asyncio.sleep(0.03)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        in_use_while_submitting = manager.pool_stats()["in_use"]
+        await asyncio.sleep(0.2)
+        return in_use_while_submitting
+    
+    assert asyncio.run(cancel_during_submit()) == 1
+    assert manager.pool_stats()["in_use"] == 0
+    assert conn.cancelled == ["query-1"]
@@ -0,0 +1,47 @@
+"""Tests for the point-in-district spatial index."""
+from adk_app.core.district_index import DistrictIndex
+from adk_app.core.gazetteer import DistrictGazetteer
+from adk_app.core.geocoding import Geocoder, GeocodingCache
+
+
+def test_points_resolve_to_containing_district():
+    """Points inside Bangladesh resolve to their district; points outside to none."""
+    index = DistrictIndex(DistrictGazetteer())
+    
+    results = index.locate_many([(24.90, 89.40), (22.40, 91.80), (51.50, -0.12)])
+    
+    assert [result and result["name"] for result in results] == ["Bogra", "Chittagong", None]
+    assert results[0]["distance_km"] < 10
+
+
+def test_points_across_the_border_resolve_to_none():
+    """Indian cities near a district headquarters aren't labelled with that district."""
+    index = DistrictIndex(DistrictGazetteer())
+    kolkata, agartala, shillong, siliguri = (22.5726, 88.3639), (23.8315, 91.2868), (25.5788, 91.8933), (26.7271, 88.3953)
+    
+    assert index.locate_many([kolkata, agartala, shillong, siliguri]) == [None, None, None, None]
+
+
+def test_every_headquarters_is_in_its_own_district():
+    """Each district's area contains its headquarters."""
+    gazetteer = DistrictGazetteer()
+    index = DistrictIndex(gazetteer)
+    entries = [gazetteer.lookup(name) for name in gazetteer.district_names]
+    
+    results = index.locate_many([(entry["latitude"], entry["longitude"]) for entry in entries])
+    
+    assert [result and result["name"] for result in results] == [entry["name"] for entry in entries]
+
+
+def test_geocoder_accepts_coordinates():
+    """A "lat, lon" location keeps its coordinates and is named after its district, offline."""
+    gazetteer = DistrictGazetteer()
+    geocoder = Geocoder(gazetteer, GeocodingCache(), DistrictIndex(gazetteer))
+    
+    result = geocoder.geocode("25.75, 89.25")
+    kolkata = geocoder.geocode("22.5726, 88.3639")
+    
+    assert (result["latitude"], result["longitude"]) == (25.75, 89.25)
+    assert result["district"] == "Rangpur"
+    assert "district" not in kolkata and kolkata["name"] != "Satkhira"
+    assert geocoder.stats()["api_calls"] == 0
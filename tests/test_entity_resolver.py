@@ -0,0 +1,52 @@
+"""Tests for fuzzy district / variety name resolution."""
+from adk_app.core.entity_resolver import EntityResolver, normalize
+
+DISTRICTS = ["Bagerhat", "Bogra", "Chittagong", "Cox's Bazar", "Dhaka", "Rajbari", "Rajshahi", "Rangpur"]
+CROP_TYPES = [
+    "High Yielding Variety (HYV) Aman",
+    "(Broadcast+L.T + HYV) Aman",
+    "Local Transplanted (L.T) Aman",
+    "HYV Boro",
+    "Local Boro",
+]
+
+
+def test_normalize_expands_abbreviations_and_drops_punctuation():
+    """Spelling and abbreviation variants normalize to the same key."""
+    assert normalize("Cox's Bazar District") == normalize("coxs bazar")
+    assert normalize("HYV Aman", {"hyv": "high yielding variety"}) == normalize(
+        "High Yielding Variety (HYV) Aman", {"hyv": "high yielding variety"}
+    )
+
+
+def test_district_aliases_map_to_catalog_spelling():
+    """Alternate spellings resolve to whichever spelling the catalog holds."""
+    resolver = EntityResolver.for_districts(DISTRICTS)
+    
+    assert resolver.resolve("Chattogram").value == "Chittagong"
+    assert resolver.resolve("Bogura").value == "Bogra"
+    assert resolver.resolve("Cox Bazar").value == "Cox's Bazar"
+    assert resolver.resolve("dhaka").method == "exact"
+
+
+def test_fuzzy_match_requires_a_clear_winner():
+    """Typos resolve; short or ambiguous input stays unresolved with suggestions."""
+    resolver = EntityResolver.for_districts(DISTRICTS)
+    
+    match = resolver.resolve("Rajshai")
+    assert match.value == "Rajshahi" and match.method == "fuzzy"
+    
+    unresolved = resolver.resolve("Raj")
+    assert not unresolved.resolved
+    assert "Rajbari" in unresolved.candidates
+
+
+def test_crop_type_abbreviations():
+    """Common short forms resolve to the full CROP_TYPE value."""
+    resolver = EntityResolver.for_crop_types(CROP_TYPES)
+    
+    assert resolver.resolve("HYV aman").value == "High Yielding Variety (HYV) Aman"
+    assert resolver.resolve("L.T Aman").value == "Local Transplanted (L.T) Aman"
+    assert resolver.resolve("hyv boro").value == "HYV Boro"
+    # A bare season matches several varieties and is left to the LIKE query
+    assert not resolver.resolve("Aman").resolved
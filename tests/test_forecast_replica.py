@@ -0,0 +1,201 @@
+"""Tests for the in-memory forecast replica."""
+from adk_app.core.columnar import ColumnarResult
+from adk_app.core.forecast_replica import ForecastSnapshot
+
+
+def make_snapshot():
+    rows = [
+        (1, "Dhaka", "High Yielding Variety (HYV) Aman", 2025, 2.50, "2025-08-24"),
+        (2, "Dhaka", "High Yielding Variety (HYV) Aman", 2025, 2.60, "2025-09-01"),
+        (3, "Dhaka", "HYV Boro", 2025, 4.10, "2025-08-24"),
+        (4, "Bogra", "High Yielding Variety (HYV) Aman", 2026, 2.70, "2025-08-20"),
+        (5, "Bogra", "Local Transplanted (L.T) Aman", 2025, 1.90, None),
+    ]
+    names = ["id", "district_name", "crop_type", "forecast_year", "predicted_yield", "prediction_date"]
+    columns = {name: [row[i] for row in rows] for i, name in enumerate(names)}
+    return ForecastSnapshot(ColumnarResult(columns))
+
+
+def test_forecast_lookup_uses_district_year_and_variety():
+    """Lookups match district/year exactly and variety by substring, newest first."""
+    snapshot = make_snapshot()
+    
+    result = snapshot.forecasts("(hyv) aman", "DHAKA", 2025, limit=10)
+    
+    assert result.column("id") == [2, 1]
+    assert not snapshot.forecasts("Boro", "Bogra", 2025, limit=10)
+
+
+def test_latest_orders_by_prediction_date_then_year():
+    """Latest forecasts are ordered by prediction date with NULLs last."""
+    snapshot = make_snapshot()
+    
+    assert snapshot.latest(10).column("id") == [2, 1, 3, 4, 5]
+    assert snapshot.latest(2).column("id") == [2, 1]
+
+
+def test_summary_groups_by_variety_district_year():
+    """Summary statistics match the GROUP BY query."""
+    snapshot = make_snapshot()
+    
+    summary = snapshot.summary(crop_type="(HYV) Aman", district="dhaka").to_records()
+    
+    assert len(summary) == 1
+    assert summary[0]["forecast_count"] == 2
+    assert summary[0]["min_predicted_yield"] == 2.50
+    assert summary[0]["max_predicted_yield"] == 2.60
+    assert summary[0]["latest_prediction_date"] == "2025-09-01"
+
+
+def test_catalog_from_snapshot():
+    """The discovery catalog built from the replica is ordered like the SQL it replaces."""
+    from adk_app.core.forecast_catalog import ForecastCatalog
+    
+    catalog = ForecastCatalog.from_snapshot(make_snapshot())
+    
+    assert catalog.crop_types().to_records()[0] == {
+        "crop_type": "High Yielding Variety (HYV) Aman", "forecast_count": 3
+    }
+    assert catalog.district_names == ["Bogra", "Dhaka"]
+    assert catalog.years().to_records() == [
+        {"forecast_year": 2026, "forecast_count": 1},
+        {"forecast_year": 2025, "forecast_count": 4},
+    ]
+    assert catalog.total_forecasts == 5
+
+
+def test_merge_is_copy_on_write():
+    """Merging upserts by ID into a new snapshot and leaves the old one intact."""
+    snapshot = make_snapshot()
+    delta = ColumnarResult({
+        "id": [2, 6],
+        "district_name": ["Dhaka", "Rangpur"],
+        "crop_type": ["High Yielding Variety (HYV) Aman", "HYV Boro"],
+        "forecast_year": [2025, 2027],
+        "predicted_yield": [2.65, 3.9],
+        "prediction_date": ["2025-09-01", "2025-09-02"],
+    })
+    
+    merged, inserted, updated = snapshot.merge(delta)
+    
+    assert (inserted, updated) == (1, 1)
+    assert merged.version == snapshot.version + 1
+    assert merged.forecasts("(HYV) Aman", "Dhaka", 2025, 1).column("predicted_yield") == [2.65]
+    assert snapshot.forecasts("(HYV) Aman", "Dhaka", 2025, 1).column("predicted_yield") == [2.60]
+    assert merged.watermark() == ("2025-09-02", 6)
+
+
+def test_refresh_engine_pulls_only_rows_past_watermark():
+    """After the first full load, refreshes query from the watermark and merge the delta."""
+    from adk_app.core.database import ForecastRefreshEngine
+    from adk_app.core.forecast_replica import ForecastReplica
+    
+    class FakeManager:
+        def __init__(self):
+            self.calls = []
+        
+        def execute_query(self, query, params=None, fetch_all=True, result_format="rows", use_cache=True):
+            self.calls.append(params)
+            return ColumnarResult({
+                "id": [7], "district_name": ["Sylhet"], "crop_type": ["HYV Boro"],
+                "forecast_year": [2026], "predicted_yield": [4.2], "prediction_date": ["2025-09-03"],
+            })
+    
+    replica = ForecastReplica(enabled=True)
+    replica.swap(make_snapshot())
+    manager = FakeManager()
+    engine = ForecastRefreshEngine(replica, manager=manager)
+    
+    cycle = engine.refresh_once()
+    
+    assert manager.calls == [{"watermark_date": "2025-09-01"}]
+    assert cycle["mode"] == "incremental"
+    assert cycle["rows_merged"] == 1
+    assert len(replica.current()) == 6
+    stats = engine.stats()
+    assert stats["cycles"] == 1
+    assert stats["watermark_prediction_date"] == "2025-09-03"
+    assert stats["refresh_lag_s"] is not None
+
+
+def test_refresh_engine_reloads_in_full_periodically():
+    """A due full refresh replaces the snapshot, dropping deleted rows the watermark can't see."""
+    from adk_app.core.database import ForecastRefreshEngine
+    from adk_app.core.forecast_replica import ForecastReplica
+    
+    class FakeManager:
+        def __init__(self):
+            self.calls = []
+        
+        def execute_query(self, query, params=None, fetch_all=True, result_format="rows", use_cache=True):
+            self.calls.append(params)
+            return ColumnarResult({
+                "id": [1], "district_name": ["Bogra"], "crop_type": ["HYV Boro"],
+                "forecast_year": [2025], "predicted_yield": [4.0], "prediction_date": ["2025-08-01"],
+            })
+    
+    replica = ForecastReplica(enabled=True)
+    replica.swap(make_snapshot())
+    manager = FakeManager()
+    engine = ForecastRefreshEngine(replica, manager=manager, full_refresh_seconds=60)
+    engine._last_full_refresh -= 61
+    
+    cycle = engine.refresh_once()
+    
+    assert manager.calls == [None]
+    assert cycle["mode"] == "full"
+    assert cycle["rows_dropped"] == 4
+    assert len(replica.current()) == 1
+    assert engine.stats()["full_refreshes"] == 1
+    assert engine.refresh_once()["mode"] == "incremental"
+
+
+def test_refresh_engine_merges_under_the_load_lock():
+    """The delta pull and merge hold the replica's load lock, so a full load can't interleave."""
+    from adk_app.core.database import ForecastRefreshEngine
+    from adk_app.core.forecast_replica import ForecastReplica
+    
+    replica = ForecastReplica(enabled=True)
+    replica.swap(make_snapshot())
+    
+    class FakeManager:
+        def __init__(self):
+            self.lock_held = []
+        
+        def execute_query(self, query, params=None, fetch_all=True, result_format="rows", use_cache=True):
+            self.lock_held.append(replica._load_lock.locked())
+            return ColumnarResult({
+                "id": [7], "district_name": ["Sylhet"], "crop_type": ["HYV Boro"],
+                "forecast_year": [2026], "predicted_yield": [4.2], "prediction_date": ["2025-09-03"],
+            })
+    
+    manager = FakeManager()
+    engine = ForecastRefreshEngine(replica, manager=manager)
+    
+    engine.refresh_once()
+    
+    assert manager.lock_held == [True]
+    assert not replica._load_lock.locked()
+    assert len(replica.current()) == 6
+
+def test_catalog_from_grouping_sets():
+    """GROUPING SETS rows are split into varieties, districts, years and the total."""
+    from adk_app.core.forecast_catalog import ForecastCatalog
+    
+    result = ColumnarResult({
+        "crop_type": ["HYV Boro", "HYV Aman", None, None, None],
+        "district_name": [None, None, "Dhaka", None, None],
+        "forecast_year": [None, None, None, 2025, None],
+        "forecast_count": [2, 3, 5, 5, 5],
+        "grouped_crop_type": [0, 0, 1, 1, 1],
+        "grouped_district_name": [1, 1, 0, 1, 1],
+        "grouped_forecast_year": [1, 1, 1, 0, 1],
+    })
+    
+    catalog = ForecastCatalog.from_grouping_sets(result)
+    
+    assert catalog.crop_type_names == ["HYV Aman", "HYV Boro"]
+    assert catalog.district_names == ["Dhaka"]
+    assert catalog.forecast_years == [2025]
+    assert catalog.total_forecasts == 5
+    assert catalog.version == ForecastCatalog.from_grouping_sets(result).version
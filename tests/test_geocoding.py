@@ -0,0 +1,68 @@
+"""Tests for the district gazetteer and geocoding cache."""
+from adk_app.core import geocoding
+from adk_app.core.gazetteer import BANGLADESH_DISTRICTS, DistrictGazetteer
+from adk_app.core.geocoding import Geocoder, GeocodingCache
+
+
+class FakeHttpClient:
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+    
+    def get_json(self, url, params=None, timeout=None):
+        self.calls += 1
+        return {"results": self.results} if self.results else {}
+
+
+def test_gazetteer_covers_all_districts_and_aliases():
+    """All 64 districts are bundled; renamed spellings resolve offline."""
+    gazetteer = DistrictGazetteer()
+    
+    assert len(gazetteer) == len(BANGLADESH_DISTRICTS) == 64
+    assert gazetteer.lookup("Chattogram, Bangladesh")["name"] == "Chittagong"
+    assert gazetteer.lookup("Bogura")["latitude"] == 24.8465
+    assert gazetteer.lookup("London") is None
+    # Near misses may be places elsewhere unless the country says otherwise
+    assert gazetteer.lookup("Ghazipur") is None
+    assert gazetteer.lookup("Ghazipur, Bangladesh")["name"] == "Gazipur"
+
+
+def test_geocoder_skips_api_for_known_districts(monkeypatch, tmp_path):
+    """Districts never hit the API; other places are fetched once and cached on disk."""
+    client = FakeHttpClient([{"name": "London", "latitude": 51.5, "longitude": -0.12, "country": "United Kingdom"}])
+    monkeypatch.setattr(geocoding, "get_http_client", lambda: client)
+    path = tmp_path / "geocoding.json"
+    geocoder = Geocoder(DistrictGazetteer(), GeocodingCache(path=path))
+    
+    assert geocoder.geocode("Dhaka")["name"] == "Dhaka"
+    assert geocoder.geocode("London")["latitude"] == 51.5
+    assert geocoder.geocode("  london ")["latitude"] == 51.5
+    assert client.calls == 1
+    
+    # A fresh process reads the entry back from disk
+    restarted = Geocoder(DistrictGazetteer(), GeocodingCache(path=path))
+    assert restarted.geocode("London")["name"] == "London"
+    assert client.calls == 1
+    assert restarted.stats()["cache_hits"] == 1
+
+
+def test_geocoder_caches_misses(monkeypatch):
+    """Unknown places are cached as misses too."""
+    client = FakeHttpClient([])
+    monkeypatch.setattr(geocoding, "get_http_client", lambda: client)
+    geocoder = Geocoder(DistrictGazetteer(), GeocodingCache())
+    
+    assert geocoder.geocode("InvalidCityXYZ123") is None
+    assert geocoder.geocode("InvalidCityXYZ123") is None
+    assert client.calls == 1
+
+
+def test_division_expands_to_its_districts():
+    """A division name lists every district in it."""
+    gazetteer = DistrictGazetteer()
+    
+    districts = gazetteer.division_districts("Rajshahi Division")
+    
+    assert len(districts) == 8
+    assert {"Bogra", "Pabna"} <= {d["name"] for d in districts}
+    assert gazetteer.division_districts("Rajshahi") is None
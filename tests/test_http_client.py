@@ -0,0 +1,41 @@
+"""Tests for the shared pooled HTTP clients."""
+import asyncio
+import httpx
+from adk_app.core.http_client import AsyncHttpClient, HttpClient, get_http_client
+
+
+def test_sync_client_pools_per_host():
+    """The session mounts one keep-alive adapter with the configured per-host limit."""
+    client = HttpClient(pool_connections=4, max_connections_per_host=3, connect_timeout=1, read_timeout=5)
+    
+    adapter = client.session.get_adapter("https://api.open-meteo.com/v1/forecast")
+    
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block is True
+    assert client.timeout == (1, 5)
+    assert get_http_client() is get_http_client()
+
+
+def test_async_client_reuses_one_client_per_loop():
+    """Requests on the same event loop share one httpx client and its pool."""
+    seen = []
+    
+    def handler(request):
+        seen.append(request.url.params["name"])
+        return httpx.Response(200, json={"ok": True})
+    
+    client = AsyncHttpClient(max_connections_per_host=2, transport=httpx.MockTransport(handler))
+    
+    async def run():
+        results = await asyncio.gather(*[
+            client.get_json("https://geocoding-api.open-meteo.com/v1/search", {"name": f"place-{i}"})
+            for i in range(5)
+        ])
+        await client.aclose()
+        return results
+    
+    results = asyncio.run(run())
+    
+    assert results == [{"ok": True}] * 5
+    assert sorted(seen) == [f"place-{i}" for i in range(5)]
+    assert client.stats()["requests"] == 5
@@ -0,0 +1,96 @@
+"""Tests for deterministic intent pre-routing."""
+import asyncio
+import time
+from google.adk.agents import BaseAgent, ParallelAgent
+from google.adk.events import Event
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+from adk_app.agents.multi.router import IntentRoutingAgent
+from adk_app.core.intent_router import IntentRouter, NaiveBayesIntentClassifier, TRAINING_EXAMPLES
+
+
+def test_unambiguous_queries_bypass_the_coordinator():
+    """Single-topic queries go to a specialist, multi-topic ones to both; greetings and vague ones don't."""
+    router = IntentRouter(NaiveBayesIntentClassifier(TRAINING_EXAMPLES))
+    
+    routes = [router.route(query).route for query in [
+        "What's the weather in Dhaka?",
+        "What's the yield forecast for HYV Boro in Mymensingh for 2026?",
+        "Show me all available districts",
+        "Hello!",
+        "What's the weather in London and what yield can I expect for wheat?",
+        "what about Bogra?",
+    ]]
+    
+    assert routes == ["weather", "yield", "yield", None, "parallel", None]
+    stats = router.stats()
+    assert stats["routes"] == {"weather": 1, "yield": 2, "parallel": 1, "coordinator": 2}
+    assert stats["recent"][-2]["reason"] == "multiple intents: weather, yield"
+
+
+
+def test_rule_terms_match_whole_words():
+    """Words that merely start with a rule term, like "window", don't count as that intent."""
+    router = IntentRouter(NaiveBayesIntentClassifier(TRAINING_EXAMPLES))
+    
+    assert router.route("What's the harvest window for boro in Dhaka?").route == "yield"
+    assert router.route("Will it be windy in Sylhet tomorrow?").route == "weather"
+
+class EchoAgent(BaseAgent):
+    """Replies with its own name after delay seconds."""
+
+    delay: float = 0.0
+
+    async def _run_async_impl(self, ctx):
+        await asyncio.sleep(self.delay)
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            content=types.Content(role="model", parts=[types.Part(text=self.name)])
+        )
+
+
+def test_routing_agent_runs_only_the_chosen_sub_agent():
+    """The root agent hands each turn to exactly one sub-agent."""
+    router = IntentRoutingAgent(
+        name="router",
+        sub_agents=[EchoAgent(name="coordinator_agent"), EchoAgent(name="weather_agent"), EchoAgent(name="yield_agent")]
+    )
+    runner = InMemoryRunner(agent=router, app_name="test")
+    
+    async def ask(text):
+        session = await runner.session_service.create_session(app_name="test", user_id="u")
+        message = types.Content(role="user", parts=[types.Part(text=text)])
+        return [event.author async for event in runner.run_async(user_id="u", session_id=session.id, new_message=message)]
+    
+    assert asyncio.run(ask("Will it rain tomorrow in Sylhet?")) == ["weather_agent"]
+    assert asyncio.run(ask("Hi there")) == ["coordinator_agent"]
+
+
+
+def test_multi_topic_queries_run_specialists_concurrently():
+    """Both specialists run at once and their answers come back as one reply, weather first."""
+    router = IntentRoutingAgent(
+        name="router",
+        sub_agents=[
+            EchoAgent(name="coordinator_agent"),
+            ParallelAgent(name="multi_topic", sub_agents=[
+                EchoAgent(name="weather_agent_parallel", delay=0.3),
+                EchoAgent(name="yield_agent_parallel", delay=0.2),
+            ]),
+        ]
+    )
+    runner = InMemoryRunner(agent=router, app_name="test")
+    
+    async def ask(text):
+        session = await runner.session_service.create_session(app_name="test", user_id="u")
+        message = types.Content(role="user", parts=[types.Part(text=text)])
+        return [event async for event in runner.run_async(user_id="u", session_id=session.id, new_message=message)]
+    
+    start = time.perf_counter()
+    events = asyncio.run(ask("What's the weather in Rajshahi and the Aman rice yield forecast there?"))
+    elapsed = time.perf_counter() - start
+    
+    assert [event.author for event in events] == ["router"]
+    assert events[0].content.parts[0].text == "weather_agent_parallel\n\n---\n\nyield_agent_parallel"
+    assert elapsed < 0.45
@@ -0,0 +1,27 @@
+"""Tests for the shared session memory manager."""
+import asyncio
+from adk_app.core.memory import MemoryManager
+
+
+def test_users_share_one_service_and_idle_sessions_expire():
+    """Sessions are keyed by user and session id in one service; idle ones are deleted."""
+    manager = MemoryManager(ttl_seconds=60)
+    service = manager.get_session_service()
+    
+    async def scenario():
+        await manager.ensure_session("app", "alice", "s1")
+        again = await manager.ensure_session("app", "alice", "s1")
+        await manager.ensure_session("app", "bob", "s2")
+        assert again.id == "s1" and manager.stats()["active_users"] == 2
+        
+        manager._last_used[("app", "alice", "s1")] -= 120
+        assert await manager.expire_idle_sessions() == 1
+        assert await service.get_session(app_name="app", user_id="alice", session_id="s1") is None
+        
+        await manager.end_session("app", "bob", "s2")
+        assert await service.get_session(app_name="app", user_id="bob", session_id="s2") is None
+    
+    asyncio.run(scenario())
+    assert manager.stats()["created"] == 2
+    assert manager.stats()["expired"] == 1
+    assert manager.stats()["active_sessions"] == 0
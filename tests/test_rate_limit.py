@@ -0,0 +1,62 @@
+"""Tests for the shared Open-Meteo rate limiter."""
+import asyncio
+import threading
+import time
+import httpx
+from adk_app.core.http_client import AsyncHttpClient
+from adk_app.core.rate_limit import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, RateLimiter
+
+
+def test_interactive_callers_go_before_queued_background_callers():
+    """Once tokens run out, waiters are served by priority, not arrival order."""
+    limiter = RateLimiter(rate=20, burst=1)
+    limiter.acquire()
+    served = []
+    
+    def take(name, priority):
+        limiter.acquire(priority=priority)
+        served.append(name)
+    
+    background = threading.Thread(target=take, args=("prefetch", PRIORITY_BACKGROUND))
+    background.start()
+    time.sleep(0.01)
+    interactive = threading.Thread(target=take, args=("user", PRIORITY_INTERACTIVE))
+    interactive.start()
+    background.join()
+    interactive.join()
+    
+    assert served == ["user", "prefetch"]
+    assert limiter.stats()["waited"] == 2
+
+
+def test_throttling_halves_rate_and_success_recovers_it():
+    """Backoff is multiplicative, recovery additive."""
+    limiter = RateLimiter(rate=4, recovery=0.25, backoff_base=0.01)
+    
+    pause = limiter.throttled()
+    
+    assert 0.005 <= pause <= 0.01
+    assert limiter.stats()["rate_per_second"] == 2
+    limiter.succeeded()
+    assert limiter.stats()["rate_per_second"] == 3
+    assert limiter.throttled(retry_after=0.02) == 0.02
+
+
+def test_async_client_retries_throttled_responses():
+    """A 429 backs the shared limiter off and the request is retried."""
+    responses = [httpx.Response(429), httpx.Response(503), httpx.Response(200, json={"ok": True})]
+    limiter = RateLimiter(rate=100, burst=10, backoff_base=0.01)
+    client = AsyncHttpClient(
+        transport=httpx.MockTransport(lambda request: responses.pop(0)),
+        limiter=limiter,
+        max_retries=3
+    )
+    
+    async def run():
+        result = await client.get_json("https://api.open-meteo.com/v1/forecast")
+        await client.aclose()
+        return result
+    
+    assert asyncio.run(run()) == {"ok": True}
+    assert client.stats()["retries"] == 2
+    assert limiter.stats()["throttled"] == 2
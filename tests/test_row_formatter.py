@@ -0,0 +1,49 @@
+"""Tests for the description-driven row formatter."""
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from snowflake.connector.cursor import ResultMetadata
+from adk_app.core.row_formatter import RowFormatter
+
+# type codes: 0 FIXED, 1 REAL, 2 TEXT, 3 DATE, 7 TIMESTAMP_TZ, 8 TIMESTAMP_NTZ
+DESCRIPTION = [
+    ResultMetadata("ID", 0, None, None, 38, 0, False),
+    ResultMetadata("DISTRICT_NAME", 2, None, None, None, None, True),
+    ResultMetadata("PREDICTED_YIELD", 0, None, None, 10, 2, True),
+    ResultMetadata("PREDICTION_DATE", 3, None, None, None, None, True),
+    ResultMetadata("CREATED_AT", 8, None, None, 0, 9, True),
+    ResultMetadata("UPDATED_AT", 7, None, None, 0, 9, True),
+]
+
+ROWS = [
+    (1, "Dhaka", Decimal("2.50"), date(2025, 8, 24), datetime(2025, 8, 24, 10, 30), datetime(2025, 8, 24, tzinfo=timezone.utc)),
+    (2, "Bogra", None, None, None, None),
+]
+
+
+def test_format_rows_converts_by_column_type():
+    """NUMBER scale picks int vs float; dates and timestamps become ISO strings."""
+    formatter = RowFormatter.from_description(DESCRIPTION)
+    
+    rows = formatter.format_rows(ROWS)
+    
+    assert rows[0] == {
+        "ID": 1,
+        "DISTRICT_NAME": "Dhaka",
+        "PREDICTED_YIELD": 2.5,
+        "PREDICTION_DATE": "2025-08-24",
+        "CREATED_AT": "2025-08-24T10:30:00",
+        "UPDATED_AT": "2025-08-24T00:00:00+00:00",
+    }
+    assert rows[1]["PREDICTED_YIELD"] is None
+    assert isinstance(rows[0]["PREDICTED_YIELD"], float)
+
+
+def test_to_columnar_lowercases_names():
+    """The Arrow fallback produces the same columns as the Arrow path."""
+    formatter = RowFormatter.from_description(DESCRIPTION)
+    
+    result = formatter.to_columnar(ROWS)
+    
+    assert result.column_names[:2] == ["id", "district_name"]
+    assert result.column("predicted_yield") == [2.5, None]
+    assert len(formatter.to_columnar([])) == 0
@@ -0,0 +1,126 @@
+"""Tests for the native coroutine weather tools."""
+import asyncio
+import httpx
+import pytest
+from adk_app.core.weather_cache import ForecastCache
+from adk_app.tools import weather_tools
+
+
+class SlowAsyncClient:
+    """Fake async HTTP client whose forecast requests take a while."""
+
+    def __init__(self):
+        self.started = 0
+        self.cancelled = 0
+
+    async def get_json(self, url, params=None, timeout=None, priority=None, cost=1.0):
+        self.started += 1
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        forecast = {"current": {"temperature_2m": 31.0, "weather_code": 0}}
+        points = str(params["latitude"]).count(",") + 1
+        return forecast if points == 1 else [forecast] * points
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = SlowAsyncClient()
+    monkeypatch.setattr(weather_tools, "get_async_http_client", lambda: client)
+    cache = ForecastCache()
+    monkeypatch.setattr(weather_tools, "get_forecast_cache", lambda: cache)
+    return client
+
+
+def test_concurrent_identical_requests_share_one_fetch(client):
+    """Identical calls in flight at the same time make a single upstream request."""
+    async def scenario():
+        return await asyncio.gather(*(weather_tools.get_weather_report_async("Bogra") for _ in range(5)))
+    
+    results = asyncio.run(scenario())
+    
+    assert client.started == 1
+    assert all(result["current_weather"]["temperature"] == "31.0°C" for result in results)
+
+
+def test_cancelled_leader_cancels_request_and_waiter_retries(client):
+    """Cancelling the fetching turn cancels its request; a waiting call fetches again."""
+    async def scenario():
+        leader = asyncio.create_task(weather_tools.get_weather_report_async("Bogra"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(weather_tools.get_weather_report_async("Bogra"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+    
+    result = asyncio.run(scenario())
+    
+    assert client.cancelled == 1
+    assert client.started == 2
+    assert result["status"] == "success"
+
+
+def test_async_tool_keeps_the_tool_name():
+    """ADK exposes the coroutine under the plain tool's name and docstring."""
+    assert weather_tools.get_weather_report_async.__name__ == "get_weather_report"
+    assert weather_tools.get_weather_report_async.__doc__ == weather_tools.get_weather_report.__doc__
+
+
+def test_sync_call_on_the_loop_does_not_wait_on_an_async_fetch():
+    """A blocking caller on the event loop fetches itself instead of deadlocking on the loop's fetch."""
+    cache = ForecastCache()
+    
+    async def slow_fetch(latitude, longitude):
+        await asyncio.sleep(0.05)
+        return "async"
+    
+    async def sync_caller():
+        await asyncio.sleep(0.01)
+        return cache.get_or_fetch(23.8, 90.4, lambda latitude, longitude: "sync")
+    
+    async def scenario():
+        return await asyncio.wait_for(
+            asyncio.gather(cache.get_or_fetch_async(23.8, 90.4, slow_fetch), sync_caller()), timeout=5
+        )
+    
+    assert asyncio.run(scenario()) == [("async", "miss"), ("sync", "miss")]
+
+
+def test_locations_tool_fetches_all_locations_in_one_request(client):
+    """The async multi-location tool batches its misses into one awaited request."""
+    result = asyncio.run(weather_tools.get_weather_for_locations_async(["Bogra", "Dhaka", "Rangpur"]))
+    
+    assert client.started == 1
+    assert result["count"] == 3
+    assert weather_tools.get_weather_for_locations_async.__name__ == "get_weather_for_locations"
+
+
+def test_locations_tool_reports_async_http_errors(client, monkeypatch):
+    """httpx errors from the async client become an error response, not an unexpected error."""
+    async def failing_get_json(url, params=None, timeout=None, priority=None, cost=1.0):
+        raise httpx.ConnectError("connection refused")
+    
+    monkeypatch.setattr(client, "get_json", failing_get_json)
+    
+    result = asyncio.run(weather_tools.get_weather_for_locations_async(["Bogra", "Dhaka"]))
+    
+    assert result["status"] == "error"
+    assert result["error_message"].startswith("Failed to fetch weather data")
+
+
+def test_agromet_tool_reports_async_http_errors(client, monkeypatch):
+    """The async agromet tool awaits its fetch and reports httpx errors as fetch errors."""
+    async def failing_get_json(url, params=None, timeout=None, priority=None, cost=1.0):
+        raise httpx.ReadTimeout("timed out")
+    
+    monkeypatch.setattr(client, "get_json", failing_get_json)
+    
+    result = asyncio.run(weather_tools.get_agromet_indices_async(["Bogra"]))
+    
+    assert result["status"] == "error"
+    assert result["error_message"].startswith("Failed to fetch weather data")
+    assert weather_tools.get_agromet_indices_async.__name__ == "get_agromet_indices"
@@ -0,0 +1,151 @@
+"""Tests for the grid-cell weather forecast cache."""
+import threading
+import time
+from adk_app.core.weather_cache import ForecastCache
+
+
+def test_points_in_one_cell_share_an_entry():
+    """Nearby points map to the same cell and are fetched once, at the cell center."""
+    cache = ForecastCache(cell_degrees=0.1)
+    calls = []
+    fetcher = lambda lat, lon: calls.append((lat, lon)) or {"lat": lat}
+    
+    first, status = cache.get_or_fetch(23.8103, 90.4125, fetcher)
+    second, second_status = cache.get_or_fetch(23.84, 90.44, fetcher)
+    
+    assert (status, second_status) == ("miss", "fresh")
+    assert first is second
+    assert calls == [(23.85, 90.45)]
+
+
+def test_fresh_until_next_model_update():
+    """Entries expire at the next update boundary plus the publication delay."""
+    cache = ForecastCache(update_interval=3600, update_delay=600)
+    
+    assert cache.next_update(7200 + 900) == 7200 + 600 + 3600
+    assert cache.next_update(7200 + 300) == 7200 + 600
+
+
+
+def test_archive_entries_never_expire():
+    """Historical ranges stay fresh however old; forecast ranges don't."""
+    cache = ForecastCache(update_interval=3600, max_stale=6 * 3600)
+    archive = cache.key(23.81, 90.41, ("archive", "2024-01-01", "2024-01-31"))
+    recent = cache.key(23.81, 90.41, ("daily", "2025-09-01", "2025-09-30"))
+    week_ago = time.time() - 7 * 86400
+    cache.put(archive, "january", fetched_at=week_ago)
+    cache.put(recent, "september", fetched_at=week_ago)
+    fetcher = lambda lat, lon: "refetched"
+    
+    assert cache.get_or_fetch(23.81, 90.41, fetcher, variant=archive[2]) == ("january", "fresh")
+    assert cache.get_or_fetch(23.81, 90.41, fetcher, variant=recent[2]) == ("refetched", "miss")
+
+def test_stale_entry_is_served_while_refreshing():
+    """A stale hit returns the old payload immediately and refreshes in the background."""
+    cache = ForecastCache(update_interval=3600, max_stale=6 * 3600)
+    key = cache.key(23.81, 90.41)
+    # Fetched more than one update interval ago: past its model run, within max_stale
+    cache.put(key, "old", fetched_at=time.time() - 3601)
+    refreshed = threading.Event()
+    
+    def fetcher(lat, lon):
+        refreshed.set()
+        return "new"
+    
+    value, status = cache.get_or_fetch(23.81, 90.41, fetcher)
+    
+    assert (value, status) == ("old", "stale")
+    assert refreshed.wait(2)
+    for _ in range(100):
+        if cache.stats()["background_refreshes"]:
+            break
+        time.sleep(0.01)
+    assert cache.get_or_fetch(23.81, 90.41, fetcher) == ("new", "fresh")
+
+
+def test_concurrent_misses_are_coalesced():
+    """Many simultaneous requests for one cell cause a single upstream fetch."""
+    cache = ForecastCache()
+    calls = []
+    release = threading.Event()
+    
+    def fetcher(lat, lon):
+        calls.append(1)
+        release.wait(2)
+        return "payload"
+    
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch(23.81, 90.41, fetcher)[0]))
+        for _ in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    
+    assert len(calls) == 1
+    assert results == ["payload"] * 20
+    assert cache.stats()["coalesced"] == 19
+
+
+def test_batch_fetch_requests_only_missing_cells_once():
+    """get_or_fetch_many serves cached cells and fetches all missing cells in one call."""
+    cache = ForecastCache(cell_degrees=0.1)
+    batches = []
+    
+    def batch_fetcher(cells):
+        batches.append(cells)
+        return [f"forecast-{lat}" for lat, _ in cells]
+    
+    cache.get_or_fetch(23.81, 90.41, lambda lat, lon: "cached")
+    results = cache.get_or_fetch_many([(23.81, 90.41), (24.85, 89.38), (25.74, 89.28), (24.86, 89.37)], batch_fetcher)
+    
+    assert [status for _, status in results] == ["fresh", "miss", "miss", "miss"]
+    assert results[0][0] == "cached"
+    # Both Bogra points fall in one cell, so two cells are fetched in a single batch
+    assert len(batches) == 1 and len(batches[0]) == 2
+    assert results[1][0] == results[3][0]
+
+
+def test_prefetcher_fetches_stale_cells_in_rate_limited_batches():
+    """A cycle fetches only cells that aren't fresh, batch_size locations per request."""
+    from adk_app.core.weather_prefetch import WeatherPrefetcher
+    
+    cache = ForecastCache(cell_degrees=0.1)
+    cache.get_or_fetch(23.81, 90.41, lambda lat, lon: "cached")
+    batches = []
+    points = [(23.81, 90.41), (24.85, 89.38), (25.74, 89.28), (24.37, 88.60), (22.36, 91.78)]
+    prefetcher = WeatherPrefetcher(
+        cache,
+        lambda cells: batches.append(cells) or ["forecast"] * len(cells),
+        lambda: points,
+        batch_size=2,
+        min_request_interval=0
+    )
+    
+    cycle = prefetcher.prefetch_once()
+    
+    assert cycle["cells_fetched"] == 4
+    assert [len(batch) for batch in batches] == [1, 2, 1]
+    assert prefetcher.prefetch_once()["cells_fetched"] == 0
+    assert cache.get_or_fetch(22.36, 91.78, lambda lat, lon: "unused") == ("forecast", "fresh")
+
+
+def test_prefetcher_warms_extra_variants():
+    """Every configured payload variant is kept warm, each with its own fetcher."""
+    from adk_app.core.weather_prefetch import WeatherPrefetcher
+    
+    cache = ForecastCache(cell_degrees=0.1)
+    prefetcher = WeatherPrefetcher(
+        cache,
+        lambda cells: ["current"] * len(cells),
+        lambda: [(23.81, 90.41), (24.85, 89.38)],
+        min_request_interval=0,
+        variants={"forecast": lambda cells: ["daily"] * len(cells)}
+    )
+    
+    assert prefetcher.prefetch_once()["cells_fetched"] == 4
+    assert cache.get_or_fetch(24.85, 89.38, lambda lat, lon: "unused", variant="forecast") == ("daily", "fresh")
@@ -0,0 +1,102 @@
+"""Tests for date-range targeted weather requests."""
+from datetime import datetime, timedelta
+import pytest
+from adk_app.core.weather_cache import ForecastCache
+from adk_app.tools import weather_tools
+
+
+class FakeHttpClient:
+    """Returns one daily row per requested day and records every request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_json(self, url, params=None, timeout=None, priority=None, cost=1.0):
+        self.requests.append((url, params))
+        if "current" in params:
+            forecast = {"current": {"temperature_2m": 30.0, "weather_code": 0}}
+            if "forecast_days" in params:
+                today = datetime.now().date()
+                forecast["daily"] = self._daily(
+                    [(today + timedelta(days=offset)).isoformat() for offset in range(params["forecast_days"])]
+                )
+            points = str(params["latitude"]).count(",") + 1
+            return forecast if points == 1 else [forecast] * points
+        start = datetime.strptime(params["start_date"], "%Y-%m-%d")
+        end = datetime.strptime(params["end_date"], "%Y-%m-%d")
+        days = [(start + timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range((end - start).days + 1)]
+        return {"daily": self._daily(days)}
+    
+    @staticmethod
+    def _daily(days):
+        return {
+            "time": days,
+            "temperature_2m_max": [33.0] * len(days),
+            "temperature_2m_min": [25.0] * len(days),
+            "precipitation_sum": [1.5] * len(days),
+            "weather_code": [61] * len(days),
+        }
+
+
+@pytest.fixture
+def http(monkeypatch):
+    client = FakeHttpClient()
+    monkeypatch.setattr(weather_tools, "get_http_client", lambda: client)
+    cache = ForecastCache()
+    monkeypatch.setattr(weather_tools, "get_forecast_cache", lambda: cache)
+    return client
+
+
+def _day(offset):
+    return (datetime.now().date() + timedelta(days=offset)).isoformat()
+
+
+def test_old_dates_use_archive_and_recent_dates_the_forecast_api(http):
+    """A range across the past-days limit is split; only daily report variables are requested."""
+    result = weather_tools.get_weather_report("Bogra", _day(-95), _day(-90))
+    
+    assert [url for url, _ in http.requests] == [weather_tools.ARCHIVE_URL, weather_tools.FORECAST_URL]
+    assert [(params["start_date"], params["end_date"]) for _, params in http.requests] == [
+        (_day(-95), _day(-93)), (_day(-92), _day(-90))
+    ]
+    assert all(params["daily"] == weather_tools.DAILY_REPORT_VARIABLES for _, params in http.requests)
+    assert [day["date"] for day in result["daily"]] == [_day(offset) for offset in range(-95, -89)]
+    assert "current_weather" not in result
+
+
+def test_range_is_clipped_to_forecast_horizon(http):
+    """Days past the 16-day horizon are dropped with a note; today adds current conditions."""
+    result = weather_tools.get_weather_report("Bogra", _day(0), _day(20))
+    
+    assert result["period"] == {"start": _day(0), "end": _day(15)}
+    assert len(result["daily"]) == 16
+    assert "forecast_note" in result
+    assert result["current_weather"]["temperature"] == "30.0°C"
+
+
+def test_future_dates_come_from_the_cached_forecast(http):
+    """Ranges inside the horizon share the one forecast payload the prefetcher warms."""
+    weather_tools.get_weather_report("Bogra", _day(2), _day(4))
+    result = weather_tools.get_weather_report("Bogra", _day(5))
+    
+    assert len(http.requests) == 1
+    assert http.requests[0][1]["forecast_days"] == weather_tools.FORECAST_HORIZON_DAYS
+    assert [day["date"] for day in result["daily"]] == [_day(5)]
+
+
+def test_current_conditions_skip_the_daily_forecast(http):
+    """Multi-location current conditions don't request any daily series."""
+    result = weather_tools.get_weather_for_locations(["Bogra", "Dhaka"])
+    
+    assert result["count"] == 2
+    assert all("daily" not in params for _, params in http.requests)
+
+
+def test_locations_note_states_the_actual_horizon(http):
+    """A date past the forecast gets a note naming the last forecast day."""
+    result = weather_tools.get_weather_for_locations(["Bogra"], _day(20))
+    
+    assert http.requests[0][1]["forecast_days"] == weather_tools.FORECAST_HORIZON_DAYS
+    assert result["reports"][0]["forecast_note"] == (
+        f"Forecast for {_day(20)} is not available (forecasts reach {_day(15)}, 16 days ahead)"
+    )
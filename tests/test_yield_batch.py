@@ -0,0 +1,90 @@
+"""Tests for the batch yield forecast lookup."""
+from adk_app.core.columnar import ColumnarResult
+from adk_app.core.forecast_catalog import get_catalog_store
+from adk_app.tools import snowflake_yield_tools
+from tests.test_forecast_replica import make_snapshot
+
+
+class DisabledReplica:
+    def snapshot(self):
+        return None
+
+
+def drive(plan, respond):
+    """Run a query plan, answering each request with respond(query, params)."""
+    requests = []
+    try:
+        request = next(plan)
+        while True:
+            requests.append(request)
+            request = plan.send(respond(*request[:2]))
+    except StopIteration as stop:
+        return stop.value, requests
+
+
+def test_batch_cross_product_uses_one_query(monkeypatch):
+    """Catalog + one forecast query answer every key; results come back per key."""
+    monkeypatch.setattr(snowflake_yield_tools, "get_forecast_replica", lambda: DisabledReplica())
+    get_catalog_store().invalidate()
+    table = make_snapshot().table
+    
+    def respond(query, params):
+        if "GROUPING SETS" in query:
+            return ColumnarResult({
+                "crop_type": ["High Yielding Variety (HYV) Aman", "HYV Boro", None, None, None, None],
+                "district_name": [None, None, "Bogra", "Dhaka", None, None],
+                "forecast_year": [None, None, None, None, 2025, None],
+                "forecast_count": [3, 1, 2, 3, 4, 5],
+                "grouped_crop_type": [0, 0, 1, 1, 1, 1],
+                "grouped_district_name": [1, 1, 0, 0, 1, 1],
+                "grouped_forecast_year": [1, 1, 1, 1, 0, 1],
+            })
+        return table
+    
+    plan = snowflake_yield_tools._yield_forecasts_batch_plan(
+        yield_varieties=["HYV aman"], districts=["Dhaka", "Bogura"], forecast_years=[2025, 2026]
+    )
+    response, requests = drive(plan, respond)
+    get_catalog_store().invalidate()
+    
+    assert len(requests) == 2
+    query, params, _ = requests[1]
+    assert "CROP_TYPE IN" in query and "DISTRICT_NAME IN" in query
+    assert params["district_0"] == "Bogra"
+    
+    assert response["status"] == "success"
+    assert response["count"] == 4
+    assert response["name_resolution"] == {"HYV aman": "High Yielding Variety (HYV) Aman", "Bogura": "Bogra"}
+    by_key = {(r["district"], r["forecast_year"]): r for r in response["results"]}
+    assert by_key[("Dhaka", 2025)]["forecasts"][0]["id"] == 2
+    assert by_key[("Bogra", 2026)]["forecasts"][0]["id"] == 4
+    assert by_key[("Bogra", 2025)]["count"] == 0
+
+
+def test_batch_rejects_incomplete_lookups():
+    """Lookups missing a field are reported without querying."""
+    plan = snowflake_yield_tools._yield_forecasts_batch_plan(lookups=[{"district": "Dhaka"}])
+    
+    response, requests = drive(plan, lambda query, params: None)
+    
+    assert requests == []
+    assert response["status"] == "error"
+
+
+def test_connection_test_bypasses_the_result_cache(monkeypatch):
+    """Both connection test queries reach Snowflake instead of the result cache."""
+    class FakeManager:
+        def __init__(self):
+            self.use_cache = []
+        
+        def execute_query(self, query, params=None, fetch_all=True, result_format="rows", use_cache=True):
+            self.use_cache.append(use_cache)
+            return [{"VERSION": "9.0.0", "RECORD_COUNT": 5}]
+    
+    manager = FakeManager()
+    monkeypatch.setattr(snowflake_yield_tools, "get_snowflake_manager", lambda: manager)
+    
+    response = snowflake_yield_tools.test_database_connection()
+    
+    assert response["record_count"] == 5
+    assert manager.use_cache == [False, False]
@@ -0,0 +1,40 @@
+"""Tests for the slot-filling yield forecast fast path."""
+import asyncio
+from adk_app.core.forecast_catalog import ForecastCatalog
+from adk_app.core.yield_fast_path import YieldFastPath, format_yield_forecast, parse_yield_slots
+from tests.test_forecast_replica import make_snapshot
+
+
+def test_slots_are_filled_only_when_unambiguous():
+    """Variety, district and year come from the catalog; several candidates leave the slot empty."""
+    catalog = ForecastCatalog.from_snapshot(make_snapshot())
+    
+    slots = parse_yield_slots("Get yield forecast for HYV Aman in Bogura district for year 2026", catalog)
+    assert slots.to_dict() == {
+        "yield_variety": "High Yielding Variety (HYV) Aman", "district": "Bogra", "forecast_year": 2026
+    }
+    assert not slots.missing
+    
+    slots = parse_yield_slots("Yield prediction for Aman rice in Dhaka or Bogra for 2024", catalog)
+    assert slots.missing == ["yield_variety", "district", "forecast_year"]
+    assert parse_yield_slots("L.T Aman in Bogra for 2025", catalog).yield_variety == "Local Transplanted (L.T) Aman"
+
+
+def test_response_follows_the_standard_format():
+    """Answers use the RESPONSE_FORMAT.md template; open-ended questions fall back to the agent."""
+    answer = format_yield_forecast({
+        "crop_type": "High Yielding Variety (HYV) Aman", "district_name": "Dhaka", "forecast_year": 2025,
+        "predicted_yield": 2.5, "confidence_lower": 2.45, "confidence_upper": 2.551,
+    })
+    
+    assert answer == (
+        "Here is the yield forecast for High Yielding Variety (HYV) Aman rice in Dhaka for 2025:\n\n"
+        "* From our standard best practice:\n"
+        "  - Predicted Yield: Will be implemented later\n\n"
+        "* From our historical analysis:\n"
+        "  - Predicted Yield: 2.50 tons per hectare\n"
+        "  - Confidence Interval: 2.45 to 2.55 tons per hectare"
+    )
+    fast_path = YieldFastPath()
+    assert asyncio.run(fast_path.answer("Why is the HYV Aman yield in Dhaka lower in 2025?")) is None
+    assert fast_path.stats()["fallbacks"] == {"open-ended question": 1}